@@ -5,14 +5,91 @@ import os
 import json
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import base64
-from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from functools import cached_property, lru_cache
 
 logger = logging.getLogger(__name__)
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Leading byte of MessagePack payloads; JSON payloads always start with "{"
+_MSGPACK_TAG = b"\x01"
+
+
+def _create_cipher(key: bytes):
+    """
+    Create the Fernet cipher used to encrypt credential files.
+    
+    Prefers the Rust-native rfernet implementation when it is installed and
+    falls back to cryptography's Fernet otherwise. Both produce standard Fernet
+    tokens, so existing .cred files stay readable whichever backend is used.
+    
+    Args:
+        key: URL-safe base64-encoded 32-byte Fernet key
+        
+    Returns:
+        Cipher object exposing encrypt() and decrypt()
+    """
+    try:
+        import rfernet
+    except ImportError:
+        from cryptography.fernet import Fernet
+        return Fernet(key)
+    return rfernet.Fernet(key.decode())
+
+def _serialize_credentials(credentials: Dict[str, str]) -> bytes:
+    """
+    Serialize credentials for encryption.
+    
+    Uses MessagePack behind a version tag when it is installed and JSON
+    otherwise.
+    
+    Args:
+        credentials: Dictionary of credentials
+        
+    Returns:
+        Serialized credentials
+    """
+    if msgpack is not None:
+        return _MSGPACK_TAG + msgpack.packb(credentials)
+    return json.dumps(credentials).encode()
+
+def _deserialize_credentials(data: bytes) -> Dict[str, str]:
+    """
+    Deserialize decrypted credentials written by _serialize_credentials.
+    
+    Args:
+        data: Decrypted credential payload
+        
+    Returns:
+        Dictionary of credentials
+    """
+    if data[:1] == _MSGPACK_TAG:
+        if msgpack is None:
+            raise ValueError("Credentials were stored with MessagePack, which is not installed")
+        return msgpack.unpackb(data[1:], raw=False)
+    return json.loads(data.decode())
+
+def _open_private(path: Path):
+    """
+    Open a file for binary writing, creating it readable by the owner only.
+    
+    The mode is applied when the file is created, so it never exists with
+    umask-derived permissions.
+    
+    Args:
+        path: Path of the file to write
+        
+    Returns:
+        Binary file object opened for writing
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    return os.fdopen(fd, "wb")
+
 class CredentialManager:
     """
     Manages secure storage and retrieval of credentials for hosting providers.
@@ -23,30 +100,34 @@ class CredentialManager:
         self.credentials_dir = Path.home() / ".arc" / "credentials"
         os.makedirs(self.credentials_dir, exist_ok=True)
         
+        # Decrypted credentials keyed by provider, tagged with the mtime of
+        # the .cred file they were read from
+        self._cache: Dict[str, Tuple[int, Dict[str, str]]] = {}
+        
         # Create or load encryption key
         key_path = self.credentials_dir / ".key"
         if key_path.exists():
             with open(key_path, "rb") as f:
                 self.key = f.read()
         else:
-            # Generate a new key
-            salt = os.urandom(16)
-            kdf = PBKDF2HMAC(
-                algorithm=hashes.SHA256(),
-                length=32,
-                salt=salt,
-                iterations=100000,
-            )
-            self.key = base64.urlsafe_b64encode(kdf.derive(os.urandom(32)))
-            with open(key_path, "wb") as f:
+            # Generate a new random key (no password is involved, so there
+            # is nothing for a KDF to stretch)
+            self.key = base64.urlsafe_b64encode(os.urandom(32))
+            with _open_private(key_path) as f:
                 f.write(self.key)
-            
-            # Secure the key file
-            os.chmod(key_path, 0o600)
         
-        self.cipher = Fernet(self.key)
         logger.debug("Credential manager initialized")
     
+    @cached_property
+    def cipher(self):
+        """
+        Cipher used to encrypt and decrypt credential files.
+        
+        Built on first use so that the cryptography backend is only imported
+        when credentials are actually read or written.
+        """
+        return _create_cipher(self.key)
+    
     def store_credentials(self, provider_name: str, credentials: Dict[str, str]) -> bool:
         """
         Store credentials for a hosting provider.
@@ -60,17 +141,14 @@ class CredentialManager:
         """
         try:
             # Encrypt credentials
-            credentials_json = json.dumps(credentials)
-            encrypted_credentials = self.cipher.encrypt(credentials_json.encode())
+            encrypted_credentials = self.cipher.encrypt(_serialize_credentials(credentials))
             
             # Store to file
             cred_file = self.credentials_dir / f"{provider_name}.cred"
-            with open(cred_file, "wb") as f:
+            self._cache.pop(provider_name, None)
+            with _open_private(cred_file) as f:
                 f.write(encrypted_credentials)
             
-            # Secure the file
-            os.chmod(cred_file, 0o600)
-            
             logger.info(f"Credentials stored for provider: {provider_name}")
             return True
         except Exception as e:
@@ -88,20 +166,29 @@ class CredentialManager:
             Dictionary of credentials if found, None otherwise
         """
         cred_file = self.credentials_dir / f"{provider_name}.cred"
-        if not cred_file.exists():
+        try:
+            mtime_ns = os.stat(cred_file).st_mtime_ns
+        except FileNotFoundError:
+            self._cache.pop(provider_name, None)
             logger.warning(f"No credentials found for provider: {provider_name}")
             return None
         
+        # Serve from cache while the file is unchanged on disk
+        cached = self._cache.get(provider_name)
+        if cached and cached[0] == mtime_ns:
+            return dict(cached[1])
+        
         try:
             # Read and decrypt credentials
             with open(cred_file, "rb") as f:
                 encrypted_credentials = f.read()
             
             decrypted_data = self.cipher.decrypt(encrypted_credentials)
-            credentials = json.loads(decrypted_data.decode())
+            credentials = _deserialize_credentials(decrypted_data)
+            self._cache[provider_name] = (mtime_ns, credentials)
             
             logger.debug(f"Retrieved credentials for provider: {provider_name}")
-            return credentials
+            return dict(credentials)
         except Exception as e:
             logger.error(f"Failed to retrieve credentials: {str(e)}")
             return None
@@ -121,6 +208,7 @@ class CredentialManager:
             logger.warning(f"No credentials found for provider: {provider_name}")
             return False
         
+        self._cache.pop(provider_name, None)
         try:
             os.remove(cred_file)
             logger.info(f"Credentials deleted for provider: {provider_name}")
@@ -128,3 +216,16 @@ class CredentialManager:
         except Exception as e:
             logger.error(f"Failed to delete credentials: {str(e)}")
             return False
+
+
+@lru_cache(maxsize=1)
+def get_credential_manager() -> CredentialManager:
+    """
+    Get the shared credential manager.
+    
+    The key file is read and the cipher built only once per process.
+    
+    Returns:
+        Process-wide CredentialManager instance
+    """
+    return CredentialManager()
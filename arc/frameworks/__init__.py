@@ -1,6 +1,8 @@
 """
 Framework handlers for Arc MCP Server.
 """
+import importlib
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 
 class FrameworkHandler:
@@ -63,27 +65,57 @@ class FrameworkHandler:
         """
         raise NotImplementedError("Framework handlers must implement troubleshoot")
 
-# Framework registry
-_framework_registry = {}
+# Framework registry, mapping names to handler classes or to
+# "module:Class" placeholders that are imported on first use
+_framework_registry: Dict[str, Any] = {}
+_framework_metadata: Dict[str, Dict[str, str]] = {}
 
 def register_framework(framework_class):
     """Register a framework handler."""
     _framework_registry[framework_class.name] = framework_class
+    _framework_metadata[framework_class.name] = {
+        "name": framework_class.name,
+        "display_name": framework_class.display_name,
+        "description": framework_class.description
+    }
+    get_framework_handler.cache_clear()
     return framework_class
 
+def register_lazy_framework(name: str, target: str, display_name: str, description: str):
+    """Register a framework handler by import path without importing it."""
+    _framework_registry.setdefault(name, target)
+    _framework_metadata.setdefault(name, {
+        "name": name,
+        "display_name": display_name,
+        "description": description
+    })
+    get_framework_handler.cache_clear()
+
+@lru_cache(maxsize=None)
+def _load_handler_class(target: str):
+    """Import the handler class named by a "module:Class" placeholder."""
+    module_name, _, class_name = target.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+@lru_cache(maxsize=None)
 def get_framework_handler(framework_name: str) -> Optional[FrameworkHandler]:
-    """Get a framework handler by name."""
+    """Get a framework handler by name (handlers only cache state and are shared)."""
     if framework_name not in _framework_registry:
         return None
-    return _framework_registry[framework_name]()
+    framework_class = _framework_registry[framework_name]
+    if isinstance(framework_class, str):
+        framework_class = _load_handler_class(framework_class)
+        _framework_registry[framework_name] = framework_class
+    return framework_class()
 
 def list_frameworks() -> List[Dict[str, str]]:
     """List all registered frameworks."""
-    return [
-        {
-            "name": cls.name,
-            "display_name": cls.display_name,
-            "description": cls.description
-        }
-        for cls in _framework_registry.values()
-    ]
+    return [dict(metadata) for metadata in _framework_metadata.values()]
+
+# Built-in frameworks, imported only when a handler is requested
+register_lazy_framework(
+    "wasp",
+    "arc.frameworks.wasp:WaspFrameworkHandler",
+    display_name="Wasp",
+    description="Wasp - The fastest way to develop full-stack web apps with React & Node.js"
+)
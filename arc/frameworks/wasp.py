@@ -4,19 +4,52 @@ Wasp framework handler for Arc MCP Server.
 import os
 import json
 import logging
+import mmap
 import subprocess
 import shutil
 import tempfile
 import re
-import stat
-from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+import shlex
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Set, Tuple
 
 from arc.frameworks import register_framework, FrameworkHandler
-from arc.providers import get_provider_handler
 
 logger = logging.getLogger(__name__)
 
+# Use orjson for package.json parsing when it is installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Patterns used to parse .wasp files and build logs
+_APP_RE = re.compile(r'app\s+(\w+)\s*\{')
+_TITLE_RE = re.compile(r'title\s*:\s*"([^"]+)"')
+_RESOLVE_RE = re.compile(r"Can't resolve '([^']+)'")
+_DB_RE = re.compile(r'\bdb\s*:?\s*(postgresql|sqlite)\b', re.IGNORECASE)
+
+
+@lru_cache(maxsize=32)
+def _read_wasp_content(wasp_file: str, mtime_ns: int) -> str:
+    """
+    Read a .wasp file, memoized per modification time.
+    
+    Args:
+        wasp_file: Path to the .wasp file
+        mtime_ns: Modification time of the file, part of the cache key so
+            edits are picked up on the next read
+        
+    Returns:
+        Content of the .wasp file
+    """
+    with open(wasp_file, 'r') as f:
+        return f.read()
+
+
 @register_framework
 class WaspFrameworkHandler(FrameworkHandler):
     """
@@ -45,6 +78,17 @@ class WaspFrameworkHandler(FrameworkHandler):
         "JWT_SECRET"
     ]
     
+    # Client source file extensions scanned during troubleshooting
+    CLIENT_SOURCE_EXTENSIONS = (".jsx", ".tsx", ".js", ".ts")
+    
+    # Larger client sources are assumed to be bundles and are not scanned
+    MAX_SCAN_FILE_SIZE = 256 * 1024
+    SCAN_WORKERS = min(8, os.cpu_count() or 1)
+    
+    # Amount of build output kept in memory for error reporting; the full
+    # log is streamed to a temporary file instead
+    BUILD_LOG_TAIL_SIZE = 64 * 1024
+    
     # Common troubleshooting issues and solutions
     COMMON_ISSUES = {
         "node_version": {
@@ -61,6 +105,30 @@ class WaspFrameworkHandler(FrameworkHandler):
         }
     }
     
+    # Other log messages with dedicated handling in _analyze_error_log
+    LOG_SIGNATURES = {
+        "missing_module": "Module not found: Error: Can't resolve",
+        "database_connection": "Failed to connect to database",
+        "cors": "CORS"
+    }
+    
+    # Every known log pattern as one alternation, so a log is scanned once
+    ERROR_LOG_RE = re.compile("|".join(
+        f"(?P<{key}>{re.escape(pattern)})"
+        for key, pattern in [
+            *((issue_key, issue_info["pattern"]) for issue_key, issue_info in COMMON_ISSUES.items()),
+            *LOG_SIGNATURES.items()
+        ]
+    ))
+    
+    def __init__(self):
+        """Initialize the Wasp framework handler."""
+        # .wasp file lookups keyed by project path, tagged with the directory mtime
+        self._wasp_file_cache: Dict[str, Tuple[int, Optional[str]]] = {}
+        # Static provider data keyed by provider name
+        self._provider_caps: Dict[str, Dict[str, bool]] = {}
+        self._provider_troubleshooting: Dict[str, Dict[str, List[str]]] = {}
+    
     def analyze_requirements(self, project_path: str, provider_name: str) -> Dict[str, Any]:
         """
         Analyze Wasp project requirements for deployment.
@@ -84,8 +152,7 @@ class WaspFrameworkHandler(FrameworkHandler):
         
         # Read the .wasp file to extract information
         try:
-            with open(wasp_file, 'r') as f:
-                wasp_content = f.read()
+            wasp_content = self._load_wasp(wasp_file)
         except Exception as e:
             logger.error(f"Failed to read .wasp file: {str(e)}")
             return {
@@ -95,7 +162,7 @@ class WaspFrameworkHandler(FrameworkHandler):
         
         # Parse basic information from the .wasp file
         app_name = self._extract_app_name(wasp_content)
-        uses_database = "db postgresql" in wasp_content.lower() or "db sqlite" in wasp_content.lower()
+        uses_database = _DB_RE.search(wasp_content) is not None
         
         # Check for package.json to identify dependencies
         dependencies = {}
@@ -104,23 +171,22 @@ class WaspFrameworkHandler(FrameworkHandler):
         
         if os.path.exists(client_package_path):
             try:
-                with open(client_package_path, 'r') as f:
-                    client_pkg = json.load(f)
+                with open(client_package_path, 'rb') as f:
+                    client_pkg = _json_loads(f.read())
                 dependencies["client"] = client_pkg.get("dependencies", {})
             except Exception as e:
                 logger.warning(f"Failed to read client package.json: {str(e)}")
         
         if os.path.exists(server_package_path):
             try:
-                with open(server_package_path, 'r') as f:
-                    server_pkg = json.load(f)
+                with open(server_package_path, 'rb') as f:
+                    server_pkg = _json_loads(f.read())
                 dependencies["server"] = server_pkg.get("dependencies", {})
             except Exception as e:
                 logger.warning(f"Failed to read server package.json: {str(e)}")
         
         # Check if the provider supports the required features
-        provider = get_provider_handler(provider_name)
-        provider_capabilities = provider.get_capabilities() if hasattr(provider, "get_capabilities") else {}
+        provider_capabilities = self._get_provider_capabilities(provider_name)
         
         compatibility_issues = []
         if uses_database and not provider_capabilities.get("database_support", False):
@@ -202,7 +268,10 @@ class WaspFrameworkHandler(FrameworkHandler):
                 "error": "Not a valid Wasp project. No .wasp file found."
             }
         
-        # Create a temporary directory for build output
+        # Read the app name now; the .wasp content is cached from analysis
+        app_name = self._extract_app_name_from_file(wasp_file) or "wasp-app"
+        
+        # Create a temporary directory for the build output
         with tempfile.TemporaryDirectory() as temp_dir:
             # Build the project
             build_result = self._build_project(project_path, temp_dir, config)
@@ -213,6 +282,7 @@ class WaspFrameworkHandler(FrameworkHandler):
             output_dir = build_result["output_dir"]
             
             # Get the provider handler
+            from arc.providers import get_provider_handler
             provider = get_provider_handler(provider_name)
             if not provider:
                 return {
@@ -234,7 +304,6 @@ class WaspFrameworkHandler(FrameworkHandler):
             # Add additional information to the result
             if deploy_result["success"]:
                 deploy_result["framework"] = self.name
-                app_name = self._extract_app_name_from_file(wasp_file) or "wasp-app"
                 deploy_result["app_name"] = app_name
             
             return deploy_result
@@ -282,13 +351,11 @@ class WaspFrameworkHandler(FrameworkHandler):
             recommendations.extend(log_issues["recommendations"])
         
         # Get provider-specific troubleshooting
-        provider = get_provider_handler(provider_name)
-        if provider and hasattr(provider, "get_troubleshooting_info"):
-            provider_info = provider.get_troubleshooting_info("wasp")
-            if provider_info.get("issues"):
-                issues.extend(provider_info["issues"])
-            if provider_info.get("recommendations"):
-                recommendations.extend(provider_info["recommendations"])
+        provider_info = self._get_provider_troubleshooting_info(provider_name)
+        if provider_info.get("issues"):
+            issues.extend(provider_info["issues"])
+        if provider_info.get("recommendations"):
+            recommendations.extend(provider_info["recommendations"])
         
         # If no issues found, provide some general guidance
         if not issues:
@@ -309,6 +376,43 @@ class WaspFrameworkHandler(FrameworkHandler):
         }
     
     # Helper methods
+    def _get_provider_capabilities(self, provider_name: str) -> Dict[str, bool]:
+        """
+        Get the capabilities of a provider, cached per provider name.
+        
+        Args:
+            provider_name: Name of the hosting provider
+            
+        Returns:
+            Dictionary of capability names to boolean values
+        """
+        if provider_name not in self._provider_caps:
+            from arc.providers import get_provider_handler
+            provider = get_provider_handler(provider_name)
+            self._provider_caps[provider_name] = (
+                provider.get_capabilities() if hasattr(provider, "get_capabilities") else {}
+            )
+        return self._provider_caps[provider_name]
+    
+    def _get_provider_troubleshooting_info(self, provider_name: str) -> Dict[str, List[str]]:
+        """
+        Get Wasp troubleshooting information from a provider, cached per provider name.
+        
+        Args:
+            provider_name: Name of the hosting provider
+            
+        Returns:
+            Dictionary with issues and recommendations
+        """
+        if provider_name not in self._provider_troubleshooting:
+            from arc.providers import get_provider_handler
+            provider = get_provider_handler(provider_name)
+            self._provider_troubleshooting[provider_name] = (
+                provider.get_troubleshooting_info("wasp")
+                if provider and hasattr(provider, "get_troubleshooting_info") else {}
+            )
+        return self._provider_troubleshooting[provider_name]
+    
     def _find_wasp_file(self, project_path: str) -> Optional[str]:
         """
         Find the .wasp file in the project directory.
@@ -319,10 +423,37 @@ class WaspFrameworkHandler(FrameworkHandler):
         Returns:
             Path to the .wasp file if found, None otherwise
         """
-        for file in os.listdir(project_path):
-            if file.endswith(".wasp"):
-                return os.path.join(project_path, file)
-        return None
+        # Reuse the previous lookup while the directory listing is unchanged
+        dir_mtime = os.stat(project_path).st_mtime_ns
+        cached = self._wasp_file_cache.get(project_path)
+        if cached and cached[0] == dir_mtime:
+            return cached[1]
+        
+        wasp_file = None
+        with os.scandir(project_path) as entries:
+            for entry in entries:
+                # Skip the .wasp build directory, which shares the suffix
+                if entry.name.endswith(".wasp") and entry.is_file():
+                    wasp_file = os.path.join(project_path, entry.name)
+                    break
+        
+        self._wasp_file_cache[project_path] = (dir_mtime, wasp_file)
+        return wasp_file
+    
+    def _load_wasp(self, wasp_file: str) -> str:
+        """
+        Load the content of a .wasp file.
+        
+        Reads are cached on the file's modification time, so the analyze,
+        deploy and troubleshoot steps of one deployment share a single read.
+        
+        Args:
+            wasp_file: Path to the .wasp file
+            
+        Returns:
+            Content of the .wasp file
+        """
+        return _read_wasp_content(wasp_file, os.stat(wasp_file).st_mtime_ns)
     
     def _extract_app_name(self, wasp_content: str) -> Optional[str]:
         """
@@ -335,12 +466,12 @@ class WaspFrameworkHandler(FrameworkHandler):
             App name if found, None otherwise
         """
         # Look for app declaration
-        app_match = re.search(r'app\s+(\w+)\s*{', wasp_content)
+        app_match = _APP_RE.search(wasp_content)
         if app_match:
             return app_match.group(1)
         
         # Look for title declaration
-        title_match = re.search(r'title\s*:\s*"([^"]+)"', wasp_content)
+        title_match = _TITLE_RE.search(wasp_content)
         if title_match:
             return title_match.group(1)
         
@@ -357,9 +488,7 @@ class WaspFrameworkHandler(FrameworkHandler):
             App name if found, None otherwise
         """
         try:
-            with open(wasp_file, 'r') as f:
-                wasp_content = f.read()
-            return self._extract_app_name(wasp_content)
+            return self._extract_app_name(self._load_wasp(wasp_file))
         except Exception as e:
             logger.error(f"Failed to read .wasp file: {str(e)}")
             return None
@@ -381,41 +510,54 @@ class WaspFrameworkHandler(FrameworkHandler):
         # Determine the build command
         build_cmd = config.get("build_command", self.BUILD_CMD)
         
-        # Set up environment variables for the build
-        env = os.environ.copy()
-        env_vars = config.get("env", {})
-        for key, value in env_vars.items():
-            env[key] = value
+        # Set up environment variables for the build; without overrides the
+        # process simply inherits ours
+        env_vars = config.get("env")
+        env = {**os.environ, **env_vars} if env_vars else None
         
         # Set up the output directory
         output_dir_name = config.get("output_dir", self.DEFAULT_OUTPUT_DIR)
         output_dir = os.path.join(project_path, output_dir_name)
         
+        # Run the build without a shell; in quiet mode only stderr is kept
+        build_args = shlex.split(build_cmd) if isinstance(build_cmd, str) else list(build_cmd)
+        quiet = config.get("quiet", False)
+        
         try:
             # Run the build command
             process = subprocess.Popen(
-                build_cmd,
-                shell=True,
+                build_args,
                 cwd=project_path,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                stdout=subprocess.DEVNULL if quiet else subprocess.PIPE,
+                stderr=subprocess.PIPE if quiet else subprocess.STDOUT,
                 env=env,
                 text=True
             )
-            stdout, stderr = process.communicate()
+            try:
+                log_path, output_tail = self._stream_build_output(
+                    process.stderr if quiet else process.stdout
+                )
+                returncode = process.wait()
+            finally:
+                # Don't leave the build running if reading its output failed
+                if process.returncode is None:
+                    process.kill()
+                    process.wait()
             
-            if process.returncode != 0:
-                logger.error(f"Build failed: {stderr}")
+            if returncode != 0:
+                logger.error(f"Build failed, full log at {log_path}: {output_tail}")
                 return {
                     "success": False,
-                    "error": f"Build failed with exit code {process.returncode}",
-                    "details": stderr
+                    "error": f"Build failed with exit code {returncode}",
+                    "details": output_tail,
+                    "log_file": log_path
                 }
+            os.remove(log_path)
             
             # Copy the build output to the temporary directory
             if os.path.exists(output_dir):
                 dest_dir = os.path.join(temp_dir, "build")
-                shutil.copytree(output_dir, dest_dir)
+                self._copy_build_output(output_dir, dest_dir)
                 logger.info(f"Build output copied to {dest_dir}")
                 return {
                     "success": True,
@@ -436,6 +578,57 @@ class WaspFrameworkHandler(FrameworkHandler):
                 "error": f"Build process error: {str(e)}"
             }
     
+    def _copy_build_output(self, output_dir: str, dest_dir: str) -> None:
+        """
+        Copy the build output into the deployment directory.
+        
+        Hardlinks the files when both paths are on the same filesystem and
+        falls back to a full copy. The project's build output is left intact.
+        
+        Args:
+            output_dir: Build output directory inside the project
+            dest_dir: Destination directory for the deployment
+        """
+        try:
+            shutil.copytree(output_dir, dest_dir, copy_function=os.link)
+            return
+        except OSError:
+            # Clear any partially linked tree before copying
+            shutil.rmtree(dest_dir, ignore_errors=True)
+        
+        shutil.copytree(output_dir, dest_dir)
+    
+    def _stream_build_output(self, stream) -> Tuple[str, str]:
+        """
+        Stream build output to a temporary log file.
+        
+        Only the last BUILD_LOG_TAIL_SIZE characters are held in memory so
+        that large builds do not buffer their whole log.
+        
+        Args:
+            stream: Text stream of the running build process
+            
+        Returns:
+            Tuple of the log file path and the tail of the output
+        """
+        tail = deque()
+        tail_size = 0
+        log_file = tempfile.NamedTemporaryFile(
+            "w", prefix="wasp-build-", suffix=".log", delete=False
+        )
+        try:
+            with log_file:
+                for line in stream:
+                    log_file.write(line)
+                    tail.append(line)
+                    tail_size += len(line)
+                    while tail_size > self.BUILD_LOG_TAIL_SIZE and len(tail) > 1:
+                        tail_size -= len(tail.popleft())
+        except BaseException:
+            os.remove(log_file.name)
+            raise
+        return log_file.name, "".join(tail)
+    
     def _check_project_issues(self, project_path: str) -> Dict[str, List[str]]:
         """
         Check for common issues in the Wasp project.
@@ -478,25 +671,106 @@ class WaspFrameworkHandler(FrameworkHandler):
         # Check for common React errors in client code
         client_src_dir = os.path.join(project_path, "client/src")
         if os.path.exists(client_src_dir):
-            for root, _, files in os.walk(client_src_dir):
-                for file in files:
-                    if file.endswith((".jsx", ".tsx", ".js", ".ts")):
-                        file_path = os.path.join(root, file)
-                        try:
-                            with open(file_path, 'r') as f:
-                                content = f.read()
-                                # Check for missing imports
-                                if "import React" not in content and ("useState" in content or "useEffect" in content):
-                                    issues.append(f"Possible missing React import in {os.path.relpath(file_path, project_path)}")
-                                    recommendations.append(f"Add 'import React from \"react\"' to {os.path.relpath(file_path, project_path)}")
-                        except Exception:
-                            pass
+            for file_path in self._find_missing_react_imports(client_src_dir):
+                rel_path = os.path.relpath(file_path, project_path)
+                issues.append(f"Possible missing React import in {rel_path}")
+                recommendations.append(f"Add 'import React from \"react\"' to {rel_path}")
         
         return {
             "issues": issues,
             "recommendations": recommendations
         }
     
+    def _find_missing_react_imports(self, client_src_dir: str) -> List[str]:
+        """
+        Find client source files that use React hooks without importing React.
+        
+        Uses ripgrep when it is installed, which scans the whole tree in two
+        subprocess calls, and falls back to a threaded Python scan otherwise.
+        
+        Args:
+            client_src_dir: Path to the client source directory
+            
+        Returns:
+            Sorted list of offending file paths
+        """
+        rg = shutil.which("rg")
+        if rg:
+            try:
+                uses_hooks = self._rg_files_with_matches(rg, ["-e", "useState|useEffect"], client_src_dir)
+                imports_react = self._rg_files_with_matches(rg, ["-F", "-e", "import React"], client_src_dir)
+                return sorted(uses_hooks - imports_react)
+            except (OSError, subprocess.SubprocessError) as e:
+                logger.debug(f"ripgrep scan failed, falling back to Python scan: {str(e)}")
+        
+        file_paths = [
+            os.path.join(root, file)
+            for root, _, files in os.walk(client_src_dir)
+            for file in files
+            if file.endswith(self.CLIENT_SOURCE_EXTENSIONS)
+        ]
+        if not file_paths:
+            return []
+        
+        # Overlap the per-file I/O, which releases the GIL
+        workers = min(self.SCAN_WORKERS, len(file_paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(self._needs_react_import, file_paths)
+            return sorted(path for path, missing in zip(file_paths, results) if missing)
+    
+    def _needs_react_import(self, file_path: str) -> bool:
+        """
+        Check whether a source file uses React hooks without importing React.
+        
+        The file is memory-mapped and searched as bytes, so it is never read
+        into a Python string. Empty files and files larger than
+        MAX_SCAN_FILE_SIZE (usually bundles or generated code) are skipped.
+        
+        Args:
+            file_path: Path to the source file
+            
+        Returns:
+            True if the file looks like it is missing a React import
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size == 0 or size > self.MAX_SCAN_FILE_SIZE:
+                    return False
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if mm.find(b"import React") != -1:
+                        return False
+                    return mm.find(b"useState") != -1 or mm.find(b"useEffect") != -1
+        except (OSError, ValueError):
+            return False
+    
+    def _rg_files_with_matches(self, rg: str, pattern_args: List[str], search_dir: str) -> Set[str]:
+        """
+        List the client source files under a directory matching a ripgrep pattern.
+        
+        Args:
+            rg: Path to the ripgrep executable
+            pattern_args: ripgrep pattern arguments (e.g. ["-e", "useState"])
+            search_dir: Directory to search
+            
+        Returns:
+            Set of matching file paths
+        """
+        globs = []
+        for ext in self.CLIENT_SOURCE_EXTENSIONS:
+            globs.extend(["-g", f"*{ext}"])
+        
+        result = subprocess.run(
+            [rg, "--files-with-matches", "--null", "--no-messages", "--no-ignore", "--hidden",
+             "--max-filesize", str(self.MAX_SCAN_FILE_SIZE), *globs, *pattern_args, "--", search_dir],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+        # Exit status 1 means no file matched
+        if result.returncode not in (0, 1):
+            raise subprocess.SubprocessError(f"rg exited with status {result.returncode}")
+        return {path for path in os.fsdecode(result.stdout).split("\0") if path}
+    
     def _analyze_error_log(self, error_log: str) -> Dict[str, List[str]]:
         """
         Analyze the error log for common issues.
@@ -511,9 +785,9 @@ class WaspFrameworkHandler(FrameworkHandler):
         recommendations = []
         
         # Check for common issues based on error patterns
+        detected = {match.lastgroup for match in self.ERROR_LOG_RE.finditer(error_log)}
         for issue_key, issue_info in self.COMMON_ISSUES.items():
-            pattern = issue_info["pattern"]
-            if pattern in error_log:
+            if issue_key in detected:
                 solution = issue_info["solution"]
                 solution = solution.replace("{NODE_VERSION_REQ}", self.NODE_VERSION_REQ)
                 
@@ -521,20 +795,20 @@ class WaspFrameworkHandler(FrameworkHandler):
                 recommendations.append(solution)
         
         # Check for specific error messages
-        if "Module not found: Error: Can't resolve" in error_log:
+        if "missing_module" in detected:
             # Extract the missing module name
-            match = re.search(r"Can't resolve '([^']+)'", error_log)
+            match = _RESOLVE_RE.search(error_log)
             if match:
                 module_name = match.group(1)
                 issues.append(f"Missing dependency: {module_name}")
                 recommendations.append(f"Install the missing dependency with 'npm install {module_name}'")
         
-        if "Failed to connect to database" in error_log:
+        if "database_connection" in detected:
             issues.append("Database connection issue")
             recommendations.append("Verify that the DATABASE_URL environment variable is correctly set")
             recommendations.append("Check if the database server is running and accessible")
         
-        if "CORS" in error_log:
+        if "cors" in detected:
             issues.append("CORS (Cross-Origin Resource Sharing) issue")
             recommendations.append("Configure CORS settings in your Wasp app")
             recommendations.append("Ensure that the client-side origin is allowed in your CORS configuration")
@@ -543,4 +817,3 @@ class WaspFrameworkHandler(FrameworkHandler):
             "issues": issues,
             "recommendations": recommendations
         }
-"""
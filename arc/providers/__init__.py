@@ -1,6 +1,7 @@
 """
 Hosting provider handlers for Arc MCP Server.
 """
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 
 class ProviderHandler:
@@ -105,10 +106,12 @@ _provider_registry = {}
 def register_provider(provider_class):
     """Register a provider handler."""
     _provider_registry[provider_class.name] = provider_class
+    get_provider_handler.cache_clear()
     return provider_class
 
+@lru_cache(maxsize=None)
 def get_provider_handler(provider_name: str) -> Optional[ProviderHandler]:
-    """Get a provider handler by name."""
+    """Get a provider handler by name (one shared instance per provider, which may pool connections)."""
     if provider_name not in _provider_registry:
         return None
     return _provider_registry[provider_name]()
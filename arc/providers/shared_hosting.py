@@ -4,6 +4,8 @@ Handles traditional shared hosting environments with FTP/SFTP access.
 """
 import os
 import time
+import atexit
+import calendar
 import logging
 import ftplib
 import paramiko
@@ -13,8 +15,16 @@ import hashlib
 import fnmatch
 import traceback
 import stat
+import re
+import shlex
+import socket
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple, Set, Iterator
+from typing import Dict, List, Any, Optional, Tuple, Set, Iterable, Iterator, NamedTuple, Pattern
 
 from arc.providers import register_provider, ProviderHandler
 
@@ -23,6 +33,9 @@ logger = logging.getLogger(__name__)
 class FileInfo:
     """Class to store file information for synchronization."""
     
+    # Scans create one instance per file, so skip the per-instance __dict__
+    __slots__ = ("path", "size", "modified_time", "hash_value")
+    
     def __init__(self, path: str, size: int, modified_time: float, hash_value: Optional[str] = None):
         """
         Initialize file info.
@@ -58,6 +71,146 @@ class FileInfo:
         """Hash for use in sets."""
         return hash((self.path, self.size, int(self.modified_time)))
 
+@lru_cache(maxsize=16)
+def _compile_exclusions(exclusions: Tuple[str, ...]) -> Optional[Pattern[str]]:
+    """
+    Compile exclusion globs into a single regular expression.
+    
+    Args:
+        exclusions: Glob patterns for file and directory names
+        
+    Returns:
+        Compiled pattern matching any excluded name, None if there are no patterns
+    """
+    if not exclusions:
+        return None
+    return re.compile("|".join(fnmatch.translate(pattern) for pattern in exclusions))
+
+class _SFTPSession(NamedTuple):
+    """Pooled SSH connection with an SFTP channel reserved for one operation."""
+    
+    key: Tuple
+    client: paramiko.SSHClient
+    sftp: paramiko.SFTPClient
+
+class _SSHConnectionPool:
+    """
+    Thread-safe pool of SSH connections and idle SFTP channels.
+    
+    Connections are keyed by server and login and reused while their
+    transport is active. SFTP channels are opened over the pooled transport,
+    so taking another one costs no extra handshake. Handshakes run outside
+    the pool lock, so connecting to one server never waits on another.
+    """
+    
+    def __init__(self, max_idle_channels: int):
+        """
+        Initialize the pool.
+        
+        Args:
+            max_idle_channels: Maximum number of idle SFTP channels kept per connection
+        """
+        self.max_idle_channels = max_idle_channels
+        self._lock = threading.Lock()
+        self._connect_locks: Dict[Tuple, threading.Lock] = {}
+        self._clients: Dict[Tuple, paramiko.SSHClient] = {}
+        self._idle: Dict[Tuple, List[paramiko.SFTPClient]] = {}
+    
+    def _active_client(self, key: Tuple) -> Optional[paramiko.SSHClient]:
+        """
+        Get the pooled connection for a key if its transport is still up.
+        
+        Must be called with _lock held.
+        """
+        client = self._clients.get(key)
+        transport = client.get_transport() if client else None
+        if transport is None or not transport.is_active():
+            return None
+        return client
+    
+    def client(self, key: Tuple, connect) -> paramiko.SSHClient:
+        """
+        Get the pooled connection for a key, connecting if needed.
+        
+        Args:
+            key: Tuple of host, port, username and password
+            connect: Callable opening a new SSH client
+            
+        Returns:
+            Connected SSH client
+        """
+        with self._lock:
+            client = self._active_client(key)
+            if client:
+                return client
+            connect_lock = self._connect_locks.setdefault(key, threading.Lock())
+        
+        # Only one thread connects per key; the others wait here and then
+        # pick up its connection
+        with connect_lock:
+            with self._lock:
+                client = self._active_client(key)
+                if client:
+                    return client
+                stale = self._clients.pop(key, None)
+                self._idle[key] = []
+            
+            if stale:
+                stale.close()
+            client = connect()
+            with self._lock:
+                self._clients[key] = client
+            return client
+    
+    def acquire_sftp(self, key: Tuple, client: paramiko.SSHClient) -> paramiko.SFTPClient:
+        """
+        Take an idle SFTP channel for a connection, or open a new one.
+        
+        Args:
+            key: Key the connection was pooled under
+            client: Pooled SSH client
+            
+        Returns:
+            SFTP client for exclusive use until released
+        """
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            while idle:
+                sftp = idle.pop()
+                if not sftp.get_channel().closed:
+                    return sftp
+        return client.open_sftp()
+    
+    def release_sftp(self, key: Tuple, sftp: paramiko.SFTPClient) -> None:
+        """
+        Return an SFTP channel to the pool.
+        
+        Args:
+            key: Key the connection was pooled under
+            sftp: SFTP client taken with acquire_sftp
+        """
+        # Forget any working directory set by the previous user
+        sftp.chdir(None)
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_channels and not sftp.get_channel().closed:
+                idle.append(sftp)
+                return
+        sftp.close()
+    
+    def close(self) -> None:
+        """Close all idle SFTP channels and pooled connections."""
+        with self._lock:
+            idle = [sftp for channels in self._idle.values() for sftp in channels]
+            clients = list(self._clients.values())
+            self._idle.clear()
+            self._clients.clear()
+        
+        for sftp in idle:
+            sftp.close()
+        for client in clients:
+            client.close()
+
 @register_provider
 class SharedHostingProvider(ProviderHandler):
     """
@@ -79,6 +232,23 @@ class SharedHostingProvider(ProviderHandler):
     # Maximum number of retry attempts for file operations
     MAX_RETRIES = 3
     
+    # Default number of parallel FTP connections used for uploads
+    PARALLEL_UPLOADS = 4
+    
+    # Maximum number of idle SFTP channels kept open per pooled connection
+    MAX_IDLE_SFTP_CHANNELS = 5
+    
+    # TCP buffer sizes and SSH flow-control settings for file transfers
+    SOCKET_BUFFER_SIZE = 32 * 1024 * 1024
+    SSH_WINDOW_SIZE = 2 ** 31 - 1
+    SSH_MAX_PACKET_SIZE = 32 * 1024
+    
+    # Size of individual SFTP writes; paramiko slows down sharply on larger ones
+    SFTP_WRITE_SIZE = 32 * 1024
+    
+    # Chunk size used when streaming archives to the server
+    STREAM_CHUNK_SIZE = 1024 * 1024
+    
     # Default exclusion patterns for files that should not be uploaded
     DEFAULT_EXCLUSIONS = [
         '.git', '.github', '.gitignore', '.DS_Store', 
@@ -87,6 +257,11 @@ class SharedHostingProvider(ProviderHandler):
         'README.md', 'LICENSE', 'CHANGELOG.md'
     ]
     
+    def __init__(self):
+        """Initialize the shared hosting provider."""
+        self._ssh_pool = _SSHConnectionPool(self.MAX_IDLE_SFTP_CHANNELS)
+        atexit.register(self._ssh_pool.close)
+    
     def validate_credentials(self, credentials: Dict[str, str]) -> Dict[str, Any]:
         """
         Validate shared hosting credentials by attempting to connect.
@@ -124,15 +299,18 @@ class SharedHostingProvider(ProviderHandler):
                     ftp.login(credentials["username"], credentials["password"])
                     ftp.quit()
             else:  # SFTP
-                client = paramiko.SSHClient()
-                client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-                client.connect(
-                    hostname=credentials["host"],
-                    port=int(credentials["port"]) if credentials["port"] else 22,
-                    username=credentials["username"],
-                    password=credentials["password"]
+                # Log in on a new connection rather than trusting a pooled
+                # one, which may have been opened with since-changed details
+                client = self._connect_ssh(
+                    credentials["host"],
+                    int(credentials["port"]) if credentials["port"] else 22,
+                    credentials["username"],
+                    credentials["password"]
                 )
-                client.close()
+                try:
+                    client.open_sftp().close()
+                finally:
+                    client.close()
             
             return {
                 "success": True,
@@ -222,25 +400,15 @@ class SharedHostingProvider(ProviderHandler):
                             break
                     
             else:  # SFTP
-                client = paramiko.SSHClient()
-                client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-                client.connect(
-                    hostname=credentials["host"],
-                    port=int(credentials["port"]) if credentials["port"] else 22,
-                    username=credentials["username"],
-                    password=credentials["password"]
-                )
-                
-                sftp = client.open_sftp()
-                try:
+                with self._sftp_session(credentials) as session:
+                    sftp = session.sftp
+                    
                     # Navigate to the target directory
                     if remote_path != "/":
                         try:
                             sftp.chdir(remote_path)
                         except IOError:
                             # Directory doesn't exist
-                            sftp.close()
-                            client.close()
                             return {
                                 "success": True,
                                 "status": "not_deployed",
@@ -253,9 +421,6 @@ class SharedHostingProvider(ProviderHandler):
                         if file in files:
                             deployed = True
                             break
-                finally:
-                    sftp.close()
-                    client.close()
             
             status = "deployed" if deployed else "partial"
             message = (
@@ -315,6 +480,7 @@ class SharedHostingProvider(ProviderHandler):
         clean_destination = config.get("clean_destination", False)
         exclusions = config.get("exclusions", self.DEFAULT_EXCLUSIONS)
         sync_mode = config.get("sync_mode", "smart")  # 'smart', 'full', or 'incremental'
+        parallel = config.get("parallel", self.PARALLEL_UPLOADS)
         
         # Prepare for deployment
         protocol = credentials["protocol"].lower()
@@ -331,7 +497,8 @@ class SharedHostingProvider(ProviderHandler):
                     backup=backup,
                     clean_destination=clean_destination,
                     exclusions=exclusions,
-                    sync_mode=sync_mode
+                    sync_mode=sync_mode,
+                    parallel=parallel
                 )
             else:  # SFTP
                 result = self._deploy_sftp(
@@ -342,7 +509,8 @@ class SharedHostingProvider(ProviderHandler):
                     backup=backup,
                     clean_destination=clean_destination,
                     exclusions=exclusions,
-                    sync_mode=sync_mode
+                    sync_mode=sync_mode,
+                    parallel=parallel
                 )
             
             if result["success"]:
@@ -369,7 +537,8 @@ class SharedHostingProvider(ProviderHandler):
         backup: bool,
         clean_destination: bool,
         exclusions: List[str],
-        sync_mode: str
+        sync_mode: str,
+        parallel: int = PARALLEL_UPLOADS
     ) -> Dict[str, Any]:
         """Deploy via FTP with smart synchronization."""
         username = credentials["username"]
@@ -414,27 +583,20 @@ class SharedHostingProvider(ProviderHandler):
                 sync_mode=sync_mode
             )
             
-            # Proceed with upload
-            uploaded_count = 0
-            skipped_count = 0
-            for rel_path, file_info in to_upload.items():
-                local_path = os.path.join(source_dir, rel_path)
-                remote_path = os.path.join(destination, rel_path).replace("\\", "/")
-                
-                # Ensure remote directory exists
-                remote_dir = os.path.dirname(remote_path).replace("\\", "/")
-                self._ensure_ftp_directory(ftp, remote_dir)
-                
-                # Upload the file
+            # Create all remote directories up front, then upload the files
+            # over parallel connections, largest first so no worker is left
+            # with a big file at the end
+            rel_paths = self._largest_first(to_upload)
+            for remote_dir in self._remote_directories(destination, rel_paths, remote_files):
                 try:
-                    with open(local_path, 'rb') as f:
-                        ftp.storbinary(f'STOR {remote_path}', f)
-                    uploaded_count += 1
-                    logger.debug(f"Uploaded: {remote_path}")
-                except Exception as e:
-                    logger.error(f"Failed to upload {remote_path}: {str(e)}")
-                    raise
+                    ftp.mkd(remote_dir)
+                except ftplib.error_perm:
+                    # Directory already exists
+                    pass
             
+            uploaded_count = self._upload_ftp_files(
+                credentials, port, source_dir, destination, rel_paths, parallel
+            )
             skipped_count = len(local_files) - uploaded_count
             
             return {
@@ -468,94 +630,739 @@ class SharedHostingProvider(ProviderHandler):
         backup: bool,
         clean_destination: bool,
         exclusions: List[str],
-        sync_mode: str
+        sync_mode: str,
+        parallel: int = PARALLEL_UPLOADS
     ) -> Dict[str, Any]:
         """Deploy via SFTP with smart synchronization."""
+        # Take a pooled connection to the SFTP server
+        try:
+            with self._sftp_session(credentials, port) as session:
+                sftp = session.sftp
+                
+                # Ensure destination directory exists
+                self._ensure_sftp_directory(sftp, destination)
+                
+                # Create backup if requested
+                if backup:
+                    backup_name = f"{destination.rstrip('/')}_backup_{int(time.time())}"
+                    try:
+                        logger.info(f"Creating backup at {backup_name}")
+                        self._create_sftp_backup(sftp, destination, backup_name)
+                    except Exception as e:
+                        logger.warning(f"Backup failed, but continuing with deployment: {str(e)}")
+                
+                # Clean destination if requested
+                if clean_destination:
+                    logger.info(f"Cleaning destination directory: {destination}")
+                    self._clean_sftp_directory(sftp, destination, exclusions)
+                
+                # Gather local files
+                local_files = self._scan_local_directory(source_dir, exclusions)
+                
+                # For smart sync, gather remote files for comparison
+                remote_files = {}
+                if sync_mode == "smart" or sync_mode == "incremental":
+                    remote_files = self._scan_sftp_directory(session.client, sftp, destination)
+                
+                # Determine files to upload based on sync mode
+                to_upload = self._determine_files_to_upload(
+                    local_files=local_files,
+                    remote_files=remote_files,
+                    sync_mode=sync_mode
+                )
+                
+                # Stream all files as a single tar archive; servers without shell
+                # access fall back to uploading the files individually, largest first
+                rel_paths = self._largest_first(to_upload)
+                if rel_paths:
+                    try:
+                        self._bulk_upload_sftp(session.client, source_dir, destination, rel_paths)
+                    except Exception as e:
+                        logger.warning(f"Bulk upload failed, uploading files individually: {str(e)}")
+                        for remote_dir in self._remote_directories(destination, rel_paths, remote_files):
+                            try:
+                                sftp.mkdir(remote_dir)
+                            except IOError:
+                                # Directory already exists
+                                pass
+                        self._upload_sftp_files(
+                            session, source_dir, destination, rel_paths, parallel
+                        )
+                
+                uploaded_count = len(rel_paths)
+                skipped_count = len(local_files) - uploaded_count
+                
+                return {
+                    "success": True,
+                    "message": "Deployment completed successfully",
+                    "stats": {
+                        "files_uploaded": uploaded_count,
+                        "files_skipped": skipped_count,
+                        "total_files": len(local_files)
+                    }
+                }
+            
+        except Exception as e:
+            logger.error(f"SFTP deployment error: {str(e)}")
+            return {
+                "success": False,
+                "error": f"SFTP deployment failed: {str(e)}"
+            }
+    
+    @contextmanager
+    def _sftp_session(self, credentials: Dict[str, str], port: Optional[int] = None) -> Iterator[_SFTPSession]:
+        """
+        Open an SFTP session on the pooled connection for a set of credentials.
+        
+        Status checks and deployment go through the pool, so they share one
+        SSH handshake per server and login.
+        
+        Args:
+            credentials: Provider credentials
+            port: Optional port overriding the one in the credentials
+            
+        Returns:
+            Context manager yielding the session; the SFTP channel is returned
+            to the pool on exit
+        """
+        host = credentials["host"]
         username = credentials["username"]
         password = credentials["password"]
-        host = credentials["host"]
+        if port is None:
+            port = int(credentials["port"]) if credentials["port"] else 22
         
-        # Connect to SFTP server
-        client = paramiko.SSHClient()
+        key = (host, port, username, password)
+        client = self._ssh_pool.client(key, lambda: self._connect_ssh(host, port, username, password))
+        sftp = self._ssh_pool.acquire_sftp(key, client)
         try:
-            client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            client.connect(hostname=host, port=port, username=username, password=password)
+            yield _SFTPSession(key, client, sftp)
+        finally:
+            self._ssh_pool.release_sftp(key, sftp)
+    
+    def _connect_ssh(self, host: str, port: int, username: str, password: str) -> paramiko.SSHClient:
+        """
+        Open an SSH connection tuned for file transfers.
+        
+        Transport compression is requested so text assets, which make up most
+        web deployments, cross the wire compressed even over plain SFTP.
+        
+        Args:
+            host: Server host name
+            port: Server port
+            username: Login user name
+            password: Login password
             
-            sftp = client.open_sftp()
+        Returns:
+            Connected SSH client
+        """
+        client = paramiko.SSHClient()
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        client.connect(
+            hostname=host,
+            port=port,
+            username=username,
+            password=password,
+            sock=self._open_tuned_socket(host, port),
+            compress=True
+        )
+        
+        # Let channels opened from here on use the largest SSH window so
+        # transfers are not stalled waiting for window adjustments
+        transport = client.get_transport()
+        transport.default_window_size = self.SSH_WINDOW_SIZE
+        transport.default_max_packet_size = self.SSH_MAX_PACKET_SIZE
+        return client
+    
+    def _open_tuned_socket(self, host: str, port: int) -> socket.socket:
+        """
+        Open a TCP connection tuned for bulk transfers.
+        
+        Disables Nagle's algorithm and enlarges the socket buffers before
+        connecting, so the TCP window can grow on high-latency links.
+        
+        Args:
+            host: Server host name
+            port: Server port
             
-            # Ensure destination directory exists
-            self._ensure_sftp_directory(sftp, destination)
+        Returns:
+            Connected socket
+        """
+        last_error = None
+        for family, socktype, proto, _, address in socket.getaddrinfo(host, port, type=socket.SOCK_STREAM):
+            sock = socket.socket(family, socktype, proto)
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.SOCKET_BUFFER_SIZE)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.SOCKET_BUFFER_SIZE)
+                sock.connect(address)
+                return sock
+            except OSError as e:
+                sock.close()
+                last_error = e
+        
+        raise last_error or OSError(f"Could not resolve {host}")
+    
+    def _largest_first(self, files: Dict[str, FileInfo]) -> List[str]:
+        """
+        Order files for parallel upload, largest first.
+        
+        Starting the longest transfers first lets the small files fill in
+        around them, which shortens the time until the last worker finishes.
+        
+        Args:
+            files: Files to upload keyed by relative path
             
-            # Create backup if requested
-            if backup:
-                backup_name = f"{destination.rstrip('/')}_backup_{int(time.time())}"
+        Returns:
+            Relative paths sorted by descending size
+        """
+        return sorted(files, key=lambda rel_path: files[rel_path].size, reverse=True)
+    
+    def _remote_directories(
+        self,
+        destination: str,
+        rel_paths: List[str],
+        existing_paths: Iterable[str] = ()
+    ) -> List[str]:
+        """
+        List the remote directories that must be created to upload a set of files.
+        
+        Each directory is listed once, so the caller can create them with one
+        request each instead of probing the parents of every file. Directories
+        holding a file that already exists remotely are left out.
+        
+        Args:
+            destination: Destination path on the server
+            rel_paths: Paths of the files relative to the destination
+            existing_paths: Relative paths of files known to exist on the server
+            
+        Returns:
+            Remote directory paths, parents before their children
+        """
+        existing = set()
+        for rel_path in existing_paths:
+            parent = os.path.dirname(rel_path.replace("\\", "/"))
+            while parent and parent not in existing:
+                existing.add(parent)
+                parent = os.path.dirname(parent)
+        
+        directories = set()
+        for rel_path in rel_paths:
+            parent = os.path.dirname(rel_path.replace("\\", "/"))
+            while parent and parent not in directories and parent not in existing:
+                directories.add(parent)
+                parent = os.path.dirname(parent)
+        
+        return [
+            os.path.join(destination, rel_dir).replace("\\", "/")
+            for rel_dir in sorted(directories, key=lambda d: (d.count("/"), d))
+        ]
+    
+    def _upload_ftp_files(
+        self,
+        credentials: Dict[str, str],
+        port: int,
+        source_dir: str,
+        destination: str,
+        rel_paths: List[str],
+        parallel: int
+    ) -> int:
+        """
+        Upload files over several FTP connections at once.
+        
+        Each worker thread logs in with its own connection, as an FTP control
+        connection can only carry one transfer at a time. The remote
+        directories must already exist.
+        
+        Args:
+            credentials: Provider credentials
+            port: FTP port
+            source_dir: Local source directory
+            destination: Destination path on the server
+            rel_paths: Paths of the files to upload, relative to source_dir
+            parallel: Maximum number of parallel connections
+            
+        Returns:
+            Number of uploaded files
+        """
+        if not rel_paths:
+            return 0
+        
+        local = threading.local()
+        connections = []
+        connections_lock = threading.Lock()
+        
+        def upload(rel_path: str) -> None:
+            ftp = getattr(local, "ftp", None)
+            if ftp is None:
+                ftp = ftplib.FTP()
+                ftp.connect(host=credentials["host"], port=port)
+                ftp.login(credentials["username"], credentials["password"])
+                local.ftp = ftp
+                with connections_lock:
+                    connections.append(ftp)
+            
+            local_path = os.path.join(source_dir, rel_path)
+            remote_path = os.path.join(destination, rel_path).replace("\\", "/")
+            try:
+                with open(local_path, 'rb') as f:
+                    ftp.storbinary(f'STOR {remote_path}', f)
+                logger.debug(f"Uploaded: {remote_path}")
+            except Exception as e:
+                logger.error(f"Failed to upload {remote_path}: {str(e)}")
+                raise
+        
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, min(parallel, len(rel_paths)))) as executor:
+                # Consume the results so the first failure is raised
+                for _ in executor.map(upload, rel_paths):
+                    pass
+        finally:
+            for ftp in connections:
                 try:
-                    logger.info(f"Creating backup at {backup_name}")
-                    self._create_sftp_backup(sftp, destination, backup_name)
-                except Exception as e:
-                    logger.warning(f"Backup failed, but continuing with deployment: {str(e)}")
+                    ftp.quit()
+                except Exception:
+                    ftp.close()
+        
+        return len(rel_paths)
+    
+    def _bulk_upload_sftp(
+        self,
+        client: paramiko.SSHClient,
+        source_dir: str,
+        destination: str,
+        rel_paths: List[str]
+    ) -> None:
+        """
+        Upload files as one tar stream extracted on the server.
+        
+        This takes a single round trip instead of one per file, but requires
+        shell access with tar available on the server. The archive is gzipped
+        unless the SSH transport already compresses the connection. Archiving
+        and compression run in the local tar process, overlapping with the
+        network writes made here.
+        
+        Args:
+            client: Connected SSH client
+            source_dir: Local source directory
+            destination: Destination path on the server
+            rel_paths: Paths of the files to upload, relative to source_dir
+        """
+        transport = client.get_transport()
+        gzip_flag = "" if transport.local_compression not in (None, "none") else "z"
+        remote_dir = shlex.quote(destination or ".")
+        remote_cmd = f"mkdir -p {remote_dir} && tar -x{gzip_flag}f - -C {remote_dir}"
+        
+        # Pass the file list through a file to stay clear of argument limits
+        with tempfile.NamedTemporaryFile("wb", suffix=".lst", delete=False) as file_list:
+            for rel_path in rel_paths:
+                file_list.write(os.fsencode(rel_path) + b"\0")
+        
+        try:
+            tar = subprocess.Popen(
+                ["tar", f"-c{gzip_flag}f", "-", "-C", source_dir, "--null", "-T", file_list.name],
+                stdout=subprocess.PIPE,
+                bufsize=self.STREAM_CHUNK_SIZE
+            )
+            try:
+                stdin, stdout, stderr = client.exec_command(remote_cmd)
+                try:
+                    while True:
+                        chunk = tar.stdout.read(self.STREAM_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        stdin.write(chunk)
+                finally:
+                    stdin.channel.shutdown_write()
+            except BaseException:
+                # Don't leave tar running if the upload never started or broke off
+                tar.kill()
+                raise
+            finally:
+                tar.stdout.close()
+                tar.wait()
             
-            # Clean destination if requested
-            if clean_destination:
-                logger.info(f"Cleaning destination directory: {destination}")
-                self._clean_sftp_directory(sftp, destination, exclusions)
+            if tar.returncode != 0:
+                raise RuntimeError(f"Local tar exited with status {tar.returncode}")
             
-            # Gather local files
-            local_files = self._scan_local_directory(source_dir, exclusions)
+            exit_status = stdout.channel.recv_exit_status()
+            if exit_status != 0:
+                error = stderr.read().decode(errors="replace").strip()
+                raise RuntimeError(f"Remote tar exited with status {exit_status}: {error}")
             
-            # For smart sync, gather remote files for comparison
-            remote_files = {}
-            if sync_mode == "smart" or sync_mode == "incremental":
-                remote_files = self._scan_sftp_directory(sftp, destination)
+            logger.debug(f"Uploaded {len(rel_paths)} files to {destination} in one archive")
+        finally:
+            os.remove(file_list.name)
+    
+    def _upload_sftp_files(
+        self,
+        session: _SFTPSession,
+        source_dir: str,
+        destination: str,
+        rel_paths: List[str],
+        parallel: int
+    ) -> None:
+        """
+        Upload files individually over several SFTP channels at once.
+        
+        Each worker thread uploads over its own channel from the connection
+        pool. The channels share one SSH transport, so no extra handshakes are
+        needed. The remote directories must already exist.
+        
+        Args:
+            session: Session on the pooled connection
+            source_dir: Local source directory
+            destination: Destination path on the server
+            rel_paths: Paths of the files to upload, relative to source_dir
+            parallel: Maximum number of parallel channels
+        """
+        if not rel_paths:
+            return
+        
+        local = threading.local()
+        channels = []
+        channels_lock = threading.Lock()
+        
+        def upload(rel_path: str) -> None:
+            channel = getattr(local, "sftp", None)
+            if channel is None:
+                channel = self._ssh_pool.acquire_sftp(session.key, session.client)
+                local.sftp = channel
+                with channels_lock:
+                    channels.append(channel)
             
-            # Determine files to upload based on sync mode
-            to_upload = self._determine_files_to_upload(
-                local_files=local_files,
-                remote_files=remote_files,
-                sync_mode=sync_mode
+            local_path = os.path.join(source_dir, rel_path)
+            remote_path = os.path.join(destination, rel_path).replace("\\", "/")
+            try:
+                self._sftp_put_fast(channel, local_path, remote_path)
+                logger.debug(f"Uploaded: {remote_path}")
+            except Exception as e:
+                logger.error(f"Failed to upload {remote_path}: {str(e)}")
+                raise
+        
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, min(parallel, len(rel_paths)))) as executor:
+                # Consume the results so the first failure is raised
+                for _ in executor.map(upload, rel_paths):
+                    pass
+        finally:
+            for channel in channels:
+                self._ssh_pool.release_sftp(session.key, channel)
+    
+    def _sftp_put_fast(self, sftp: paramiko.SFTPClient, local_path: str, remote_path: str) -> None:
+        """
+        Upload a single file over SFTP in pipelined 32 KB writes.
+        
+        Keeping each write below paramiko's 32 KB threshold avoids the lock
+        contention that larger writes run into. Unlike sftp.put, no stat is
+        issued afterwards to confirm the size, which saves a round trip per
+        file; write errors still surface when the file is closed.
+        
+        Args:
+            sftp: Open SFTP client
+            local_path: Path of the local file
+            remote_path: Destination path on the server
+        """
+        with open(local_path, 'rb', buffering=1024 * 1024) as src, sftp.file(remote_path, 'wb') as dst:
+            dst.set_pipelined(True)
+            while True:
+                chunk = src.read(self.SFTP_WRITE_SIZE)
+                if not chunk:
+                    break
+                dst.write(chunk)
+    
+    def _ensure_ftp_directory(self, ftp: ftplib.FTP, path: str) -> None:
+        """
+        Create a directory and its parents on an FTP server if missing.
+        
+        Args:
+            ftp: Connected FTP client
+            path: Remote directory path
+        """
+        current = "/" if path.startswith("/") else ""
+        for part in path.strip("/").split("/"):
+            if not part:
+                continue
+            current = f"{current}{part}/"
+            try:
+                ftp.mkd(current.rstrip("/"))
+            except ftplib.error_perm:
+                # Directory already exists
+                pass
+    
+    def _ensure_sftp_directory(self, sftp: paramiko.SFTPClient, path: str) -> None:
+        """
+        Create a directory and its parents on an SFTP server if missing.
+        
+        Args:
+            sftp: Open SFTP client
+            path: Remote directory path
+        """
+        # The directory usually exists already, so check it with one request
+        # before walking its parents
+        try:
+            sftp.stat(path)
+            return
+        except IOError:
+            pass
+        
+        current = "/" if path.startswith("/") else ""
+        for part in path.strip("/").split("/"):
+            if not part:
+                continue
+            current = f"{current}{part}/"
+            try:
+                sftp.mkdir(current.rstrip("/"))
+            except IOError:
+                # Directory already exists
+                pass
+    
+    def _scan_ftp_directory(self, ftp: ftplib.FTP, destination: str) -> Dict[str, FileInfo]:
+        """
+        List the files below a remote FTP directory.
+        
+        Uses MLSD, which returns the type, size and modification time of every
+        entry in one listing per directory. Servers without MLSD support yield
+        an empty listing, so every file is uploaded.
+        
+        Args:
+            ftp: Connected FTP client
+            destination: Remote directory to scan
+            
+        Returns:
+            Dictionary mapping relative paths to file information
+        """
+        remote_files = {}
+        try:
+            self._walk_ftp_directory(ftp, destination.rstrip("/") or "/", "", remote_files)
+        except ftplib.error_perm as e:
+            logger.warning(f"Could not list {destination} with MLSD, uploading all files: {str(e)}")
+            return {}
+        return remote_files
+    
+    def _walk_ftp_directory(
+        self,
+        ftp: ftplib.FTP,
+        remote_dir: str,
+        rel_dir: str,
+        remote_files: Dict[str, FileInfo]
+    ) -> None:
+        """
+        Recursively collect file information from an FTP directory via MLSD.
+        
+        Args:
+            ftp: Connected FTP client
+            remote_dir: Remote directory to list
+            rel_dir: Path of the directory relative to the scan root, with a
+                trailing slash unless it is the root
+            remote_files: Dictionary the file information is added to
+        """
+        for name, facts in ftp.mlsd(remote_dir, facts=["type", "size", "modify"]):
+            entry_type = facts.get("type", "")
+            rel_path = f"{rel_dir}{name}"
+            if entry_type == "dir":
+                self._walk_ftp_directory(ftp, f"{remote_dir.rstrip('/')}/{name}", f"{rel_path}/", remote_files)
+            elif entry_type == "file":
+                modify = facts.get("modify", "")
+                modified_time = (
+                    calendar.timegm(time.strptime(modify[:14], "%Y%m%d%H%M%S")) if modify else 0
+                )
+                remote_files[rel_path] = FileInfo(rel_path, int(facts.get("size", 0)), modified_time)
+    
+    def _scan_sftp_directory(
+        self,
+        client: paramiko.SSHClient,
+        sftp: paramiko.SFTPClient,
+        destination: str
+    ) -> Dict[str, FileInfo]:
+        """
+        List the files below a remote SFTP directory.
+        
+        Runs a single find command over SSH to get the whole listing in one
+        round trip, falling back to walking the tree over SFTP on servers
+        without shell access or GNU find.
+        
+        Args:
+            client: Connected SSH client
+            sftp: Open SFTP client
+            destination: Remote directory to scan
+            
+        Returns:
+            Dictionary mapping relative paths to file information
+        """
+        try:
+            return self._fast_remote_manifest(client, destination)
+        except Exception as e:
+            logger.debug(f"Remote find failed, listing {destination} over SFTP: {str(e)}")
+        
+        remote_files = {}
+        try:
+            self._walk_sftp_directory(sftp, destination or ".", "", remote_files)
+        except IOError as e:
+            logger.warning(f"Could not list {destination}: {str(e)}")
+        return remote_files
+    
+    def _fast_remote_manifest(self, client: paramiko.SSHClient, destination: str) -> Dict[str, FileInfo]:
+        """
+        List the files below a remote directory with one find command.
+        
+        Args:
+            client: Connected SSH client
+            destination: Remote directory to scan
+            
+        Returns:
+            Dictionary mapping relative paths to file information
+        """
+        remote_dir = shlex.quote(destination or ".")
+        _, stdout, stderr = client.exec_command(
+            f"cd {remote_dir} && find . -type f -printf '%s %T@ %P\\0'"
+        )
+        output = stdout.read()
+        exit_status = stdout.channel.recv_exit_status()
+        if exit_status != 0:
+            error = stderr.read().decode(errors="replace").strip()
+            raise RuntimeError(f"find exited with status {exit_status}: {error}")
+        
+        remote_files = {}
+        for record in output.split(b"\0"):
+            if not record:
+                continue
+            size, mtime, rel_path = record.decode(errors="surrogateescape").split(" ", 2)
+            remote_files[rel_path] = FileInfo(rel_path, int(size), float(mtime))
+        return remote_files
+    
+    def _walk_sftp_directory(
+        self,
+        sftp: paramiko.SFTPClient,
+        remote_dir: str,
+        rel_dir: str,
+        remote_files: Dict[str, FileInfo]
+    ) -> None:
+        """
+        Recursively collect file information from an SFTP directory.
+        
+        Args:
+            sftp: Open SFTP client
+            remote_dir: Remote directory to list
+            rel_dir: Path of the directory relative to the scan root, with a
+                trailing slash unless it is the root
+            remote_files: Dictionary the file information is added to
+        """
+        for attr in sftp.listdir_attr(remote_dir):
+            rel_path = f"{rel_dir}{attr.filename}"
+            if stat.S_ISDIR(attr.st_mode):
+                self._walk_sftp_directory(
+                    sftp, f"{remote_dir.rstrip('/')}/{attr.filename}", f"{rel_path}/", remote_files
+                )
+            elif stat.S_ISREG(attr.st_mode):
+                remote_files[rel_path] = FileInfo(rel_path, attr.st_size, attr.st_mtime)
+    
+    def _scan_local_directory(self, source_dir: str, exclusions: List[str]) -> Dict[str, FileInfo]:
+        """
+        Scan the local source directory for files to deploy.
+        
+        Files are compared with their remote copies by size and modification
+        time, so only their metadata is read.
+        
+        Args:
+            source_dir: Local source directory
+            exclusions: Glob patterns for file and directory names to skip
+            
+        Returns:
+            Dictionary mapping relative paths to file information, sorted by path
+        """
+        local_files = {
+            rel_path: FileInfo(rel_path, file_stat.st_size, file_stat.st_mtime)
+            for _, rel_path, file_stat in self._walk_local_directory(
+                os.path.abspath(source_dir), "", _compile_exclusions(tuple(exclusions))
             )
+        }
+        return dict(sorted(local_files.items()))
+    
+    def _walk_local_directory(
+        self,
+        directory: str,
+        rel_dir: str,
+        excluded: Optional[Pattern[str]]
+    ) -> Iterator[Tuple[str, str, os.stat_result]]:
+        """
+        Recursively list the files in a local directory.
+        
+        Excluded directories are skipped without descending into them, and
+        symlinked directories are not followed.
+        
+        Args:
+            directory: Absolute path of the directory to list
+            rel_dir: Path of the directory relative to the scan root, with a
+                trailing slash unless it is the root
+            excluded: Compiled exclusion pattern from _compile_exclusions
             
-            # Proceed with upload
-            uploaded_count = 0
-            skipped_count = 0
-            for rel_path, file_info in to_upload.items():
-                local_path = os.path.join(source_dir, rel_path)
-                remote_path = os.path.join(destination, rel_path).replace("\\", "/")
-                
-                # Ensure remote directory exists
-                remote_dir = os.path.dirname(remote_path).replace("\\", "/")
-                self._ensure_sftp_directory(sftp, remote_dir)
+        Returns:
+            Iterator of (absolute path, relative path, stat result) tuples
+        """
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if excluded and excluded.match(entry.name):
+                    continue
                 
-                # Upload the file
-                try:
-                    sftp.put(local_path, remote_path)
-                    uploaded_count += 1
-                    logger.debug(f"Uploaded: {remote_path}")
-                except Exception as e:
-                    logger.error(f"Failed to upload {remote_path}: {str(e)}")
-                    raise
-            
-            skipped_count = len(local_files) - uploaded_count
+                rel_path = f"{rel_dir}{entry.name}"
+                if entry.is_dir(follow_symlinks=False):
+                    yield from self._walk_local_directory(entry.path, f"{rel_path}/", excluded)
+                elif entry.is_file():
+                    yield entry.path, rel_path, entry.stat()
+    
+    def _determine_files_to_upload(
+        self,
+        local_files: Dict[str, FileInfo],
+        remote_files: Dict[str, FileInfo],
+        sync_mode: str
+    ) -> Dict[str, FileInfo]:
+        """
+        Select the local files that need to be uploaded.
+        
+        Each local file is matched to its remote counterpart with a single
+        dictionary lookup by path.
+        
+        Args:
+            local_files: Local files keyed by relative path
+            remote_files: Remote files keyed by relative path
+            sync_mode: 'full' uploads everything, 'incremental' only files
+                missing remotely, 'smart' also files that changed
             
+        Returns:
+            Files to upload keyed by relative path, in local scan order
+        """
+        if sync_mode == "full":
+            return dict(local_files)
+        
+        if sync_mode == "incremental":
             return {
-                "success": True,
-                "message": "Deployment completed successfully",
-                "stats": {
-                    "files_uploaded": uploaded_count,
-                    "files_skipped": skipped_count,
-                    "total_files": len(local_files)
-                }
+                rel_path: file_info
+                for rel_path, file_info in local_files.items()
+                if rel_path not in remote_files
             }
+        
+        return {
+            rel_path: file_info
+            for rel_path, file_info in local_files.items()
+            if self._is_changed(file_info, remote_files.get(rel_path))
+        }
+    
+    def _is_changed(self, local: FileInfo, remote: Optional[FileInfo]) -> bool:
+        """
+        Check whether a local file differs from its remote copy.
+        
+        Args:
+            local: Local file information
+            remote: Remote file information, None if the file is missing remotely
             
-        except Exception as e:
-            logger.error(f"SFTP deployment error: {str(e)}")
-            return {
-                "success": False,
-                "error": f"SFTP deployment failed: {str(e)}"
-            }
-        finally:
-            try:
-                sftp.close()
-                client.close()
-            except:
-                pass
\ No newline at end of file
+        Returns:
+            True if the file needs to be uploaded
+        """
+        if remote is None:
+            return True
+        if local.hash_value and remote.hash_value:
+            return local.hash_value != remote.hash_value
+        
+        # Remote timestamps are usually the upload time, so only a local file
+        # that is newer than the remote copy counts as modified
+        return local.size != remote.size or local.modified_time > remote.modified_time + 1
@@ -1,16 +1,20 @@
 """
 Main MCP server implementation for Arc.
 """
-import os
+import time
+import asyncio
+import inspect
 import logging
+import functools
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Awaitable, Callable, Dict, List, Any, Optional
 import json
 
 # Assuming use of FastMCP for implementation
 from fastmcp import MCPServer, Tool, Resource, Prompt
 
-from arc.credentials import CredentialManager
+from arc.credentials import get_credential_manager
 from arc.frameworks import get_framework_handler
 from arc.providers import get_provider_handler
 
@@ -23,6 +27,12 @@ class ArcServer(MCPServer):
     web applications to various hosting environments.
     """
     
+    # Maximum number of providers validated at once by a batch call
+    BATCH_WORKERS = 16
+    
+    # Seconds for which a successful status response is reused
+    STATUS_CACHE_TTL = 5
+    
     def __init__(self, debug: bool = False):
         super().__init__(
             name="arc",
@@ -31,7 +41,10 @@ class ArcServer(MCPServer):
         )
         
         self.debug = debug
-        self.credential_manager = CredentialManager()
+        self.credential_manager = get_credential_manager()
+        
+        # Status responses keyed by (kind, provider, site), with their expiry time
+        self._status_cache: Dict[tuple, tuple] = {}
         
         # Register all tools
         self._register_tools()
@@ -42,11 +55,139 @@ class ArcServer(MCPServer):
         
         logger.info("Arc MCP Server initialized")
     
+    async def _cached_status(
+        self,
+        key: tuple,
+        fetch: Callable[[], Awaitable[Dict[str, Any]]],
+        force_refresh: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Return a status response, reusing a recent successful one.
+        
+        Args:
+            key: Cache key of the response
+            fetch: Function querying the provider
+            force_refresh: Query the provider even if a cached response exists
+            
+        Returns:
+            Status response
+        """
+        now = time.monotonic()
+        if not force_refresh:
+            cached = self._status_cache.get(key)
+            if cached and cached[0] > now:
+                return cached[1]
+        
+        result = await fetch()
+        if result.get("success"):
+            self._status_cache[key] = (now + self.STATUS_CACHE_TTL, result)
+        else:
+            self._status_cache.pop(key, None)
+        return result
+    
+    def _invalidate_status(self, provider_name: str):
+        """Drop cached status responses for a provider."""
+        for key in [key for key in self._status_cache if key[1] == provider_name]:
+            self._status_cache.pop(key, None)
+    
+    def _resolve(
+        self,
+        providers: bool = False,
+        frameworks: bool = False,
+        path: bool = False,
+        creds: bool = False
+    ) -> Callable:
+        """
+        Build a decorator that validates the common tool arguments.
+        
+        The decorated coroutine function receives a context dict as its first
+        argument, holding the resolved "framework", "provider" and
+        "credentials". Its remaining parameters are the tool's own. The first
+        failed check returns its error dict without calling the function.
+        
+        Args:
+            providers: Resolve the provider_name argument to a handler
+            frameworks: Resolve the framework_name argument to a handler
+            path: Report a missing project_path, detected when the handler
+                fails to open it, instead of raising
+            creds: Load stored credentials for the provider
+            
+        Returns:
+            Decorator for tool functions
+        """
+        def decorator(func: Callable) -> Callable:
+            signature = inspect.signature(func)
+            tool_signature = signature.replace(parameters=list(signature.parameters.values())[1:])
+            
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                arguments = tool_signature.bind(*args, **kwargs)
+                arguments.apply_defaults()
+                arguments = arguments.arguments
+                ctx: Dict[str, Any] = {}
+                
+                if frameworks:
+                    framework_name = arguments["framework_name"]
+                    ctx["framework"] = get_framework_handler(framework_name)
+                    if not ctx["framework"]:
+                        return {"success": False, "error": f"Unsupported framework: {framework_name}"}
+                
+                if providers or creds:
+                    provider_name = arguments["provider_name"]
+                    ctx["provider"] = get_provider_handler(provider_name)
+                    if not ctx["provider"]:
+                        return {"success": False, "error": f"Unsupported provider: {provider_name}"}
+                    
+                    if creds:
+                        ctx["credentials"] = self.credential_manager.get_credentials(provider_name)
+                        if not ctx["credentials"]:
+                            return {"success": False, "error": f"No credentials found for {provider_name}"}
+                
+                try:
+                    return await func(ctx, *args, **kwargs)
+                except (FileNotFoundError, NotADirectoryError) as e:
+                    # Handlers open the project directory first, so there is
+                    # no need to stat it beforehand
+                    if not path or e.filename != arguments["project_path"]:
+                        raise
+                    return {"success": False, "error": f"Project path does not exist: {arguments['project_path']}"}
+            
+            wrapper.__signature__ = tool_signature
+            return wrapper
+        
+        return decorator
+    
     def _register_tools(self):
-        """Register all tools with the MCP server."""
+        """
+        Register all tools with the MCP server.
+        
+        Tools are coroutines so that concurrent calls overlap on the event
+        loop. Provider and framework handlers are synchronous and run in
+        worker threads.
+        """
+        
+        @self._resolve(providers=True)
+        async def authenticate(ctx, provider_name: str, credentials: Dict[str, str]) -> Dict[str, Any]:
+            """Validate and store credentials for one provider."""
+            logger.info(f"Authenticating with provider: {provider_name}")
+            
+            # Validate credentials
+            validation_result = await asyncio.to_thread(ctx["provider"].validate_credentials, credentials)
+            if not validation_result["success"]:
+                return validation_result
+            
+            # Store credentials securely; cached statuses used the old ones
+            self.credential_manager.store_credentials(provider_name, credentials)
+            self._invalidate_status(provider_name)
+            
+            return {
+                "success": True,
+                "provider": provider_name,
+                "message": f"Successfully authenticated with {provider_name}"
+            }
         
         @self.tool("authenticate_provider")
-        def authenticate_provider(provider_name: str, credentials: Dict[str, str]) -> Dict[str, Any]:
+        async def authenticate_provider(provider_name: str, credentials: Dict[str, str]) -> Dict[str, Any]:
             """
             Store authentication credentials for a hosting provider.
             
@@ -57,54 +198,80 @@ class ArcServer(MCPServer):
             Returns:
                 Dictionary with authentication status and provider information
             """
-            logger.info(f"Authenticating with provider: {provider_name}")
+            return await authenticate(provider_name, credentials)
+        
+        @self.tool("authenticate_providers_batch")
+        async def authenticate_providers_batch(items: List[Dict[str, Any]]) -> Dict[str, Any]:
+            """
+            Store authentication credentials for several hosting providers at once.
             
-            provider = get_provider_handler(provider_name)
-            if not provider:
-                return {"success": False, "error": f"Unsupported provider: {provider_name}"}
+            The credentials are validated concurrently, so the batch takes about
+            as long as the slowest provider instead of the sum of all of them.
             
-            # Validate credentials
-            validation_result = provider.validate_credentials(credentials)
-            if not validation_result["success"]:
-                return validation_result
+            Args:
+                items: Dictionaries with provider_name, credentials and an
+                    optional unique id used to key the result (the item index
+                    by default)
+                
+            Returns:
+                Dictionary with overall success and each item's result keyed by id
+            """
+            logger.info(f"Authenticating {len(items)} providers")
             
-            # Store credentials securely
-            self.credential_manager.store_credentials(provider_name, credentials)
+            request_ids = [str(item.get("id", index)) for index, item in enumerate(items)]
+            duplicates = sorted(rid for rid, count in Counter(request_ids).items() if count > 1)
+            if duplicates:
+                return {
+                    "success": False,
+                    "error": f"Duplicate item ids: {', '.join(duplicates)}"
+                }
+            
+            semaphore = asyncio.Semaphore(self.BATCH_WORKERS)
             
+            async def authenticate_item(item: Dict[str, Any]) -> Dict[str, Any]:
+                async with semaphore:
+                    return await authenticate(item.get("provider_name"), item.get("credentials") or {})
+            
+            responses = await asyncio.gather(*(authenticate_item(item) for item in items))
             return {
-                "success": True,
-                "provider": provider_name,
-                "message": f"Successfully authenticated with {provider_name}"
+                "success": all(response["success"] for response in responses),
+                "results": dict(zip(request_ids, responses))
             }
         
         @self.tool("check_server_status")
-        def check_server_status(provider_name: str, site_id: Optional[str] = None) -> Dict[str, Any]:
+        @self._resolve(providers=True, creds=True)
+        async def check_server_status(
+            ctx,
+            provider_name: str,
+            site_id: Optional[str] = None,
+            force_refresh: bool = False
+        ) -> Dict[str, Any]:
             """
             Check the status of the configured server.
             
+            Successful responses are reused for STATUS_CACHE_TTL seconds.
+            
             Args:
                 provider_name: Name of the hosting provider
                 site_id: Optional identifier for the specific site
+                force_refresh: Query the provider even if a recent response is cached
                 
             Returns:
                 Dictionary with server status information
             """
             logger.info(f"Checking server status for provider: {provider_name}")
             
-            provider = get_provider_handler(provider_name)
-            if not provider:
-                return {"success": False, "error": f"Unsupported provider: {provider_name}"}
-            
-            # Get stored credentials
-            credentials = self.credential_manager.get_credentials(provider_name)
-            if not credentials:
-                return {"success": False, "error": f"No credentials found for {provider_name}"}
-            
             # Check status
-            return provider.check_status(credentials, site_id)
+            return await self._cached_status(
+                ("server", provider_name, site_id),
+                lambda: asyncio.to_thread(ctx["provider"].check_status, ctx["credentials"], site_id),
+                force_refresh
+            )
         
         @self.tool("analyze_requirements")
-        def analyze_requirements(
+        @self._resolve(providers=True, frameworks=True, path=True)
+        async def analyze_requirements(
+            ctx,
             framework_name: str, 
             provider_name: str,
             project_path: str
@@ -122,23 +289,13 @@ class ArcServer(MCPServer):
             """
             logger.info(f"Analyzing requirements for {framework_name} on {provider_name}")
             
-            framework = get_framework_handler(framework_name)
-            if not framework:
-                return {"success": False, "error": f"Unsupported framework: {framework_name}"}
-            
-            provider = get_provider_handler(provider_name)
-            if not provider:
-                return {"success": False, "error": f"Unsupported provider: {provider_name}"}
-            
-            # Check if project path exists
-            if not os.path.isdir(project_path):
-                return {"success": False, "error": f"Project path does not exist: {project_path}"}
-            
             # Analyze requirements
-            return framework.analyze_requirements(project_path, provider_name)
+            return await asyncio.to_thread(ctx["framework"].analyze_requirements, project_path, provider_name)
         
         @self.tool("deploy_framework")
-        def deploy_framework(
+        @self._resolve(providers=True, frameworks=True, path=True, creds=True)
+        async def deploy_framework(
+            ctx,
             framework_name: str,
             provider_name: str,
             project_path: str,
@@ -158,32 +315,21 @@ class ArcServer(MCPServer):
             """
             logger.info(f"Deploying {framework_name} to {provider_name}")
             
-            framework = get_framework_handler(framework_name)
-            if not framework:
-                return {"success": False, "error": f"Unsupported framework: {framework_name}"}
-            
-            provider = get_provider_handler(provider_name)
-            if not provider:
-                return {"success": False, "error": f"Unsupported provider: {provider_name}"}
-            
-            # Get stored credentials
-            credentials = self.credential_manager.get_credentials(provider_name)
-            if not credentials:
-                return {"success": False, "error": f"No credentials found for {provider_name}"}
-            
-            # Check if project path exists
-            if not os.path.isdir(project_path):
-                return {"success": False, "error": f"Project path does not exist: {project_path}"}
-            
             # Prepare default config if not provided
             if config is None:
                 config = {}
             
             # Deploy
-            return framework.deploy(project_path, provider_name, credentials, config)
+            result = await asyncio.to_thread(
+                ctx["framework"].deploy, project_path, provider_name, ctx["credentials"], config
+            )
+            self._invalidate_status(provider_name)
+            return result
         
         @self.tool("troubleshoot_deployment")
-        def troubleshoot_deployment(
+        @self._resolve(providers=True, frameworks=True, path=True)
+        async def troubleshoot_deployment(
+            ctx,
             framework_name: str,
             provider_name: str,
             project_path: str,
@@ -203,20 +349,8 @@ class ArcServer(MCPServer):
             """
             logger.info(f"Troubleshooting deployment for {framework_name} on {provider_name}")
             
-            framework = get_framework_handler(framework_name)
-            if not framework:
-                return {"success": False, "error": f"Unsupported framework: {framework_name}"}
-            
-            provider = get_provider_handler(provider_name)
-            if not provider:
-                return {"success": False, "error": f"Unsupported provider: {provider_name}"}
-            
-            # Check if project path exists
-            if not os.path.isdir(project_path):
-                return {"success": False, "error": f"Project path does not exist: {project_path}"}
-            
             # Troubleshoot
-            return framework.troubleshoot(project_path, provider_name, error_log)
+            return await asyncio.to_thread(ctx["framework"].troubleshoot, project_path, provider_name, error_log)
     
     def _register_resources(self):
         """Register all resources with the MCP server."""
@@ -244,31 +378,42 @@ class ArcServer(MCPServer):
             return list_providers()
         
         @self.resource("deployment_status")
-        def deployment_status(provider_name: str, site_id: Optional[str] = None) -> Dict[str, Any]:
+        @self._resolve(providers=True, creds=True)
+        async def deployment_status(
+            ctx,
+            provider_name: str,
+            site_id: Optional[str] = None,
+            force_refresh: bool = False
+        ) -> Dict[str, Any]:
             """
             Get the current deployment status.
             
+            Successful responses are reused for STATUS_CACHE_TTL seconds.
+            
             Args:
                 provider_name: Name of the hosting provider
                 site_id: Optional identifier for the specific site
+                force_refresh: Query the provider even if a recent response is cached
                 
             Returns:
                 Dictionary with deployment status
             """
-            provider = get_provider_handler(provider_name)
-            if not provider:
-                return {"success": False, "error": f"Unsupported provider: {provider_name}"}
-            
-            # Get stored credentials
-            credentials = self.credential_manager.get_credentials(provider_name)
-            if not credentials:
-                return {"success": False, "error": f"No credentials found for {provider_name}"}
-            
             # Get deployment status
-            return provider.get_deployment_status(credentials, site_id)
+            return await self._cached_status(
+                ("deployment", provider_name, site_id),
+                lambda: asyncio.to_thread(ctx["provider"].get_deployment_status, ctx["credentials"], site_id),
+                force_refresh
+            )
     
     def _register_prompts(self):
         """Register all prompts with the MCP server."""
+        from arc.frameworks import list_frameworks
+        from arc.providers import list_providers
+        
+        # The supported lists are fixed once the server is built, so they are
+        # substituted here instead of on every render
+        supported_frameworks = "\n".join(f"- {f['display_name']}" for f in list_frameworks())
+        supported_providers = "\n".join(f"- {p['display_name']}" for p in list_providers())
         
         self.prompt(
             id="introduction",
@@ -289,8 +434,10 @@ class ArcServer(MCPServer):
             {supported_providers}
             
             To get started, you can ask me to deploy your application or help you set up authentication with a hosting provider.
-            """,
-            variables=["supported_frameworks", "supported_providers"]
+            """.format(
+                supported_frameworks=supported_frameworks,
+                supported_providers=supported_providers
+            )
         )
         
         self.prompt(
@@ -1,113 +1,347 @@
 """Secure credential management for Arc MCP Server."""
 
+import atexit
+import base64
+import hashlib
 import json
 import logging
 import os
+import sys
+import threading
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Set
 
 try:
-    from cryptography.fernet import Fernet
-    from cryptography.hazmat.primitives import hashes
-    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-    import base64
+    import msgpack
 except ImportError:
-    print("Cryptography package not found. Please install with 'pip install cryptography'")
+    msgpack = None
+    _packer = None
+else:
+    # One packer reused for every save; Packer objects are not thread-safe
+    _packer = msgpack.Packer(use_bin_type=True)
+    _packer_lock = threading.Lock()
+
+# Use orjson for the JSON fallback when it is installed
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+    _json_loads = json.loads
 
 logger = logging.getLogger("arc-mcp.credentials")
 
+# Leading byte of MessagePack payloads; JSON payloads always start with "{"
+_MSGPACK_TAG = b"\x01"
+
+# Leading byte of AES-GCM credential files; older Fernet tokens start with "g"
+_AESGCM_TAG = b"\x02"
+
+# Size of the random AES-GCM nonce stored in front of the ciphertext
+_NONCE_SIZE = 12
+
+# String values up to this length (protocols, ports, usernames) are interned
+_INTERN_MAX_LENGTH = 16
+
+def _intern_credentials(credentials: Dict[str, str]) -> Dict[str, str]:
+    """Intern credential field names and short values.
+    
+    Every provider uses the same few field names, so interning them lets all
+    cached credential dicts share one copy of each.
+    
+    Args:
+        credentials: Dictionary of credentials
+        
+    Returns:
+        Equal dictionary built from interned strings
+    """
+    return {
+        sys.intern(key): (
+            sys.intern(value) if isinstance(value, str) and len(value) <= _INTERN_MAX_LENGTH else value
+        )
+        for key, value in credentials.items()
+    }
+
+def _serialize_credentials(credentials: Dict[str, Dict[str, str]]) -> bytes:
+    """Serialize the credentials store for encryption.
+    
+    Uses MessagePack behind a format tag when it is installed and JSON
+    (through orjson if available) otherwise.
+    
+    Args:
+        credentials: Credentials keyed by provider
+        
+    Returns:
+        Serialized credentials
+    """
+    if _packer is not None:
+        with _packer_lock:
+            return _MSGPACK_TAG + _packer.pack(credentials)
+    return _json_dumps(credentials)
+
+def _deserialize_credentials(data: bytes) -> Dict[str, Dict[str, str]]:
+    """Deserialize a decrypted credentials store.
+    
+    Accepts both MessagePack payloads and JSON written by older versions.
+    
+    Args:
+        data: Decrypted credentials payload
+        
+    Returns:
+        Credentials keyed by provider
+    """
+    if data[:1] == _MSGPACK_TAG:
+        if msgpack is None:
+            raise ValueError("Credentials were stored with MessagePack, which is not installed")
+        return msgpack.unpackb(data[1:], raw=False)
+    return _json_loads(data)
+
+def _write_private(path: Path, data: bytes):
+    """Atomically replace a file with data readable by the owner only.
+    
+    The data is written to a temporary file created with mode 0600, then
+    renamed over the target, so the file is never briefly world-readable and
+    readers never see a partial write.
+    
+    Args:
+        path: Path of the file to write
+        data: File contents
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
 class CredentialsManager:
-    """Secure storage and retrieval of provider credentials."""
+    """Secure storage and retrieval of provider credentials.
+    
+    Each provider's credentials are encrypted into their own file in the
+    storage directory, so a change rewrites one small file. Files are read
+    when a provider is first asked for. Changes are written to disk
+    FLUSH_DELAY seconds after the last one, so a burst of saves costs one
+    write per provider touched. Pending changes are flushed at exit.
+    """
+    
+    # Seconds to wait for further changes before writing to disk
+    FLUSH_DELAY = 0.2
     
     def __init__(self, storage_path: str = "~/.arc/credentials"):
         """Initialize the credentials manager.
         
         Args:
-            storage_path: Path to store the encrypted credentials file
+            storage_path: Directory to store the encrypted credential files in
         """
-        self.storage_path = os.path.expanduser(storage_path)
+        self.storage_path = Path(storage_path).expanduser()
+        self.storage_dir = self.storage_path.parent
+        self.key_path = self.storage_dir / ".key"
         self._ensure_storage_dir()
         
         # Generate or retrieve encryption key
+        # Imported here so the cryptography backend only loads when needed
+        try:
+            from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+        except ImportError:
+            raise ImportError("Cryptography package not found. Please install with 'pip install cryptography'")
+        
         self.key = self._get_encryption_key()
-        self.cipher = Fernet(self.key)
+        self.aead = AESGCM(self.key)
+        
+        # Credentials loaded so far, keyed by provider; None marks a provider
+        # known to have no credentials
+        self._credentials_cache: Dict[str, Optional[Dict[str, str]]] = {}
+        self._all_loaded = False
         
-        # Cache for credentials
-        self._credentials_cache = {}
+        # Write-behind state, guarded by _lock
+        self._lock = threading.Lock()
+        self._dirty: Set[str] = set()
+        self._flush_timer: Optional[threading.Timer] = None
+        atexit.register(self.flush)
         
-        # Load existing credentials
-        self._load_credentials()
+        # Split a single-file store written by older versions
+        if self.storage_path.is_file():
+            self._migrate_credentials_file()
+        self.storage_path.mkdir(mode=0o700, exist_ok=True)
     
     def _ensure_storage_dir(self):
         """Ensure the storage directory exists."""
-        storage_dir = os.path.dirname(self.storage_path)
-        os.makedirs(storage_dir, exist_ok=True)
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
         
         # Set secure permissions on the directory
         try:
-            os.chmod(storage_dir, 0o700)  # Only user can access
+            self.storage_dir.chmod(0o700)  # Only user can access
         except Exception as e:
-            logger.warning(f"Could not set secure permissions on {storage_dir}: {str(e)}")
+            logger.warning(f"Could not set secure permissions on {self.storage_dir}: {str(e)}")
     
     def _get_encryption_key(self) -> bytes:
-        """Get or generate the encryption key."""
-        key_path = os.path.join(os.path.dirname(self.storage_path), ".key")
+        """Get or generate the 256-bit encryption key.
         
+        Keys written by older versions are base64-encoded Fernet keys; they
+        are decoded to the same 32 raw bytes, so existing files stay readable.
+        """
         # If key exists, use it
-        if os.path.exists(key_path):
-            with open(key_path, "rb") as key_file:
-                return key_file.read()
+        if self.key_path.exists():
+            key = self.key_path.read_bytes()
+            if len(key) != 32:
+                key = base64.urlsafe_b64decode(key)
+            return key
         
         # Generate a new key
-        key = Fernet.generate_key()
+        key = os.urandom(32)
         
-        # Save the key
-        with open(key_path, "wb") as key_file:
-            key_file.write(key)
+        # Save the key, readable by the user only
+        _write_private(self.key_path, key)
         
-        # Set secure permissions
-        try:
-            os.chmod(key_path, 0o600)  # Only user can read
-        except Exception as e:
-            logger.warning(f"Could not set secure permissions on {key_path}: {str(e)}")
-            
         return key
     
-    def _load_credentials(self):
-        """Load credentials from the storage file."""
-        if not os.path.exists(self.storage_path):
-            # No credentials file yet
-            return
+    def _encrypt(self, data: bytes) -> bytes:
+        """Encrypt a credentials payload with AES-GCM.
+        
+        Args:
+            data: Serialized credentials
+            
+        Returns:
+            Format tag, nonce and ciphertext
+        """
+        nonce = os.urandom(_NONCE_SIZE)
+        return _AESGCM_TAG + nonce + self.aead.encrypt(nonce, data, None)
+    
+    def _decrypt(self, blob: bytes) -> bytes:
+        """Decrypt a credentials file written by _encrypt or an older Fernet version.
         
+        Args:
+            blob: Contents of the credentials file
+            
+        Returns:
+            Serialized credentials
+        """
+        if blob[:1] == _AESGCM_TAG:
+            nonce = blob[1:1 + _NONCE_SIZE]
+            return self.aead.decrypt(nonce, blob[1 + _NONCE_SIZE:], None)
+        from cryptography.fernet import Fernet
+        return Fernet(base64.urlsafe_b64encode(self.key)).decrypt(blob)
+    
+    def _provider_path(self, provider: str) -> Path:
+        """Get the file holding a provider's credentials.
+        
+        The name is hashed so provider names never appear on disk.
+        """
+        digest = hashlib.sha256(provider.encode("utf-8")).hexdigest()
+        return self.storage_path / f"{digest}.bin"
+    
+    def _read_credentials_file(self, path: Path) -> Dict[str, Dict[str, str]]:
+        """Read and decrypt one credentials file.
+        
+        Args:
+            path: Path of the file
+            
+        Returns:
+            Credentials keyed by provider
+        """
+        encrypted_data = path.read_bytes()
+        if not encrypted_data:
+            return {}
+        credentials = _deserialize_credentials(self._decrypt(encrypted_data))
+        return {provider: _intern_credentials(values) for provider, values in credentials.items()}
+    
+    def _migrate_credentials_file(self):
+        """Move credentials from an older single-file store into per-provider files.
+        
+        The old file is kept as credentials.old unless all of its credentials
+        were read and written out again.
+        """
+        legacy_path = self.storage_path.with_name(self.storage_path.name + ".old")
+        self.storage_path.replace(legacy_path)
+        self.storage_path.mkdir(mode=0o700)
         try:
-            with open(self.storage_path, "rb") as f:
-                encrypted_data = f.read()
-                if encrypted_data:
-                    decrypted_data = self.cipher.decrypt(encrypted_data)
-                    self._credentials_cache = json.loads(decrypted_data.decode("utf-8"))
+            credentials = self._read_credentials_file(legacy_path)
+            with self._lock:
+                self._credentials_cache.update(credentials)
+                self._dirty.update(credentials)
+            self.flush()
         except Exception as e:
-            logger.error(f"Error loading credentials: {str(e)}")
-            # Start with empty credentials on error
-            self._credentials_cache = {}
+            logger.error(f"Error migrating credentials, leaving them in {legacy_path}: {str(e)}")
+            return
+        
+        legacy_path.unlink()
+        logger.info(f"Migrated credentials for {len(credentials)} provider(s)")
     
-    def _save_credentials_to_disk(self):
-        """Save credentials to the storage file."""
-        try:
-            data = json.dumps(self._credentials_cache).encode("utf-8")
-            encrypted_data = self.cipher.encrypt(data)
-            
-            with open(self.storage_path, "wb") as f:
-                f.write(encrypted_data)
-                
-            # Set secure permissions
+    def _load_provider(self, provider: str) -> Optional[Dict[str, str]]:
+        """Get a provider's credentials, reading them from disk on first use.
+        
+        Must be called with _lock held.
+        """
+        if provider in self._credentials_cache:
+            return self._credentials_cache[provider]
+        
+        credentials = None
+        path = self._provider_path(provider)
+        if path.exists():
             try:
-                os.chmod(self.storage_path, 0o600)  # Only user can read
+                credentials = self._read_credentials_file(path).get(provider)
             except Exception as e:
-                logger.warning(f"Could not set secure permissions on {self.storage_path}: {str(e)}")
+                logger.error(f"Error loading credentials: {str(e)}")
+        self._credentials_cache[provider] = credentials
+        return credentials
+    
+    def _save_credentials_to_disk(self, provider: str):
+        """Write or remove the file for one provider.
+        
+        Args:
+            provider: Provider whose cached credentials should be persisted
+        """
+        path = self._provider_path(provider)
+        credentials = self._credentials_cache.get(provider)
+        try:
+            if credentials is None:
+                path.unlink(missing_ok=True)
+                return
+            
+            data = _serialize_credentials({provider: credentials})
+            encrypted_data = self._encrypt(data)
+            
+            _write_private(path, encrypted_data)
         except Exception as e:
             logger.error(f"Error saving credentials: {str(e)}")
             raise
     
+    def _schedule_flush(self, provider: str):
+        """Mark a provider dirty and (re)arm the flush timer.
+        
+        Must be called with _lock held.
+        """
+        self._dirty.add(provider)
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+        self._flush_timer = threading.Timer(self.FLUSH_DELAY, self._flush_in_background)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+    
+    def _flush_in_background(self):
+        """Flush from the timer thread, where errors can only be logged."""
+        try:
+            self.flush()
+        except Exception:
+            # Already logged; unsaved providers stay dirty and are retried at exit
+            pass
+    
+    def flush(self):
+        """Write pending credential changes to disk immediately."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            while self._dirty:
+                provider = next(iter(self._dirty))
+                self._save_credentials_to_disk(provider)
+                self._dirty.discard(provider)
+    
     def save_credentials(self, provider: str, credentials: Dict[str, str]):
         """Save credentials for a provider.
         
@@ -115,8 +349,9 @@ class CredentialsManager:
             provider: Provider name
             credentials: Dictionary of credentials
         """
-        self._credentials_cache[provider] = credentials
-        self._save_credentials_to_disk()
+        with self._lock:
+            self._credentials_cache[provider] = _intern_credentials(credentials)
+            self._schedule_flush(provider)
         logger.info(f"Saved credentials for provider: {provider}")
     
     def get_credentials(self, provider: str) -> Optional[Dict[str, str]]:
@@ -128,7 +363,8 @@ class CredentialsManager:
         Returns:
             Dictionary of credentials or None if not found
         """
-        return self._credentials_cache.get(provider)
+        with self._lock:
+            return self._load_provider(provider)
     
     def delete_credentials(self, provider: str) -> bool:
         """Delete credentials for a provider.
@@ -139,12 +375,13 @@ class CredentialsManager:
         Returns:
             True if credentials were deleted, False if not found
         """
-        if provider in self._credentials_cache:
-            del self._credentials_cache[provider]
-            self._save_credentials_to_disk()
-            logger.info(f"Deleted credentials for provider: {provider}")
-            return True
-        return False
+        with self._lock:
+            if self._load_provider(provider) is None:
+                return False
+            self._credentials_cache[provider] = None
+            self._schedule_flush(provider)
+        logger.info(f"Deleted credentials for provider: {provider}")
+        return True
     
     def list_providers(self) -> list:
         """List all providers with saved credentials.
@@ -152,4 +389,17 @@ class CredentialsManager:
         Returns:
             List of provider names
         """
-        return list(self._credentials_cache.keys())
+        with self._lock:
+            if not self._all_loaded:
+                # Provider names are only stored inside the encrypted files
+                for path in self.storage_path.glob("*.bin"):
+                    try:
+                        credentials = self._read_credentials_file(path)
+                    except Exception as e:
+                        logger.error(f"Error loading credentials: {str(e)}")
+                        continue
+                    for provider, value in credentials.items():
+                        self._credentials_cache.setdefault(provider, value)
+                self._all_loaded = True
+            
+            return [provider for provider, value in self._credentials_cache.items() if value is not None]
@@ -11,11 +11,22 @@ Usage:
   python credential_validator.py --provider vercel --token TOKEN
   python credential_validator.py --provider shared-hosting --host HOST --username USER --password PASS --protocol ftp
   python credential_validator.py --provider hostm --api-key API_KEY
+  python credential_validator.py --batch batch.json
+
+A batch file holds a JSON list of objects, each with a "provider" and the
+same credential fields as the options above (e.g. "key", "api_key"), plus an
+optional unique "id". All entries are validated concurrently.
 """
 
 import argparse
+import ftplib
+import http.client
 import logging
 import sys
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
 
 # Configure logging
 logging.basicConfig(
@@ -24,6 +35,48 @@ logging.basicConfig(
 )
 logger = logging.getLogger("credential-validator")
 
+# Seconds to wait for a provider API before giving up
+HTTP_TIMEOUT = 5
+
+# Seconds to wait for an FTP or SFTP server to connect and respond
+CONNECT_TIMEOUT = 5
+
+# Keep-alive HTTPS connections, one per host for each thread
+_connections = threading.local()
+
+def _api_status(host: str, path: str, token: str) -> int:
+    """Send an authenticated GET request to a provider API.
+    
+    Connections are kept alive and reused, so validating several
+    credentials against the same API pays for the TCP and TLS handshake
+    once per thread.
+    
+    Args:
+        host: API host name
+        path: Request path
+        token: Bearer token
+        
+    Returns:
+        HTTP status code of the response
+    """
+    pool = _connections.__dict__
+    headers = {"Authorization": f"Bearer {token}"}
+    for attempt in range(2):
+        connection = pool.get(host)
+        if connection is None:
+            connection = pool[host] = http.client.HTTPSConnection(host, timeout=HTTP_TIMEOUT)
+        try:
+            connection.request("GET", path, headers=headers)
+            response = connection.getresponse()
+            response.read()
+            return response.status
+        except (http.client.HTTPException, OSError):
+            # The server may have closed an idle connection; retry once on a new one
+            connection.close()
+            del pool[host]
+            if attempt:
+                raise
+
 def validate_netlify(api_key: str) -> bool:
     """Validate Netlify API key.
     
@@ -34,8 +87,11 @@ def validate_netlify(api_key: str) -> bool:
         True if valid, False otherwise
     """
     logger.info("Validating Netlify API key...")
-    # Implementation to be completed
-    return False
+    try:
+        return _api_status("api.netlify.com", "/api/v1/user", api_key) == 200
+    except (http.client.HTTPException, OSError) as e:
+        logger.error(f"Could not reach Netlify: {str(e)}")
+        return False
 
 def validate_vercel(token: str) -> bool:
     """Validate Vercel token.
@@ -47,8 +103,11 @@ def validate_vercel(token: str) -> bool:
         True if valid, False otherwise
     """
     logger.info("Validating Vercel token...")
-    # Implementation to be completed
-    return False
+    try:
+        return _api_status("api.vercel.com", "/v2/user", token) == 200
+    except (http.client.HTTPException, OSError) as e:
+        logger.error(f"Could not reach Vercel: {str(e)}")
+        return False
 
 def validate_shared_hosting(host: str, username: str, password: str, protocol: str = "ftp") -> bool:
     """Validate shared hosting credentials.
@@ -63,8 +122,34 @@ def validate_shared_hosting(host: str, username: str, password: str, protocol: s
         True if valid, False otherwise
     """
     logger.info(f"Validating shared hosting credentials for {host} using {protocol}...")
-    # Implementation to be completed
-    return False
+    try:
+        if protocol == "sftp":
+            # Imported here so FTP-only validation skips loading paramiko
+            import paramiko
+            
+            client = paramiko.SSHClient()
+            client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+            try:
+                client.connect(
+                    host,
+                    username=username,
+                    password=password,
+                    timeout=CONNECT_TIMEOUT,
+                    banner_timeout=CONNECT_TIMEOUT,
+                    auth_timeout=CONNECT_TIMEOUT,
+                    look_for_keys=False,
+                    allow_agent=False
+                )
+                client.open_sftp().close()
+            finally:
+                client.close()
+        else:
+            with ftplib.FTP(host, timeout=CONNECT_TIMEOUT) as ftp:
+                ftp.login(username, password)
+        return True
+    except Exception as e:
+        logger.error(f"Could not log in to {host}: {str(e)}")
+        return False
 
 def validate_hostm(api_key: str) -> bool:
     """Validate Hostm.com API key.
@@ -76,17 +161,102 @@ def validate_hostm(api_key: str) -> bool:
         True if valid, False otherwise
     """
     logger.info("Validating Hostm.com API key...")
-    # Implementation to be completed
-    return False
+    try:
+        return _api_status("api.hostm.com", "/v1/account", api_key) == 200
+    except (http.client.HTTPException, OSError) as e:
+        logger.error(f"Could not reach Hostm.com: {str(e)}")
+        return False
+
+# Provider -> (display name, required credential fields, validator taking
+# an object with those fields as attributes)
+VALIDATORS = {
+    "netlify": ("Netlify", ("key",), lambda a: validate_netlify(a.key)),
+    "vercel": ("Vercel", ("token",), lambda a: validate_vercel(a.token)),
+    "shared-hosting": (
+        "shared hosting",
+        ("host", "username", "password"),
+        lambda a: validate_shared_hosting(a.host, a.username, a.password, a.protocol)
+    ),
+    "hostm": ("Hostm.com", ("api_key",), lambda a: validate_hostm(a.api_key)),
+}
+
+# Maximum number of validations run at once in batch mode
+BATCH_WORKERS = 16
+
+def missing_fields(provider: str, fields) -> List[str]:
+    """List the required credential fields a provider is missing.
+    
+    Args:
+        provider: Provider name
+        fields: Object with credential fields as attributes
+        
+    Returns:
+        Names of the missing fields
+    """
+    return [name for name in VALIDATORS[provider][1] if not getattr(fields, name, None)]
+
+def validate_entry(entry: Dict) -> bool:
+    """Validate one batch entry.
+    
+    Args:
+        entry: Provider name and credential fields
+        
+    Returns:
+        True if valid, False otherwise
+    """
+    provider = entry.get("provider")
+    if provider not in VALIDATORS:
+        raise ValueError(f"Unsupported provider: {provider}")
+    
+    fields = argparse.Namespace(**{"protocol": "ftp", **entry})
+    missing = missing_fields(provider, fields)
+    if missing:
+        raise ValueError(f"Missing {', '.join(missing)}")
+    return VALIDATORS[provider][2](fields)
+
+def validate_batch(entries: List[Dict]) -> Dict[str, bool]:
+    """Validate many sets of credentials concurrently.
+    
+    Validation is network-bound, so the entries are spread over a thread pool.
+    An entry that is malformed or raises counts as invalid.
+    
+    Args:
+        entries: Batch entries, as accepted by validate_entry
+        
+    Returns:
+        Validation result keyed by entry id (the entry index by default)
+        
+    Raises:
+        ValueError: If two entries have the same id
+    """
+    entry_ids = [str(entry.get("id", index)) for index, entry in enumerate(entries)]
+    duplicates = sorted(entry_id for entry_id, count in Counter(entry_ids).items() if count > 1)
+    if duplicates:
+        raise ValueError(f"Duplicate entry ids: {', '.join(duplicates)}")
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(BATCH_WORKERS, len(entries)))) as executor:
+        futures = [executor.submit(validate_entry, entry) for entry in entries]
+    
+    results = {}
+    for entry_id, future in zip(entry_ids, futures):
+        try:
+            results[entry_id] = future.result()
+        except Exception as e:
+            logger.error(f"Entry {entry_id} could not be validated: {str(e)}")
+            results[entry_id] = False
+    return results
 
 def main():
     parser = argparse.ArgumentParser(description="Credential Validator for Arc MCP Server")
     
     # Provider selection
-    parser.add_argument("--provider", required=True,
-                        choices=["netlify", "vercel", "shared-hosting", "hostm"],
+    parser.add_argument("--provider",
+                        choices=list(VALIDATORS),
                         help="Hosting provider")
     
+    # Batch file
+    parser.add_argument("--batch", help="Path to a JSON file of credentials to validate together")
+    
     # Netlify credentials
     parser.add_argument("--key", help="Netlify API key")
     
@@ -105,34 +275,38 @@ def main():
     
     args = parser.parse_args()
     
-    # Validate credentials based on provider
-    if args.provider == "netlify":
-        if not args.key:
-            parser.error("--key is required for Netlify")
+    if args.batch:
+        import json
+        try:
+            with open(args.batch, "r") as f:
+                entries = json.load(f)
+        except Exception as e:
+            logger.error(f"Error reading batch file: {str(e)}")
+            return 1
         
-        valid = validate_netlify(args.key)
+        try:
+            results = validate_batch(entries)
+        except ValueError as e:
+            logger.error(f"Invalid batch file: {str(e)}")
+            return 1
+        for entry_id, valid in results.items():
+            if valid:
+                logger.info(f"{entry_id}: credentials validated successfully")
+            else:
+                logger.error(f"{entry_id}: credential validation failed")
+        return 0 if all(results.values()) else 1
     
-    elif args.provider == "vercel":
-        if not args.token:
-            parser.error("--token is required for Vercel")
-        
-        valid = validate_vercel(args.token)
+    if not args.provider:
+        parser.error("--provider or --batch is required")
     
-    elif args.provider == "shared-hosting":
-        if not all([args.host, args.username, args.password]):
-            parser.error("--host, --username, and --password are required for shared hosting")
-        
-        valid = validate_shared_hosting(args.host, args.username, args.password, args.protocol)
-    
-    elif args.provider == "hostm":
-        if not args.api_key:
-            parser.error("--api-key is required for Hostm.com")
-        
-        valid = validate_hostm(args.api_key)
+    # Validate credentials based on provider
+    display_name, _, validator = VALIDATORS[args.provider]
+    missing = missing_fields(args.provider, args)
+    if missing:
+        options = ", ".join("--" + name.replace("_", "-") for name in missing)
+        parser.error(f"{options} required for {display_name}")
     
-    else:
-        parser.error(f"Unsupported provider: {args.provider}")
-        return 1
+    valid = validator(args)
     
     # Print result
     if valid:
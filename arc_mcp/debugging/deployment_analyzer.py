@@ -13,10 +13,13 @@ Usage:
 """
 
 import argparse
-import json
 import logging
+import mmap
+import os
+import re
 import sys
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Pattern, Tuple, Union
 
 # Configure logging
 logging.basicConfig(
@@ -25,95 +28,268 @@ logging.basicConfig(
 )
 logger = logging.getLogger("deployment-analyzer")
 
+@lru_cache(maxsize=None)
+def _compile_issue_patterns(patterns: Tuple[Tuple[str, str], ...], binary: bool = False) -> Pattern:
+    """Compile issue patterns into one alternation with a named group per issue.
+    
+    Args:
+        patterns: Pairs of issue ID and regular expression
+        binary: Compile a bytes pattern, for scanning bytes-like logs
+        
+    Returns:
+        Compiled pattern whose lastgroup names the matched issue
+    """
+    alternation = "|".join(f"(?P<{issue_id}>{pattern})" for issue_id, pattern in patterns)
+    return re.compile(
+        alternation.encode() if binary else alternation,
+        re.IGNORECASE | re.MULTILINE
+    )
+
 class IssueDetector:
-    """Base class for issue detectors."""
+    """Base class for issue detectors.
+    
+    Subclasses list the regular expression for each issue in PATTERNS and
+    its details in ISSUES. All patterns are compiled into a single
+    alternation, so the logs are scanned once however many issues there are.
+    """
+    
+    # Issue ID -> regular expression matching it in the logs
+    PATTERNS: Dict[str, str] = {}
+    
+    # Issue ID -> type, severity, message and solution
+    ISSUES: Dict[str, Dict[str, str]] = {}
     
     def __init__(self, name: str):
         self.name = name
     
-    def analyze(self, logs: str) -> List[Dict]:
+    def analyze(self, logs: Union[str, bytes, mmap.mmap]) -> List[Dict]:
         """Analyze logs to detect issues.
         
+        Each issue is reported once, with the first log text that matched it.
+        Bytes-like logs, such as a memory-mapped file, are scanned without
+        being decoded; only the matched text is.
+        
         Args:
-            logs: Deployment logs
+            logs: Deployment logs, as text or a bytes-like buffer
             
         Returns:
             List of detected issues
         """
-        return []
+        if not self.PATTERNS:
+            return []
+        
+        binary = not isinstance(logs, str)
+        pattern = _compile_issue_patterns(tuple(self.PATTERNS.items()), binary)
+        
+        issues = {}
+        for match in pattern.finditer(logs):
+            issue_id = match.lastgroup
+            if issue_id in issues:
+                continue
+            text = match.group(0)
+            if binary:
+                text = text.decode("utf-8", errors="replace")
+            issues[issue_id] = {"id": issue_id, **self.ISSUES[issue_id], "match": text}
+            if len(issues) == len(self.PATTERNS):
+                break
+        return list(issues.values())
 
 class NetlifyIssueDetector(IssueDetector):
     """Issue detector for Netlify deployments."""
     
+    PATTERNS = {
+        "netlify_auth": r"Unauthorized|Access Denied: Bad access token|invalid access token",
+        "netlify_build_command": r"Build script returned non-zero exit code|Command failed with exit code \d+",
+        "netlify_publish_dir": r"Deploy directory '[^']*' does not exist",
+        "netlify_missing_module": r"Cannot find module '[^']+'|Module not found",
+        "netlify_node_version": r"engine \"node\" is incompatible|Unsupported engine",
+    }
+    
+    ISSUES = {
+        "netlify_auth": {
+            "type": "authentication",
+            "severity": "high",
+            "message": "The Netlify API token was rejected",
+            "solution": "Create a new personal access token and authenticate again",
+        },
+        "netlify_build_command": {
+            "type": "build",
+            "severity": "high",
+            "message": "The build command failed",
+            "solution": "Run the build command locally and fix the reported errors",
+        },
+        "netlify_publish_dir": {
+            "type": "configuration",
+            "severity": "high",
+            "message": "The publish directory does not exist after the build",
+            "solution": "Check the publish directory in netlify.toml matches the build output",
+        },
+        "netlify_missing_module": {
+            "type": "dependencies",
+            "severity": "high",
+            "message": "A module could not be resolved during the build",
+            "solution": "Add the missing package to package.json dependencies",
+        },
+        "netlify_node_version": {
+            "type": "environment",
+            "severity": "medium",
+            "message": "The Node.js version does not satisfy a package's engine requirement",
+            "solution": "Set NODE_VERSION in the site environment or add an .nvmrc file",
+        },
+    }
+    
     def __init__(self):
         super().__init__("Netlify")
-    
-    def analyze(self, logs: str) -> List[Dict]:
-        """Analyze Netlify deployment logs.
-        
-        Args:
-            logs: Deployment logs
-            
-        Returns:
-            List of detected issues
-        """
-        # Implementation to be completed
-        return []
 
 class VercelIssueDetector(IssueDetector):
     """Issue detector for Vercel deployments."""
     
+    PATTERNS = {
+        "vercel_auth": r"The specified token is not valid|Error: Not authorized|invalid_token",
+        "vercel_build_failed": r"Error: Command \"[^\"]+\" exited with \d+",
+        "vercel_missing_module": r"Cannot find module '[^']+'|Module not found",
+        "vercel_function_size": r"exceeds the maximum size limit|Serverless Function has exceeded",
+        "vercel_env_missing": r"Environment Variable \"[^\"]+\" references Secret \"[^\"]+\", which does not exist",
+    }
+    
+    ISSUES = {
+        "vercel_auth": {
+            "type": "authentication",
+            "severity": "high",
+            "message": "The Vercel token was rejected",
+            "solution": "Create a new token in the Vercel dashboard and authenticate again",
+        },
+        "vercel_build_failed": {
+            "type": "build",
+            "severity": "high",
+            "message": "The build command failed",
+            "solution": "Run the build command locally and fix the reported errors",
+        },
+        "vercel_missing_module": {
+            "type": "dependencies",
+            "severity": "high",
+            "message": "A module could not be resolved during the build",
+            "solution": "Add the missing package to package.json dependencies",
+        },
+        "vercel_function_size": {
+            "type": "limits",
+            "severity": "high",
+            "message": "A serverless function exceeds the size limit",
+            "solution": "Trim function dependencies or move large assets to static files",
+        },
+        "vercel_env_missing": {
+            "type": "configuration",
+            "severity": "medium",
+            "message": "An environment variable references a secret that does not exist",
+            "solution": "Create the secret or update the variable in the project settings",
+        },
+    }
+    
     def __init__(self):
         super().__init__("Vercel")
-    
-    def analyze(self, logs: str) -> List[Dict]:
-        """Analyze Vercel deployment logs.
-        
-        Args:
-            logs: Deployment logs
-            
-        Returns:
-            List of detected issues
-        """
-        # Implementation to be completed
-        return []
 
 class SharedHostingIssueDetector(IssueDetector):
     """Issue detector for shared hosting deployments."""
     
+    PATTERNS = {
+        "shared_login": r"530 Login incorrect|530 Login authentication failed|Authentication failed",
+        "shared_permission": r"550 Permission denied|553 Could not create file|Permission denied",
+        "shared_connection_limit": r"421 Too many connections",
+        "shared_timeout": r"Connection timed out|timed out",
+        "shared_quota": r"552 Disk quota exceeded|Disk quota exceeded|No space left on device",
+        "shared_host_key": r"Host key verification failed|not found in known_hosts",
+    }
+    
+    ISSUES = {
+        "shared_login": {
+            "type": "authentication",
+            "severity": "high",
+            "message": "The server rejected the username or password",
+            "solution": "Check the account credentials in your hosting control panel",
+        },
+        "shared_permission": {
+            "type": "permissions",
+            "severity": "high",
+            "message": "The account cannot write to the destination directory",
+            "solution": "Check the destination path and its permissions on the server",
+        },
+        "shared_connection_limit": {
+            "type": "limits",
+            "severity": "medium",
+            "message": "The server limits the number of simultaneous connections",
+            "solution": "Lower the parallel upload setting in the deployment config",
+        },
+        "shared_timeout": {
+            "type": "connection",
+            "severity": "medium",
+            "message": "The connection to the server timed out",
+            "solution": "Check the hostname and port, and that the server accepts connections",
+        },
+        "shared_quota": {
+            "type": "limits",
+            "severity": "high",
+            "message": "The hosting account is out of disk space",
+            "solution": "Remove old files or backups, or upgrade the hosting plan",
+        },
+        "shared_host_key": {
+            "type": "security",
+            "severity": "medium",
+            "message": "The server's SSH host key could not be verified",
+            "solution": "Confirm the host key fingerprint with your hosting provider",
+        },
+    }
+    
     def __init__(self, protocol: str = "ftp"):
         super().__init__("Shared Hosting")
         self.protocol = protocol
-    
-    def analyze(self, logs: str) -> List[Dict]:
-        """Analyze shared hosting deployment logs.
-        
-        Args:
-            logs: Deployment logs
-            
-        Returns:
-            List of detected issues
-        """
-        # Implementation to be completed
-        return []
 
 class HostmIssueDetector(IssueDetector):
     """Issue detector for Hostm.com deployments."""
     
+    PATTERNS = {
+        "hostm_auth": r"401 Unauthorized|Invalid API key",
+        "hostm_rate_limit": r"429 Too Many Requests|rate limit",
+        "hostm_quota": r"Disk quota exceeded|storage limit",
+        "hostm_server_error": r"50[234] (?:Bad Gateway|Service Unavailable|Gateway Timeout)",
+    }
+    
+    ISSUES = {
+        "hostm_auth": {
+            "type": "authentication",
+            "severity": "high",
+            "message": "The Hostm.com API key was rejected",
+            "solution": "Generate a new API key in the Hostm.com dashboard and authenticate again",
+        },
+        "hostm_rate_limit": {
+            "type": "limits",
+            "severity": "medium",
+            "message": "Requests to the Hostm.com API were rate limited",
+            "solution": "Wait a minute before deploying again",
+        },
+        "hostm_quota": {
+            "type": "limits",
+            "severity": "high",
+            "message": "The Hostm.com account is out of storage",
+            "solution": "Remove unused files or upgrade the hosting plan",
+        },
+        "hostm_server_error": {
+            "type": "service",
+            "severity": "medium",
+            "message": "The Hostm.com API is temporarily unavailable",
+            "solution": "Retry the deployment later",
+        },
+    }
+    
     def __init__(self):
         super().__init__("Hostm.com")
-    
-    def analyze(self, logs: str) -> List[Dict]:
-        """Analyze Hostm.com deployment logs.
-        
-        Args:
-            logs: Deployment logs
-            
-        Returns:
-            List of detected issues
-        """
-        # Implementation to be completed
-        return []
+
+# Provider -> factory taking the shared hosting protocol
+DETECTORS = {
+    "netlify": lambda protocol: NetlifyIssueDetector(),
+    "vercel": lambda protocol: VercelIssueDetector(),
+    "shared-hosting": SharedHostingIssueDetector,
+    "hostm": lambda protocol: HostmIssueDetector(),
+}
 
 def get_detector(provider: str, protocol: str = "ftp") -> IssueDetector:
     """Get the appropriate issue detector for a provider.
@@ -125,23 +301,17 @@ def get_detector(provider: str, protocol: str = "ftp") -> IssueDetector:
     Returns:
         Issue detector instance
     """
-    if provider == "netlify":
-        return NetlifyIssueDetector()
-    elif provider == "vercel":
-        return VercelIssueDetector()
-    elif provider == "shared-hosting":
-        return SharedHostingIssueDetector(protocol)
-    elif provider == "hostm":
-        return HostmIssueDetector()
-    else:
+    factory = DETECTORS.get(provider)
+    if factory is None:
         raise ValueError(f"Unsupported provider: {provider}")
+    return factory(protocol)
 
-def analyze_logs(provider: str, logs: str, protocol: str = "ftp") -> List[Dict]:
+def analyze_logs(provider: str, logs: Union[str, bytes, mmap.mmap], protocol: str = "ftp") -> List[Dict]:
     """Analyze deployment logs for a provider.
     
     Args:
         provider: Provider name
-        logs: Deployment logs
+        logs: Deployment logs, as text or a bytes-like buffer
         protocol: Protocol for shared hosting
         
     Returns:
@@ -155,7 +325,7 @@ def main():
     
     # Provider selection
     parser.add_argument("--provider", required=True,
-                        choices=["netlify", "vercel", "shared-hosting", "hostm"],
+                        choices=list(DETECTORS),
                         help="Hosting provider")
     
     # Log file
@@ -172,19 +342,29 @@ def main():
     
     args = parser.parse_args()
     
-    # Read log file
+    # Map the log file rather than reading and decoding it all
     try:
-        with open(args.log_file, "r") as f:
-            logs = f.read()
+        with open(args.log_file, "rb") as f:
+            if os.fstat(f.fileno()).st_size:
+                logs = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    logs.madvise(mmap.MADV_SEQUENTIAL)
+            else:
+                logs = b""
     except Exception as e:
         logger.error(f"Error reading log file: {str(e)}")
         return 1
     
     # Analyze logs
-    issues = analyze_logs(args.provider, logs, args.protocol)
+    try:
+        issues = analyze_logs(args.provider, logs, args.protocol)
+    finally:
+        if isinstance(logs, mmap.mmap):
+            logs.close()
     
     # Output results
     if args.format == "json":
+        import json
         print(json.dumps(issues, indent=2))
     else:
         if not issues:
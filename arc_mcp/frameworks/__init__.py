@@ -1,24 +1,29 @@
 """Framework handlers for Arc MCP."""
 
+import importlib
 import logging
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, Optional, Sequence
 
 from arc_mcp.frameworks.base import FrameworkHandler
-from arc_mcp.frameworks.wasp import WaspFrameworkHandler
-# Import other framework handlers here as they are implemented
-# from arc_mcp.frameworks.nextjs import NextJSFrameworkHandler
-# from arc_mcp.frameworks.astro import AstroFrameworkHandler
 
 logger = logging.getLogger("arc-mcp.frameworks")
 
-# Registry of framework handlers
+# Registry of framework handlers as "module:Class" references, imported when
+# first requested
 _FRAMEWORK_HANDLERS = {
-    "wasp": WaspFrameworkHandler(),
+    "wasp": "arc_mcp.frameworks.wasp:WaspFrameworkHandler",
     # Add other frameworks as they are implemented
-    # "nextjs": NextJSFrameworkHandler(),
-    # "astro": AstroFrameworkHandler(),
+    # "nextjs": "arc_mcp.frameworks.nextjs:NextJSFrameworkHandler",
+    # "astro": "arc_mcp.frameworks.astro:AstroFrameworkHandler",
 }
 
+# Handler instances created so far, keyed by framework type
+_framework_instances: Dict[str, FrameworkHandler] = {}
+
+_SUPPORTED_FRAMEWORKS = tuple(_FRAMEWORK_HANDLERS)
+
+@lru_cache(maxsize=32)
 def get_framework_handler(framework_type: str) -> FrameworkHandler:
     """Get the appropriate framework handler for a framework type.
     
@@ -31,16 +36,23 @@ def get_framework_handler(framework_type: str) -> FrameworkHandler:
     Raises:
         ValueError: If the framework type is not supported
     """
-    handler = _FRAMEWORK_HANDLERS.get(framework_type.lower())
-    if not handler:
-        supported = ", ".join(_FRAMEWORK_HANDLERS.keys())
-        raise ValueError(f"Unsupported framework: {framework_type}. Supported frameworks: {supported}")
+    key = framework_type.lower()
+    handler = _framework_instances.get(key)
+    if handler is None:
+        target = _FRAMEWORK_HANDLERS.get(key)
+        if not target:
+            supported = ", ".join(_SUPPORTED_FRAMEWORKS)
+            raise ValueError(f"Unsupported framework: {framework_type}. Supported frameworks: {supported}")
+        
+        module_name, class_name = target.split(":")
+        handler = getattr(importlib.import_module(module_name), class_name)()
+        _framework_instances[key] = handler
     return handler
 
-def list_supported_frameworks() -> List[str]:
-    """Get a list of supported framework types.
+def list_supported_frameworks() -> Sequence[str]:
+    """Get the supported framework types.
     
     Returns:
-        List of supported framework types
+        Tuple of supported framework types
     """
-    return list(_FRAMEWORK_HANDLERS.keys())
+    return _SUPPORTED_FRAMEWORKS
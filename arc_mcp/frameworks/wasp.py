@@ -1,18 +1,198 @@
 """Wasp framework handler for Arc MCP."""
 
 import asyncio
+import hashlib
+import json
 import logging
+import mmap
 import os
-import shutil
-import subprocess
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional
 
 from arc_mcp.frameworks.base import FrameworkHandler
+from arc_mcp.providers.base import run_streaming
 
 logger = logging.getLogger("arc-mcp.frameworks.wasp")
 
+# Directories that never hold Wasp sources and are skipped when
+# fingerprinting a project
+_FINGERPRINT_SKIP_DIRS = frozenset({".wasp", ".build", ".git", "node_modules"})
+
+# Provider configuration files written after each build
+_FINGERPRINT_SKIP_FILES = frozenset({"netlify.toml", "vercel.json"})
+
+# Project entries checked by validate_project
+_VALIDATED_ENTRIES = frozenset({"main.wasp", "package.json", "node_modules"})
+
+# Provider configuration written into the project; it never depends on the
+# project, so it is serialized once at import time
+_NETLIFY_TOML_BYTES = b"""
+[build]
+  publish = ".wasp/build/web/app"
+  command = "cd .wasp && npm install && npm run build"
+
+[functions]
+  directory = ".wasp/build/server/src/server"
+
+[[redirects]]
+  from = "/api/*"
+  to = "/.netlify/functions/server/:splat"
+  status = 200
+"""
+
+_VERCEL_CONFIG = {
+    "version": 2,
+    "builds": [
+        {
+            "src": ".wasp/build/web/app",
+            "use": "@vercel/static"
+        },
+        {
+            "src": ".wasp/build/server/src/server/index.js",
+            "use": "@vercel/node"
+        }
+    ],
+    "routes": [
+        {
+            "src": "/api/(.*)",
+            "dest": "/.wasp/build/server/src/server/index.js"
+        },
+        {
+            "src": "/(.*)",
+            "dest": "/.wasp/build/web/app/$1"
+        }
+    ]
+}
+
+_VERCEL_JSON_BYTES = json.dumps(_VERCEL_CONFIG, indent=2).encode()
+
+def _write_config(path: str, *chunks: bytes):
+    """Write a configuration file in place.
+    
+    The chunks are written with one vectored write where os.writev is
+    available (it is not on Windows).
+    
+    Args:
+        path: Path of the file to write
+        chunks: File contents, in order
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if not hasattr(os, "writev"):
+            chunks = (b"".join(chunks),)
+        
+        views = [memoryview(chunk) for chunk in chunks if chunk]
+        while views:
+            if hasattr(os, "writev"):
+                written = os.writev(fd, views)
+            else:
+                written = os.write(fd, views[0])
+            
+            # Drop what was written, which may end mid-chunk
+            while views and written >= len(views[0]):
+                written -= len(views.pop(0))
+            if views:
+                views[0] = views[0][written:]
+    finally:
+        os.close(fd)
+
+@lru_cache(maxsize=128)
+def _has_app_declaration(main_wasp_path: str, mtime_ns: int) -> bool:
+    """Check main.wasp for an app declaration.
+    
+    Results are cached per modification time. A failed read raises and so
+    is never cached, as it may be transient (e.g. permissions fixed without
+    touching the file).
+    
+    Args:
+        main_wasp_path: Path to main.wasp
+        mtime_ns: Modification time of main.wasp
+        
+    Returns:
+        True if the file declares an app
+    """
+    # Searched in the mapped file rather than a decoded copy (mmap rejects
+    # empty files)
+    with open(main_wasp_path, "rb") as f:
+        if not os.fstat(f.fileno()).st_size:
+            return False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            return content.find(b"app ") != -1
+
+def _validate_project(path: str, main_wasp_mtime: Optional[int], missing: FrozenSet[str]) -> Dict:
+    """Validate a Wasp project.
+    
+    Args:
+        path: Path to the project
+        main_wasp_mtime: Modification time of main.wasp, None if it is missing
+        missing: Names from _VALIDATED_ENTRIES that are not in the project
+        
+    Returns:
+        Validation result with status and issues
+    """
+    issues = []
+    
+    # Check if main.wasp exists
+    main_wasp_path = os.path.join(path, "main.wasp")
+    if main_wasp_mtime is None:
+        issues.append({
+            "type": "missing_file",
+            "message": "main.wasp file is missing",
+            "path": main_wasp_path
+        })
+    
+    # Check if package.json exists
+    package_json_path = os.path.join(path, "package.json")
+    if "package.json" in missing:
+        issues.append({
+            "type": "missing_file",
+            "message": "package.json file is missing",
+            "path": package_json_path
+        })
+    
+    # Check for node_modules directory
+    node_modules_path = os.path.join(path, "node_modules")
+    if "node_modules" in missing:
+        issues.append({
+            "type": "missing_directory",
+            "message": "node_modules directory is missing, run 'npm install' first",
+            "path": node_modules_path
+        })
+    
+    # Validate main.wasp syntax (basic check)
+    if main_wasp_mtime is not None:
+        try:
+            # Basic check for app declaration
+            if not _has_app_declaration(main_wasp_path, main_wasp_mtime):
+                issues.append({
+                    "type": "syntax_error",
+                    "message": "Missing app declaration in main.wasp",
+                    "path": main_wasp_path
+                })
+        except Exception as e:
+            issues.append({
+                "type": "read_error",
+                "message": f"Error reading main.wasp: {str(e)}",
+                "path": main_wasp_path
+            })
+    
+    return {
+        "valid": len(issues) == 0,
+        "issues": issues
+    }
+
 class WaspFrameworkHandler(FrameworkHandler):
-    """Handler for Wasp framework projects."""
+    """Handler for Wasp framework projects.
+    
+    Builds are reused while a project's sources are unchanged, and concurrent
+    deployments of the same project share one build.
+    """
+    
+    def __init__(self):
+        # Source fingerprint of each project at its last successful build
+        self._built_fingerprints: Dict[str, str] = {}
+        # Builds in progress, keyed by project path
+        self._builds: Dict[str, asyncio.Task] = {}
     
     async def prepare_for_deployment(self, path: str, provider: str, options: Dict) -> str:
         """Prepare a Wasp project for deployment.
@@ -33,92 +213,136 @@ class WaspFrameworkHandler(FrameworkHandler):
             issues_str = ", ".join([issue["message"] for issue in validation["issues"]])
             raise ValueError(f"Invalid Wasp project: {issues_str}")
         
-        # Build the project
-        build_path = os.path.join(path, ".build")
-        os.makedirs(build_path, exist_ok=True)
-        
         try:
-            # Run wasp build
-            logger.info("Building Wasp project...")
-            build_cmd = ["wasp", "build"]
-            
-            process = await asyncio.create_subprocess_exec(
-                *build_cmd,
-                cwd=path,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            
-            stdout, stderr = await process.communicate()
-            
-            if process.returncode != 0:
-                logger.error(f"Build failed: {stderr.decode()}")
-                raise RuntimeError(f"Failed to build Wasp project: {stderr.decode()}")
-            
-            logger.info("Build completed successfully")
+            # Build the project; wasp writes its output to .wasp/build
+            await self._build(path)
+            build_path = os.path.join(path, ".wasp", "build")
             
             # Modify configuration for provider if needed
             if provider == "netlify":
-                self._prepare_for_netlify(path, build_path, options)
+                await self._prepare_for_netlify(path, build_path, options)
             elif provider == "vercel":
-                self._prepare_for_vercel(path, build_path, options)
+                await self._prepare_for_vercel(path, build_path, options)
             
             return build_path
         except Exception as e:
             logger.error(f"Error preparing Wasp project: {str(e)}")
             raise
     
-    def _prepare_for_netlify(self, project_path: str, build_path: str, options: Dict):
+    async def _build(self, path: str):
+        """Build a Wasp project unless its last build is still current.
+        
+        Args:
+            path: Path to the Wasp project
+        """
+        fingerprint = await asyncio.to_thread(self._source_fingerprint, path)
+        if (self._built_fingerprints.get(path) == fingerprint
+                and os.path.isdir(os.path.join(path, ".wasp", "build"))):
+            logger.info("Wasp sources unchanged since the last build, reusing it")
+            return
+        
+        # Join a build of the same project that is already running; if it
+        # started from older sources than ours, build once more afterwards.
+        # The build is shielded so a cancelled caller does not cancel it for
+        # the others waiting on it.
+        joined = self._running_build(path) is not None
+        built = await asyncio.shield(self._start_build(path))
+        self._built_fingerprints[path] = built
+        if joined and built != fingerprint:
+            self._built_fingerprints[path] = await asyncio.shield(self._start_build(path))
+    
+    def _running_build(self, path: str) -> Optional[asyncio.Task]:
+        """Get the unfinished build of a project, if any."""
+        build = self._builds.get(path)
+        return build if build is not None and not build.done() else None
+    
+    def _start_build(self, path: str) -> asyncio.Task:
+        """Get the running build of a project, starting one if there is none.
+        
+        Args:
+            path: Path to the Wasp project
+            
+        Returns:
+            Task resolving to the source fingerprint the build started from
+        """
+        build = self._running_build(path)
+        if build is None:
+            build = asyncio.ensure_future(self._run_wasp_build(path))
+            self._builds[path] = build
+            build.add_done_callback(
+                lambda task: self._builds.pop(path, None) if self._builds.get(path) is task else None
+            )
+        return build
+    
+    async def _run_wasp_build(self, path: str) -> str:
+        """Run wasp build in a project.
+        
+        Args:
+            path: Path to the Wasp project
+            
+        Returns:
+            Source fingerprint taken just before the build started
+        """
+        fingerprint = await asyncio.to_thread(self._source_fingerprint, path)
+        logger.info("Building Wasp project...")
+        
+        # Log output as it arrives; only the tail of stderr is kept for the
+        # error message, and the build is killed if reading it fails
+        returncode, _, stderr = await run_streaming(
+            ["wasp", "build"],
+            on_line=lambda line: logger.debug(line.decode(errors="replace").rstrip()),
+            cwd=path
+        )
+        
+        if returncode != 0:
+            logger.error(f"Build failed: {stderr}")
+            raise RuntimeError(f"Failed to build Wasp project: {stderr}")
+        
+        logger.info("Build completed successfully")
+        return fingerprint
+    
+    def _source_fingerprint(self, path: str) -> str:
+        """Summarize the state of a project's sources.
+        
+        Hashes every source file's path, size and modification time, so
+        renames and files restored with older timestamps change it too.
+        
+        Args:
+            path: Path to the Wasp project
+            
+        Returns:
+            Hex digest of the source file metadata
+        """
+        files = []
+        stack = [path]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _FINGERPRINT_SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name not in _FINGERPRINT_SKIP_FILES:
+                        stat = entry.stat(follow_symlinks=False)
+                        files.append(f"{entry.path}\0{stat.st_size}\0{stat.st_mtime_ns}\n")
+        
+        digest = hashlib.blake2b(digest_size=16)
+        for line in sorted(files):
+            digest.update(line.encode("utf-8", "surrogateescape"))
+        return digest.hexdigest()
+    
+    async def _prepare_for_netlify(self, project_path: str, build_path: str, options: Dict):
         """Prepare a Wasp project for Netlify deployment."""
-        # Create netlify.toml configuration
-        netlify_config = f"""
-[build]
-  publish = ".wasp/build/web/app"
-  command = "cd .wasp && npm install && npm run build"
-
-[functions]
-  directory = ".wasp/build/server/src/server"
-
-[[redirects]]
-  from = "/api/*"
-  to = "/.netlify/functions/server/:splat"
-  status = 200
-"""
-        with open(os.path.join(project_path, "netlify.toml"), "w") as f:
-            f.write(netlify_config)
+        await asyncio.to_thread(
+            _write_config, os.path.join(project_path, "netlify.toml"), _NETLIFY_TOML_BYTES
+        )
         
         logger.info("Created netlify.toml configuration")
     
-    def _prepare_for_vercel(self, project_path: str, build_path: str, options: Dict):
+    async def _prepare_for_vercel(self, project_path: str, build_path: str, options: Dict):
         """Prepare a Wasp project for Vercel deployment."""
-        # Create vercel.json configuration
-        vercel_config = {
-            "version": 2,
-            "builds": [
-                {
-                    "src": ".wasp/build/web/app",
-                    "use": "@vercel/static"
-                },
-                {
-                    "src": ".wasp/build/server/src/server/index.js",
-                    "use": "@vercel/node"
-                }
-            ],
-            "routes": [
-                {
-                    "src": "/api/(.*)",
-                    "dest": "/.wasp/build/server/src/server/index.js"
-                },
-                {
-                    "src": "/(.*)",
-                    "dest": "/.wasp/build/web/app/$1"
-                }
-            ]
-        }
-        
-        import json
-        with open(os.path.join(project_path, "vercel.json"), "w") as f:
-            json.dump(vercel_config, f, indent=2)
+        await asyncio.to_thread(
+            _write_config, os.path.join(project_path, "vercel.json"), _VERCEL_JSON_BYTES
+        )
         
         logger.info("Created vercel.json configuration")
     
@@ -184,62 +408,26 @@ class WaspFrameworkHandler(FrameworkHandler):
     def validate_project(self, path: str) -> Dict:
         """Validate a Wasp project.
         
+        The check of main.wasp is cached until the file changes.
+        
         Args:
             path: Path to the project
             
         Returns:
             Validation result with status and issues
         """
-        issues = []
-        
-        # Check if main.wasp exists
-        main_wasp_path = os.path.join(path, "main.wasp")
-        if not os.path.exists(main_wasp_path):
-            issues.append({
-                "type": "missing_file",
-                "message": "main.wasp file is missing",
-                "path": main_wasp_path
-            })
-        
-        # Check if package.json exists
-        package_json_path = os.path.join(path, "package.json")
-        if not os.path.exists(package_json_path):
-            issues.append({
-                "type": "missing_file",
-                "message": "package.json file is missing",
-                "path": package_json_path
-            })
-        
-        # Check for node_modules directory
-        node_modules_path = os.path.join(path, "node_modules")
-        if not os.path.exists(node_modules_path):
-            issues.append({
-                "type": "missing_directory",
-                "message": "node_modules directory is missing, run 'npm install' first",
-                "path": node_modules_path
-            })
+        # One directory read instead of a stat per expected entry
+        try:
+            with os.scandir(path) as it:
+                entries = {entry.name: entry for entry in it}
+        except OSError:
+            entries = {}
         
-        # Validate main.wasp syntax (basic check)
-        if os.path.exists(main_wasp_path):
-            try:
-                with open(main_wasp_path, "r") as f:
-                    content = f.read()
-                
-                # Basic check for app declaration
-                if "app " not in content:
-                    issues.append({
-                        "type": "syntax_error",
-                        "message": "Missing app declaration in main.wasp",
-                        "path": main_wasp_path
-                    })
-            except Exception as e:
-                issues.append({
-                    "type": "read_error",
-                    "message": f"Error reading main.wasp: {str(e)}",
-                    "path": main_wasp_path
-                })
+        # Only main.wasp is read, so it is the only entry whose mtime matters
+        main_wasp = entries.get("main.wasp")
+        try:
+            main_wasp_mtime = main_wasp.stat().st_mtime_ns if main_wasp else None
+        except OSError:
+            main_wasp_mtime = None
         
-        return {
-            "valid": len(issues) == 0,
-            "issues": issues
-        }
\ No newline at end of file
+        return _validate_project(path, main_wasp_mtime, _VALIDATED_ENTRIES.difference(entries))
@@ -1,24 +1,29 @@
 """Provider handlers for Arc MCP."""
 
+import importlib
 import logging
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, Optional, Sequence
 
 from arc_mcp.providers.base import ProviderHandler
-from arc_mcp.providers.netlify import NetlifyProviderHandler
-from arc_mcp.providers.vercel import VercelProviderHandler
-from arc_mcp.providers.shared_hosting import SharedHostingProviderHandler
-from arc_mcp.providers.hostm import HostmProviderHandler
 
 logger = logging.getLogger("arc-mcp.providers")
 
-# Registry of provider handlers
+# Registry of provider handlers as "module:Class" references. Handler modules
+# pull in aiohttp and friends, so each is imported when first requested.
 _PROVIDER_HANDLERS = {
-    "netlify": NetlifyProviderHandler(),
-    "vercel": VercelProviderHandler(),
-    "shared-hosting": SharedHostingProviderHandler(),
-    "hostm": HostmProviderHandler(),
+    "netlify": "arc_mcp.providers.netlify:NetlifyProviderHandler",
+    "vercel": "arc_mcp.providers.vercel:VercelProviderHandler",
+    "shared-hosting": "arc_mcp.providers.shared_hosting:SharedHostingProviderHandler",
+    "hostm": "arc_mcp.providers.hostm:HostmProviderHandler",
 }
 
+# Handler instances created so far, keyed by provider type
+_provider_instances: Dict[str, ProviderHandler] = {}
+
+_SUPPORTED_PROVIDERS = tuple(_PROVIDER_HANDLERS)
+
+@lru_cache(maxsize=32)
 def get_provider_handler(provider_type: str) -> ProviderHandler:
     """Get the appropriate provider handler for a provider type.
     
@@ -31,16 +36,23 @@ def get_provider_handler(provider_type: str) -> ProviderHandler:
     Raises:
         ValueError: If the provider type is not supported
     """
-    handler = _PROVIDER_HANDLERS.get(provider_type.lower())
-    if not handler:
-        supported = ", ".join(_PROVIDER_HANDLERS.keys())
-        raise ValueError(f"Unsupported provider: {provider_type}. Supported providers: {supported}")
+    key = provider_type.lower()
+    handler = _provider_instances.get(key)
+    if handler is None:
+        target = _PROVIDER_HANDLERS.get(key)
+        if not target:
+            supported = ", ".join(_SUPPORTED_PROVIDERS)
+            raise ValueError(f"Unsupported provider: {provider_type}. Supported providers: {supported}")
+        
+        module_name, class_name = target.split(":")
+        handler = getattr(importlib.import_module(module_name), class_name)()
+        _provider_instances[key] = handler
     return handler
 
-def list_supported_providers() -> List[str]:
-    """Get a list of supported provider types.
+def list_supported_providers() -> Sequence[str]:
+    """Get the supported provider types.
     
     Returns:
-        List of supported provider types
+        Tuple of supported provider types
     """
-    return list(_PROVIDER_HANDLERS.keys())
\ No newline at end of file
+    return _SUPPORTED_PROVIDERS
\ No newline at end of file
@@ -1,14 +1,231 @@
 """Base classes for provider handlers."""
 
+import asyncio
+import collections
+import functools
+import hashlib
+import json
 import logging
+import re
+import subprocess
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import AnyStr, Callable, Dict, List, Optional, Pattern, Tuple
 
 logger = logging.getLogger("arc-mcp.providers.base")
 
+# Threads running short CLI commands for run_cli
+_CLI_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="arc-mcp-cli")
+
+async def run_cli(cmd: List[str], **kwargs) -> subprocess.CompletedProcess:
+    """Run a short CLI command to completion without blocking the event loop.
+    
+    The command runs through subprocess.run on a shared thread pool rather
+    than the event loop's subprocess transport, which costs less for
+    commands whose output is only inspected once they exit.
+    
+    Args:
+        cmd: Command and arguments
+        **kwargs: Passed to subprocess.run, e.g. env
+        
+    Returns:
+        Completed process with captured stdout and stderr as bytes
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _CLI_POOL, functools.partial(subprocess.run, cmd, capture_output=True, **kwargs)
+    )
+
+# Lines of CLI output kept by run_streaming, and the longest line it reads
+OUTPUT_TAIL_LINES = 400
+_OUTPUT_LINE_LIMIT = 1024 * 1024
+
+async def run_streaming(
+    cmd: List[str],
+    on_line: Optional[Callable[[bytes], None]] = None,
+    **kwargs
+) -> Tuple[int, str, str]:
+    """Run a CLI command, reading its output while it runs.
+    
+    Output is read line by line as it arrives instead of being buffered
+    until the process exits. Lines are handed to on_line undecoded, and only
+    the last OUTPUT_TAIL_LINES lines of each stream are kept and decoded.
+    
+    Args:
+        cmd: Command and arguments
+        on_line: Called with each raw line of stdout as it is read
+        **kwargs: Passed to asyncio.create_subprocess_exec, e.g. cwd or env
+        
+    Returns:
+        Exit code, and the tails of stdout and stderr
+    """
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        limit=_OUTPUT_LINE_LIMIT,
+        **kwargs
+    )
+    
+    async def drain(stream: asyncio.StreamReader, tail: collections.deque, callback):
+        async for line in stream:
+            tail.append(line)
+            if callback is not None:
+                callback(line)
+    
+    stdout_tail = collections.deque(maxlen=OUTPUT_TAIL_LINES)
+    stderr_tail = collections.deque(maxlen=OUTPUT_TAIL_LINES)
+    try:
+        await asyncio.gather(
+            drain(process.stdout, stdout_tail, on_line),
+            drain(process.stderr, stderr_tail, None),
+            process.wait()
+        )
+    finally:
+        # Don't leave the CLI running if reading its output failed or the
+        # caller was cancelled
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+    return (
+        process.returncode,
+        b"".join(stdout_tail).decode(errors="replace"),
+        b"".join(stderr_tail).decode(errors="replace")
+    )
+
+def find_labeled_value(text: AnyStr, label: AnyStr, value_pattern: Pattern) -> AnyStr:
+    """Extract the value printed after a label in CLI output.
+    
+    The label is located with str.find, so the regular expression only runs
+    where the label occurs rather than at every position of the output. Text,
+    label and pattern may be str or bytes, as long as they all match.
+    
+    Args:
+        text: CLI output
+        label: Literal text preceding the value
+        value_pattern: Pattern matched right after the label, whose first
+            group is the value
+        
+    Returns:
+        Value after the first occurrence of the label that matches, or an
+        empty string of the same type as text
+    """
+    start = text.find(label)
+    while start != -1:
+        match = value_pattern.match(text, start + len(label))
+        if match:
+            return match.group(1)
+        start = text.find(label, start + 1)
+    return text[:0]
+
+# Known log messages starting with this prefix are found together in one
+# pass by a single alternation, which yields the text after the prefix
+_ERROR_PREFIX = "Error: "
+
+# Words that mark unrecognized logs as a failure, in any case
+_FAILURE_RE = re.compile(r"error|failed", re.IGNORECASE)
+
+@functools.lru_cache(maxsize=None)
+def _error_messages_re(keywords: Tuple[str, ...]) -> Tuple[Optional[Pattern], int]:
+    """Compile the alternation of the "Error: " messages among log keywords.
+    
+    Args:
+        keywords: Texts identifying the known log messages
+        
+    Returns:
+        Pattern whose first group is the text after the prefix (None if no
+        keyword has the prefix) and the number of distinct messages
+    """
+    messages = {keyword[len(_ERROR_PREFIX):] for keyword in keywords if keyword.startswith(_ERROR_PREFIX)}
+    if not messages:
+        return None, 0
+    pattern = re.compile("{}({})".format(
+        re.escape(_ERROR_PREFIX),
+        "|".join(re.escape(message) for message in sorted(messages, key=len, reverse=True))
+    ))
+    return pattern, len(messages)
+
+def find_log_issues(logs: str, log_issues: Tuple, unknown_issue: Dict) -> List[Dict]:
+    """Identify known messages in deployment logs.
+    
+    Args:
+        logs: Deployment logs
+        log_issues: Known messages as (keyword, pattern, issue) tuples: the
+            text that identifies the message, a pattern capturing its detail
+            for the "{}" in the issue message (or None), and the issue it
+            reports. The pattern only runs when the text is present.
+        unknown_issue: Issue reported when the logs show a failure but no
+            known message
+        
+    Returns:
+        Copies of the issues found, in table order
+    """
+    error_re, error_count = _error_messages_re(tuple(keyword for keyword, _, _ in log_issues))
+    errors = set()
+    if error_re is not None:
+        for match in error_re.finditer(logs):
+            errors.add(match.group(1))
+            if len(errors) == error_count:
+                break
+    
+    issues = []
+    for keyword, pattern, issue in log_issues:
+        if keyword.startswith(_ERROR_PREFIX):
+            present = keyword[len(_ERROR_PREFIX):] in errors
+        else:
+            present = keyword in logs
+        if not present:
+            continue
+    
+        issue = dict(issue)
+        if pattern is not None:
+            match = pattern.search(logs)
+            issue["message"] = issue["message"].format(match.group(1) if match else "Unknown build error")
+        issues.append(issue)
+    
+    # If no specific issues found but deployment failed
+    if not issues and _FAILURE_RE.search(logs):
+        issues.append(dict(unknown_issue))
+    
+    return issues
+
+# Expiry times of successful credential validations, keyed by a digest of
+# the handler class and credentials so no secret is kept in the clear
+_validated_credentials: Dict[str, float] = {}
+
 class ProviderHandler(ABC):
     """Base class for hosting provider deployment handlers."""
     
+    # Seconds a successful credential validation is trusted
+    CREDENTIALS_CACHE_TTL = 300
+    
+    def _credentials_digest(self, credentials: Dict[str, str]) -> str:
+        """Digest identifying credentials for this handler."""
+        payload = json.dumps([type(self).__name__, sorted(credentials.items())])
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+    
+    def _recently_validated(self, credentials: Dict[str, str]) -> bool:
+        """Check whether credentials passed validation within the cache TTL.
+        
+        Args:
+            credentials: Provider credentials
+            
+        Returns:
+            True if the credentials were validated recently
+        """
+        return time.monotonic() < _validated_credentials.get(self._credentials_digest(credentials), 0)
+    
+    def _remember_validated(self, credentials: Dict[str, str]):
+        """Record that credentials passed validation.
+        
+        Args:
+            credentials: Provider credentials
+        """
+        _validated_credentials[self._credentials_digest(credentials)] = (
+            time.monotonic() + self.CREDENTIALS_CACHE_TTL
+        )
+    
     @abstractmethod
     async def validate_credentials(self, credentials: Dict[str, str]) -> bool:
         """Validate provider credentials.
@@ -1,23 +1,147 @@
 """Hostm.com provider handler for Arc MCP."""
 
 import asyncio
-import json
+import atexit
 import logging
 import os
 import re
-import subprocess
+import shutil
 from typing import Dict, List, Optional
 import aiohttp
 
 from arc_mcp.providers.base import ProviderHandler
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger("arc-mcp.providers.hostm")
 
+# Known deployment log messages, reported as _HOSTM_LOG_ISSUES[N] for the
+# message at index N
+_HOSTM_LOG_MESSAGES = (
+    "API authentication failed",
+    "Site not found",
+    "Deployment failed",
+    "Quota exceeded",
+    "Invalid file format",
+)
+
+# Any other error, matched case-insensitively and reported with the last
+# issue in _HOSTM_LOG_ISSUES
+_HOSTM_UNKNOWN_RE = re.compile(r"error|failed", re.IGNORECASE)
+
+# Known messages, scanned for in a single pass. Group N reports
+# _HOSTM_LOG_ISSUES[N - 1].
+_HOSTM_LOG_RE = re.compile(
+    "|".join(f"({re.escape(message)})" for message in _HOSTM_LOG_MESSAGES)
+)
+
+def _build_log_automaton():
+    """Build an Aho-Corasick automaton matching the known log messages.
+    
+    Returns:
+        Automaton mapping each message to its index, or None if
+        pyahocorasick is not installed
+    """
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for index, message in enumerate(_HOSTM_LOG_MESSAGES):
+        automaton.add_word(message, index)
+    automaton.make_automaton()
+    return automaton
+
+_HOSTM_LOG_AUTOMATON = _build_log_automaton()
+
+_HOSTM_LOG_ISSUES = (
+    {
+        "id": "hostm_auth_error",
+        "type": "auth_error",
+        "message": "API authentication failed. Check your API key.",
+        "severity": "high"
+    },
+    {
+        "id": "hostm_site_not_found",
+        "type": "site_error",
+        "message": "Site not found. Verify the site ID.",
+        "severity": "high"
+    },
+    {
+        "id": "hostm_deployment_error",
+        "type": "deployment_error",
+        "message": "Deployment failed. Check the site configuration.",
+        "severity": "high"
+    },
+    {
+        "id": "hostm_quota_error",
+        "type": "quota_error",
+        "message": "Quota exceeded. Upgrade your plan or clean up existing files.",
+        "severity": "high"
+    },
+    {
+        "id": "hostm_file_format_error",
+        "type": "file_error",
+        "message": "Invalid file format. Ensure your deployment package is properly formatted.",
+        "severity": "medium"
+    },
+    {
+        "id": "hostm_unknown_error",
+        "type": "unknown_error",
+        "message": "Unknown error occurred during deployment. Check the logs for details.",
+        "severity": "medium"
+    }
+)
+
+# Bits of the specific issues in the mask built by analyze_logs, and the bit
+# of the catch-all issue
+_HOSTM_SPECIFIC_ISSUES = (1 << (len(_HOSTM_LOG_ISSUES) - 1)) - 1
+_HOSTM_UNKNOWN_ISSUE = 1 << (len(_HOSTM_LOG_ISSUES) - 1)
+
 class HostmProviderHandler(ProviderHandler):
     """Handler for Hostm.com hosting provider."""
     
     API_BASE_URL = "https://api.hostm.com/v1"
     
+    # Seconds a successful credential validation is trusted
+    CREDENTIALS_CACHE_TTL = 60
+    
+    # HTTP session shared by all API calls so keep-alive connections to the
+    # API are reused, and the event loop it belongs to
+    _client_session: Optional[aiohttp.ClientSession] = None
+    _client_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    @classmethod
+    async def _session(cls) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use.
+        
+        Returns:
+            Session bound to the running event loop
+        """
+        loop = asyncio.get_running_loop()
+        if cls._client_session is None or cls._client_session.closed or cls._client_loop is not loop:
+            if cls._client_session is None:
+                atexit.register(cls._close_session)
+            cls._client_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+            cls._client_loop = loop
+        return cls._client_session
+    
+    @classmethod
+    def _close_session(cls):
+        """Close the shared HTTP session at interpreter exit."""
+        session = cls._client_session
+        if session is None or session.closed:
+            return
+        try:
+            asyncio.run(session.close())
+        except Exception as e:
+            logger.debug(f"Error closing Hostm.com HTTP session: {str(e)}")
+    
     async def validate_credentials(self, credentials: Dict[str, str]) -> bool:
         """Validate Hostm.com API credentials.
         
@@ -32,20 +156,24 @@ class HostmProviderHandler(ProviderHandler):
             logger.error("Missing API key in Hostm.com credentials")
             return False
         
+        if self._recently_validated(credentials):
+            return True
+        
         try:
             # Test API key by making a call to the account endpoint
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.API_BASE_URL}/account",
-                    headers={"Authorization": f"Bearer {api_key}"}
-                ) as response:
-                    if response.status == 200:
-                        logger.info("Hostm.com credentials validated successfully")
-                        return True
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Hostm.com credential validation failed: {error_text}")
-                        return False
+            session = await self._session()
+            async with session.get(
+                f"{self.API_BASE_URL}/account",
+                headers={"Authorization": f"Bearer {api_key}"}
+            ) as response:
+                if response.status == 200:
+                    logger.info("Hostm.com credentials validated successfully")
+                    self._remember_validated(credentials)
+                    return True
+                else:
+                    error_text = await response.text()
+                    logger.error(f"Hostm.com credential validation failed: {error_text}")
+                    return False
         except Exception as e:
             logger.error(f"Error validating Hostm.com credentials: {str(e)}")
             return False
@@ -69,31 +197,34 @@ class HostmProviderHandler(ProviderHandler):
         if not site_id:
             raise ValueError("Missing site_id in deployment options")
         
-        # In a real implementation, this would:
-        # 1. Create a zip file of the project
-        # 2. Upload it via the Hostm.com API
-        # 3. Trigger deployment
-        
         try:
-            # For the sake of example, we'll simulate these steps
+            # Check the API key while the archive is built off the event
+            # loop, so a bad key fails before the upload at no extra latency
             logger.info(f"Creating zip archive of {path}")
             zip_path = f"{path}.zip"
-            
-            # Simulate creating a zip file
-            # In real code, we would use shutil.make_archive or similar
+            valid, _ = await asyncio.gather(
+                self.validate_credentials(credentials),
+                asyncio.to_thread(shutil.make_archive, path, "zip", path)
+            )
+            if not valid:
+                raise ValueError("Invalid Hostm.com credentials")
             
             logger.info(f"Uploading project to Hostm.com site ID: {site_id}")
+            session = await self._session()
             
-            # Simulate API call to upload and deploy
-            async with aiohttp.ClientSession() as session:
-                # Upload file
-                # In a real implementation, this would be a file upload
+            # Upload the archive and trigger deployment. aiohttp reads the
+            # open file in chunks in its executor, so the archive is never
+            # held in memory.
+            with open(zip_path, "rb") as archive, aiohttp.MultipartWriter("form-data") as writer:
+                part = writer.append("full")
+                part.set_content_disposition("form-data", name="deploymentType")
+                part = writer.append(archive, {"Content-Type": "application/zip"})
+                part.set_content_disposition("form-data", name="file", filename="build.zip")
                 
-                # Trigger deployment
                 async with session.post(
                     f"{self.API_BASE_URL}/sites/{site_id}/deploy",
                     headers={"Authorization": f"Bearer {api_key}"},
-                    json={"deploymentType": "full"}
+                    data=writer
                 ) as response:
                     if response.status not in (200, 201, 202):
                         error_text = await response.text()
@@ -128,55 +259,23 @@ class HostmProviderHandler(ProviderHandler):
         Returns:
             List of identified issues
         """
-        issues = []
-        
-        if "API authentication failed" in logs:
-            issues.append({
-                "id": "hostm_auth_error",
-                "type": "auth_error",
-                "message": "API authentication failed. Check your API key.",
-                "severity": "high"
-            })
-        
-        if "Site not found" in logs:
-            issues.append({
-                "id": "hostm_site_not_found",
-                "type": "site_error",
-                "message": "Site not found. Verify the site ID.",
-                "severity": "high"
-            })
-        
-        if "Deployment failed" in logs:
-            issues.append({
-                "id": "hostm_deployment_error",
-                "type": "deployment_error",
-                "message": "Deployment failed. Check the site configuration.",
-                "severity": "high"
-            })
-        
-        if "Quota exceeded" in logs:
-            issues.append({
-                "id": "hostm_quota_error",
-                "type": "quota_error",
-                "message": "Quota exceeded. Upgrade your plan or clean up existing files.",
-                "severity": "high"
-            })
+        # Scan for all known messages at once, then fall back to the
+        # catch-all only when none of them occur
+        found = 0
+        if _HOSTM_LOG_AUTOMATON is not None:
+            for _, index in _HOSTM_LOG_AUTOMATON.iter(logs):
+                found |= 1 << index
+                if found == _HOSTM_SPECIFIC_ISSUES:
+                    break
+        else:
+            for match in _HOSTM_LOG_RE.finditer(logs):
+                found |= 1 << (match.lastindex - 1)
+                if found == _HOSTM_SPECIFIC_ISSUES:
+                    break
         
-        if "Invalid file format" in logs:
-            issues.append({
-                "id": "hostm_file_format_error",
-                "type": "file_error",
-                "message": "Invalid file format. Ensure your deployment package is properly formatted.",
-                "severity": "medium"
-            })
+        if not found and _HOSTM_UNKNOWN_RE.search(logs):
+            found = _HOSTM_UNKNOWN_ISSUE
         
-        # If no specific issues found but deployment failed
-        if not issues and ("error" in logs.lower() or "failed" in logs.lower()):
-            issues.append({
-                "id": "hostm_unknown_error",
-                "type": "unknown_error",
-                "message": "Unknown error occurred during deployment. Check the logs for details.",
-                "severity": "medium"
-            })
+        issues = [dict(issue) for bit, issue in enumerate(_HOSTM_LOG_ISSUES) if found >> bit & 1]
         
         return issues
\ No newline at end of file
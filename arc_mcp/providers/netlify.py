@@ -1,17 +1,126 @@
 """Netlify provider handler for Arc MCP."""
 
-import asyncio
+import atexit
+import hashlib
 import json
 import logging
 import os
 import re
-import subprocess
-from typing import Dict, List, Optional
+import tempfile
+from typing import Dict, List
 
-from arc_mcp.providers.base import ProviderHandler
+from arc_mcp.providers.base import ProviderHandler, find_labeled_value, find_log_issues, run_cli, run_streaming
 
 logger = logging.getLogger("arc-mcp.providers.netlify")
 
+# Patterns matched against CLI output and deployment logs
+_LABELED_VALUE_RE = re.compile(rb"\s+(\S+)")
+_BUILD_ERROR_RE = re.compile(r"Build failed: (.*)")
+
+# Known deployment log messages, as find_log_issues takes them: the text
+# that identifies each one, a pattern capturing its detail for the "{}" in
+# the message (or None), and the issue it reports
+_LOG_ISSUES = (
+    (
+        "Error: Not authorized",
+        None,
+        {
+            "id": "netlify_auth_error",
+            "type": "auth_error",
+            "message": "Authentication failed. Please check your Netlify API key.",
+            "severity": "high"
+        }
+    ),
+    (
+        "Error: No such site",
+        None,
+        {
+            "id": "netlify_site_not_found",
+            "type": "site_error",
+            "message": "Site not found. Please check the site name or create a new site.",
+            "severity": "high"
+        }
+    ),
+    (
+        "Build failed",
+        _BUILD_ERROR_RE,
+        {
+            "id": "netlify_build_error",
+            "type": "build_error",
+            "message": "Build failed: {}",
+            "severity": "high"
+        }
+    ),
+    (
+        "Error: Build script returned non-zero exit code",
+        None,
+        {
+            "id": "netlify_build_script_error",
+            "type": "build_error",
+            "message": "Build script failed. Check your build command in netlify.toml.",
+            "severity": "high"
+        }
+    ),
+    (
+        "Deploy failed",
+        None,
+        {
+            "id": "netlify_deploy_error",
+            "type": "deployment_error",
+            "message": "Deployment failed. Check your Netlify site settings.",
+            "severity": "high"
+        }
+    )
+)
+
+# Issue reported when the logs show a failure but no known message
+_UNKNOWN_LOG_ISSUE = {
+    "id": "netlify_unknown_error",
+    "type": "unknown_error",
+    "message": "Unknown error occurred during deployment. Check the logs for details.",
+    "severity": "medium"
+}
+
+# Auth files handed to the Netlify CLI, keyed by a digest of their token
+_auth_files: Dict[str, str] = {}
+
+def _auth_file(api_key: str) -> str:
+    """Get the path of an auth.json file holding a Netlify token.
+    
+    Each token is written once per process to a private temporary file,
+    on tmpfs where available, and reused by later CLI calls. The files
+    are removed at exit.
+    
+    Args:
+        api_key: Netlify API key
+        
+    Returns:
+        Path to pass to the CLI as NETLIFY_AUTH_PATH
+    """
+    key = hashlib.blake2b(api_key.encode(), digest_size=16).hexdigest()
+    path = _auth_files.get(key)
+    if path and os.path.exists(path):
+        return path
+    
+    directory = "/dev/shm" if os.path.isdir("/dev/shm") else None
+    with tempfile.NamedTemporaryFile(
+        "w", prefix="netlify-auth-", suffix=".json", dir=directory, delete=False
+    ) as f:
+        json.dump({"auth": {"token": api_key}}, f)
+    
+    _auth_files[key] = f.name
+    return f.name
+
+@atexit.register
+def _remove_auth_files():
+    """Delete the auth files written by _auth_file."""
+    for path in _auth_files.values():
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    _auth_files.clear()
+
 class NetlifyProviderHandler(ProviderHandler):
     """Handler for Netlify hosting provider."""
     
@@ -29,34 +138,24 @@ class NetlifyProviderHandler(ProviderHandler):
             logger.error("Missing API key in Netlify credentials")
             return False
         
+        if self._recently_validated(credentials):
+            return True
+        
         # Use Netlify CLI to validate
         try:
-            # Create temporary auth.json file
-            temp_auth_path = os.path.expanduser("~/.netlify/temp_auth.json")
-            os.makedirs(os.path.dirname(temp_auth_path), exist_ok=True)
-            
-            with open(temp_auth_path, "w") as f:
-                json.dump({"auth": {"token": api_key}}, f)
-            
             # Run netlify status command
-            process = await asyncio.create_subprocess_exec(
-                "netlify", "status",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                env={**os.environ, "NETLIFY_AUTH_PATH": temp_auth_path}
+            process = await run_cli(
+                ["netlify", "status"],
+                env={**os.environ, "NETLIFY_AUTH_PATH": _auth_file(api_key)}
             )
             
-            stdout, stderr = await process.communicate()
-            
-            # Clean up
-            os.remove(temp_auth_path)
-            
             # Check result
             if process.returncode == 0:
                 logger.info("Netlify credentials validated successfully")
+                self._remember_validated(credentials)
                 return True
             else:
-                logger.error(f"Netlify credential validation failed: {stderr.decode()}")
+                logger.error(f"Netlify credential validation failed: {process.stderr.decode()}")
                 return False
                 
         except Exception as e:
@@ -90,40 +189,28 @@ class NetlifyProviderHandler(ProviderHandler):
         if team_name:
             deploy_cmd.extend(["--team", team_name])
         
-        # Create temporary auth.json file
-        temp_auth_path = os.path.expanduser("~/.netlify/temp_auth.json")
-        os.makedirs(os.path.dirname(temp_auth_path), exist_ok=True)
-        
-        with open(temp_auth_path, "w") as f:
-            json.dump({"auth": {"token": api_key}}, f)
-        
         try:
-            # Run deploy command
-            process = await asyncio.create_subprocess_exec(
-                *deploy_cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                env={**os.environ, "NETLIFY_AUTH_PATH": temp_auth_path}
+            # Run deploy command, picking the site URL and ID out of its
+            # output as it is printed
+            values = {b"Website URL:": "", b"Site ID:": ""}
+            
+            def scan_line(line: bytes):
+                for label, value in values.items():
+                    if not value:
+                        values[label] = find_labeled_value(line, label, _LABELED_VALUE_RE).decode(errors="replace")
+            
+            returncode, stdout_text, stderr_text = await run_streaming(
+                deploy_cmd,
+                on_line=scan_line,
+                env={**os.environ, "NETLIFY_AUTH_PATH": _auth_file(api_key)}
             )
             
-            stdout, stderr = await process.communicate()
-            stdout_text = stdout.decode()
-            stderr_text = stderr.decode()
-            
-            # Clean up
-            os.remove(temp_auth_path)
-            
-            if process.returncode != 0:
+            if returncode != 0:
                 logger.error(f"Netlify deployment failed: {stderr_text}")
                 raise RuntimeError(f"Netlify deployment failed: {stderr_text}")
             
-            # Extract site URL from output
-            url_match = re.search(r"Website URL:\s+(\S+)", stdout_text)
-            site_url = url_match.group(1) if url_match else ""
-            
-            # Extract site ID from output
-            site_id_match = re.search(r"Site ID:\s+(\S+)", stdout_text)
-            site_id = site_id_match.group(1) if site_id_match else ""
+            site_url = values[b"Website URL:"]
+            site_id = values[b"Site ID:"]
             
             logger.info(f"Netlify deployment successful. URL: {site_url}")
             
@@ -146,60 +233,4 @@ class NetlifyProviderHandler(ProviderHandler):
         Returns:
             List of identified issues
         """
-        issues = []
-        
-        # Common Netlify deployment issues
-        if "Error: Not authorized" in logs:
-            issues.append({
-                "id": "netlify_auth_error",
-                "type": "auth_error",
-                "message": "Authentication failed. Please check your Netlify API key.",
-                "severity": "high"
-            })
-        
-        if "Error: No such site" in logs:
-            issues.append({
-                "id": "netlify_site_not_found",
-                "type": "site_error",
-                "message": "Site not found. Please check the site name or create a new site.",
-                "severity": "high"
-            })
-        
-        if "Build failed" in logs:
-            # Extract build error message
-            build_error_match = re.search(r"Build failed: (.*)", logs)
-            build_error = build_error_match.group(1) if build_error_match else "Unknown build error"
-            
-            issues.append({
-                "id": "netlify_build_error",
-                "type": "build_error",
-                "message": f"Build failed: {build_error}",
-                "severity": "high"
-            })
-        
-        if "Error: Build script returned non-zero exit code" in logs:
-            issues.append({
-                "id": "netlify_build_script_error",
-                "type": "build_error",
-                "message": "Build script failed. Check your build command in netlify.toml.",
-                "severity": "high"
-            })
-        
-        if "Deploy failed" in logs:
-            issues.append({
-                "id": "netlify_deploy_error",
-                "type": "deployment_error",
-                "message": "Deployment failed. Check your Netlify site settings.",
-                "severity": "high"
-            })
-        
-        # If no specific issues found but deployment failed
-        if not issues and ("error" in logs.lower() or "failed" in logs.lower()):
-            issues.append({
-                "id": "netlify_unknown_error",
-                "type": "unknown_error",
-                "message": "Unknown error occurred during deployment. Check the logs for details.",
-                "severity": "medium"
-            })
-        
-        return issues
\ No newline at end of file
+        return find_log_issues(logs, _LOG_ISSUES, _UNKNOWN_LOG_ISSUE)
\ No newline at end of file
@@ -4,19 +4,176 @@ import asyncio
 import json
 import logging
 import os
-import re
+import posixpath
 import subprocess
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import ftplib
+import heapq
 import paramiko
 
-from arc_mcp.providers.base import ProviderHandler
+from arc_mcp.providers.base import ProviderHandler, find_log_issues
 
 logger = logging.getLogger("arc-mcp.providers.shared_hosting")
 
+# Known deployment log messages, as find_log_issues takes them: the text
+# that identifies each one, None as no detail is captured, and the issue it
+# reports
+_LOG_ISSUES = (
+    (
+        "530 Login incorrect",
+        None,
+        {
+            "id": "ftp_login_error",
+            "type": "auth_error",
+            "message": "FTP login failed. Check your username and password.",
+            "severity": "high"
+        }
+    ),
+    (
+        "Connection refused",
+        None,
+        {
+            "id": "connection_refused",
+            "type": "connection_error",
+            "message": "Connection refused. Verify the hostname and that the server is accepting connections.",
+            "severity": "high"
+        }
+    ),
+    (
+        "Permission denied",
+        None,
+        {
+            "id": "permission_denied",
+            "type": "permission_error",
+            "message": "Permission denied. Check that your user has write access to the remote directory.",
+            "severity": "high"
+        }
+    ),
+    (
+        "No such file",
+        None,
+        {
+            "id": "no_such_file",
+            "type": "path_error",
+            "message": "Remote directory does not exist. Verify the remote path.",
+            "severity": "medium"
+        }
+    ),
+    (
+        "Disk quota exceeded",
+        None,
+        {
+            "id": "quota_exceeded",
+            "type": "quota_error",
+            "message": "Disk quota exceeded. Free up space or upgrade your hosting plan.",
+            "severity": "high"
+        }
+    )
+)
+
+# Issue reported when the logs show a failure but no known message
+_UNKNOWN_LOG_ISSUE = {
+    "id": "shared_hosting_unknown_error",
+    "type": "unknown_error",
+    "message": "Unknown error occurred during deployment. Check the logs for details.",
+    "severity": "medium"
+}
+
+def _list_files(root: str) -> List[Tuple[str, str, int]]:
+    """List the files under a directory.
+    
+    Walks the tree with os.scandir, so directory entries come with their
+    type and no separate isdir() call is made per entry.
+    
+    Args:
+        root: Directory to list
+        
+    Returns:
+        (relative path with "/" separators, full path, size) of each file
+    """
+    files = []
+    pending = [("", root)]
+    while pending:
+        rel_dir, full_dir = pending.pop()
+        with os.scandir(full_dir) as it:
+            for entry in it:
+                rel_path = posixpath.join(rel_dir, entry.name) if rel_dir else entry.name
+                if entry.is_dir():
+                    pending.append((rel_path, entry.path))
+                elif entry.is_file():
+                    files.append((rel_path, entry.path, entry.stat().st_size))
+    return files
+
+def _remote_directories(files: List[Tuple[str, str, int]], remote_path: str) -> List[str]:
+    """List the remote directories needed for a set of files, parents first.
+    
+    Args:
+        files: Files to upload, as listed by _list_files
+        remote_path: Remote directory the files are uploaded to
+        
+    Returns:
+        Remote directory paths
+    """
+    directories = set()
+    for rel_path, _, _ in files:
+        parent = posixpath.dirname(rel_path)
+        while parent and parent not in directories:
+            directories.add(parent)
+            parent = posixpath.dirname(parent)
+    return [posixpath.join(remote_path, d) for d in sorted(directories, key=lambda d: d.count("/"))]
+
+def _batches(files: List[Tuple[str, str, int]], count: int) -> List[List[Tuple[str, str, int]]]:
+    """Split files into at most count batches of similar total size.
+    
+    Files are assigned largest first to the batch with the fewest bytes so
+    far, so one worker does not end up with all the large files.
+    
+    Args:
+        files: Files to upload, as listed by _list_files
+        count: Maximum number of batches
+        
+    Returns:
+        Batches of files
+    """
+    batches = [[] for _ in range(min(count, len(files)))]
+    loads = [(0, index) for index in range(len(batches))]
+    for file in sorted(files, key=lambda f: f[2], reverse=True):
+        load, index = heapq.heappop(loads)
+        batches[index].append(file)
+        heapq.heappush(loads, (load + file[2], index))
+    return batches
+
+def _check_login(host: str, username: str, password: str, protocol: str) -> None:
+    """Log in to a shared hosting server and disconnect.
+    
+    Args:
+        host: Server hostname
+        username: Login username
+        password: Login password
+        protocol: "ftp" or "sftp"
+        
+    Raises:
+        Exception: If the connection or login fails
+    """
+    if protocol == "ftp":
+        with ftplib.FTP(host) as ftp:
+            ftp.login(username, password)
+        return
+    
+    ssh = paramiko.SSHClient()
+    ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+    try:
+        ssh.connect(host, username=username, password=password)
+        ssh.open_sftp().close()
+    finally:
+        ssh.close()
+
 class SharedHostingProviderHandler(ProviderHandler):
     """Handler for traditional shared hosting providers."""
     
+    # Connections (FTP) or channels (SFTP) uploading files in parallel
+    UPLOAD_WORKERS = 8
+    
     async def validate_credentials(self, credentials: Dict[str, str]) -> bool:
         """Validate shared hosting credentials.
         
@@ -35,26 +192,19 @@ class SharedHostingProviderHandler(ProviderHandler):
             logger.error("Missing required credentials (host, username, password)")
             return False
         
+        if self._recently_validated(credentials):
+            return True
+        
+        if protocol.lower() not in ("ftp", "sftp"):
+            logger.error(f"Unsupported protocol: {protocol}")
+            return False
+        
         try:
-            if protocol.lower() == "ftp":
-                # Test FTP connection
-                with ftplib.FTP(host) as ftp:
-                    ftp.login(username, password)
-                    logger.info(f"FTP connection successful to {host}")
-                    return True
-            elif protocol.lower() == "sftp":
-                # Test SFTP connection
-                ssh = paramiko.SSHClient()
-                ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-                ssh.connect(host, username=username, password=password)
-                sftp = ssh.open_sftp()
-                sftp.close()
-                ssh.close()
-                logger.info(f"SFTP connection successful to {host}")
-                return True
-            else:
-                logger.error(f"Unsupported protocol: {protocol}")
-                return False
+            # The FTP and SSH handshakes block, so keep them off the event loop
+            await asyncio.to_thread(_check_login, host, username, password, protocol.lower())
+            logger.info(f"{protocol.upper()} connection successful to {host}")
+            self._remember_validated(credentials)
+            return True
         except Exception as e:
             logger.error(f"Error validating shared hosting credentials: {str(e)}")
             return False
@@ -103,18 +253,79 @@ class SharedHostingProviderHandler(ProviderHandler):
             raise
     
     async def _deploy_ftp(self, local_path, host, username, password, remote_path):
-        """Deploy files via FTP."""
-        # In a real implementation, this would upload files recursively
-        # For simplicity, we're just showing the basic structure
+        """Deploy files via FTP.
+        
+        Directories are created over one connection, then the files are
+        uploaded over up to UPLOAD_WORKERS connections in parallel, in
+        batches balanced by size.
+        """
         logger.info(f"Deploying {local_path} to {host}:{remote_path} via FTP")
-        # Would implement recursive FTP upload here
+        files = await asyncio.to_thread(_list_files, local_path)
+        
+        def connect() -> ftplib.FTP:
+            ftp = ftplib.FTP(host)
+            ftp.login(username, password)
+            return ftp
+        
+        def make_directories():
+            with connect() as ftp:
+                for directory in _remote_directories(files, remote_path):
+                    try:
+                        ftp.mkd(directory)
+                    except ftplib.error_perm:
+                        # Already exists
+                        pass
+        
+        def upload(batch: List[Tuple[str, str, int]]):
+            with connect() as ftp:
+                for rel_path, full_path, _ in batch:
+                    with open(full_path, "rb") as f:
+                        ftp.storbinary(f"STOR {posixpath.join(remote_path, rel_path)}", f)
+        
+        await asyncio.to_thread(make_directories)
+        await asyncio.gather(*(
+            asyncio.to_thread(upload, batch) for batch in _batches(files, self.UPLOAD_WORKERS)
+        ))
+        logger.info(f"Uploaded {len(files)} files to {host} via FTP")
     
     async def _deploy_sftp(self, local_path, host, username, password, remote_path):
-        """Deploy files via SFTP."""
-        # In a real implementation, this would upload files recursively
-        # For simplicity, we're just showing the basic structure
+        """Deploy files via SFTP.
+        
+        Directories are created first, then the files are uploaded over up
+        to UPLOAD_WORKERS SFTP channels of one SSH connection in parallel,
+        in batches balanced by size.
+        """
         logger.info(f"Deploying {local_path} to {host}:{remote_path} via SFTP")
-        # Would implement recursive SFTP upload here
+        files = await asyncio.to_thread(_list_files, local_path)
+        
+        def connect() -> paramiko.SSHClient:
+            ssh = paramiko.SSHClient()
+            ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+            ssh.connect(host, username=username, password=password)
+            return ssh
+        
+        def make_directories():
+            with ssh.open_sftp() as sftp:
+                for directory in _remote_directories(files, remote_path):
+                    try:
+                        sftp.stat(directory)
+                    except IOError:
+                        sftp.mkdir(directory)
+        
+        def upload(batch: List[Tuple[str, str, int]]):
+            with ssh.open_sftp() as sftp:
+                for rel_path, full_path, _ in batch:
+                    sftp.put(full_path, posixpath.join(remote_path, rel_path))
+        
+        ssh = await asyncio.to_thread(connect)
+        try:
+            await asyncio.to_thread(make_directories)
+            await asyncio.gather(*(
+                asyncio.to_thread(upload, batch) for batch in _batches(files, self.UPLOAD_WORKERS)
+            ))
+        finally:
+            ssh.close()
+        logger.info(f"Uploaded {len(files)} files to {host} via SFTP")
     
     async def analyze_logs(self, logs: str) -> List[Dict]:
         """Analyze shared hosting deployment logs to identify issues.
@@ -125,55 +336,4 @@ class SharedHostingProviderHandler(ProviderHandler):
         Returns:
             List of identified issues
         """
-        issues = []
-        
-        if "530 Login incorrect" in logs:
-            issues.append({
-                "id": "ftp_login_error",
-                "type": "auth_error",
-                "message": "FTP login failed. Check your username and password.",
-                "severity": "high"
-            })
-        
-        if "Connection refused" in logs:
-            issues.append({
-                "id": "connection_refused",
-                "type": "connection_error",
-                "message": "Connection refused. Verify the hostname and that the server is accepting connections.",
-                "severity": "high"
-            })
-        
-        if "Permission denied" in logs:
-            issues.append({
-                "id": "permission_denied",
-                "type": "permission_error",
-                "message": "Permission denied. Check that your user has write access to the remote directory.",
-                "severity": "high"
-            })
-        
-        if "No such file" in logs:
-            issues.append({
-                "id": "no_such_file",
-                "type": "path_error",
-                "message": "Remote directory does not exist. Verify the remote path.",
-                "severity": "medium"
-            })
-        
-        if "Disk quota exceeded" in logs:
-            issues.append({
-                "id": "quota_exceeded",
-                "type": "quota_error",
-                "message": "Disk quota exceeded. Free up space or upgrade your hosting plan.",
-                "severity": "high"
-            })
-        
-        # If no specific issues found but deployment failed
-        if not issues and ("error" in logs.lower() or "failed" in logs.lower()):
-            issues.append({
-                "id": "shared_hosting_unknown_error",
-                "type": "unknown_error",
-                "message": "Unknown error occurred during deployment. Check the logs for details.",
-                "severity": "medium"
-            })
-        
-        return issues
\ No newline at end of file
+        return find_log_issues(logs, _LOG_ISSUES, _UNKNOWN_LOG_ISSUE)
\ No newline at end of file
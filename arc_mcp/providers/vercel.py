@@ -1,17 +1,72 @@
 """Vercel provider handler for Arc MCP."""
 
-import asyncio
 import json
 import logging
 import os
 import re
-import subprocess
-from typing import Dict, List, Optional
+from typing import Dict, List
 
-from arc_mcp.providers.base import ProviderHandler
+from arc_mcp.providers.base import ProviderHandler, find_labeled_value, find_log_issues, run_cli, run_streaming
 
 logger = logging.getLogger("arc-mcp.providers.vercel")
 
+# Production URL printed by vercel deploy after "Production: "
+_PRODUCTION_URL_RE = re.compile(rb"(https?://\S+)")
+
+# Known deployment log messages, as find_log_issues takes them: the text
+# that identifies each one, None as no detail is captured, and the issue it
+# reports
+_LOG_ISSUES = (
+    (
+        "Error: Could not authenticate",
+        None,
+        {
+            "id": "vercel_auth_error",
+            "type": "auth_error",
+            "message": "Authentication failed. Please check your Vercel token.",
+            "severity": "high"
+        }
+    ),
+    (
+        "Error: No such project",
+        None,
+        {
+            "id": "vercel_project_not_found",
+            "type": "project_error",
+            "message": "Project not found. Please check the project name or create a new project.",
+            "severity": "high"
+        }
+    ),
+    (
+        "Error: Build failed",
+        None,
+        {
+            "id": "vercel_build_error",
+            "type": "build_error",
+            "message": "Build failed. Check your build configuration.",
+            "severity": "high"
+        }
+    ),
+    (
+        "Error: You do not have access to this organization",
+        None,
+        {
+            "id": "vercel_org_access_error",
+            "type": "auth_error",
+            "message": "You don't have access to the specified organization.",
+            "severity": "high"
+        }
+    )
+)
+
+# Issue reported when the logs show a failure but no known message
+_UNKNOWN_LOG_ISSUE = {
+    "id": "vercel_unknown_error",
+    "type": "unknown_error",
+    "message": "Unknown error occurred during deployment. Check the logs for details.",
+    "severity": "medium"
+}
+
 class VercelProviderHandler(ProviderHandler):
     """Handler for Vercel hosting provider."""
     
@@ -29,6 +84,9 @@ class VercelProviderHandler(ProviderHandler):
             logger.error("Missing token in Vercel credentials")
             return False
         
+        if self._recently_validated(credentials):
+            return True
+        
         try:
             # Create .vercel/credentials.json file
             creds_dir = os.path.expanduser("~/.vercel")
@@ -39,19 +97,14 @@ class VercelProviderHandler(ProviderHandler):
                 json.dump({"token": token}, f)
             
             # Run vercel whoami
-            process = await asyncio.create_subprocess_exec(
-                "vercel", "whoami",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            
-            stdout, stderr = await process.communicate()
+            process = await run_cli(["vercel", "whoami"])
             
             if process.returncode == 0:
                 logger.info("Vercel credentials validated successfully")
+                self._remember_validated(credentials)
                 return True
             else:
-                logger.error(f"Vercel credential validation failed: {stderr.decode()}")
+                logger.error(f"Vercel credential validation failed: {process.stderr.decode()}")
                 return False
                 
         except Exception as e:
@@ -98,25 +151,27 @@ class VercelProviderHandler(ProviderHandler):
             if org_id:
                 deploy_cmd.extend(["--scope", org_id])
             
-            # Run deploy command
-            process = await asyncio.create_subprocess_exec(
-                *deploy_cmd,
-                cwd=path,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
+            # Run deploy command, picking the deployment URL out of its
+            # output as it is printed
+            urls = []
             
-            stdout, stderr = await process.communicate()
-            stdout_text = stdout.decode()
-            stderr_text = stderr.decode()
+            def scan_line(line: bytes):
+                if not urls:
+                    url = find_labeled_value(line, b"Production: ", _PRODUCTION_URL_RE)
+                    if url:
+                        urls.append(url.decode(errors="replace"))
             
-            if process.returncode != 0:
+            returncode, stdout_text, stderr_text = await run_streaming(
+                deploy_cmd,
+                on_line=scan_line,
+                cwd=path
+            )
+            
+            if returncode != 0:
                 logger.error(f"Vercel deployment failed: {stderr_text}")
                 raise RuntimeError(f"Vercel deployment failed: {stderr_text}")
             
-            # Extract deployment URL
-            url_match = re.search(r"Production: (https?://\S+)", stdout_text)
-            deployment_url = url_match.group(1) if url_match else ""
+            deployment_url = urls[0] if urls else ""
             
             logger.info(f"Vercel deployment successful. URL: {deployment_url}")
             
@@ -142,47 +197,4 @@ class VercelProviderHandler(ProviderHandler):
         Returns:
             List of identified issues
         """
-        issues = []
-        
-        if "Error: Could not authenticate" in logs:
-            issues.append({
-                "id": "vercel_auth_error",
-                "type": "auth_error",
-                "message": "Authentication failed. Please check your Vercel token.",
-                "severity": "high"
-            })
-        
-        if "Error: No such project" in logs:
-            issues.append({
-                "id": "vercel_project_not_found",
-                "type": "project_error",
-                "message": "Project not found. Please check the project name or create a new project.",
-                "severity": "high"
-            })
-        
-        if "Error: Build failed" in logs:
-            issues.append({
-                "id": "vercel_build_error",
-                "type": "build_error",
-                "message": "Build failed. Check your build configuration.",
-                "severity": "high"
-            })
-        
-        if "Error: You do not have access to this organization" in logs:
-            issues.append({
-                "id": "vercel_org_access_error",
-                "type": "auth_error",
-                "message": "You don't have access to the specified organization.",
-                "severity": "high"
-            })
-        
-        # If no specific issues found but deployment failed
-        if not issues and ("error" in logs.lower() or "failed" in logs.lower()):
-            issues.append({
-                "id": "vercel_unknown_error",
-                "type": "unknown_error",
-                "message": "Unknown error occurred during deployment. Check the logs for details.",
-                "severity": "medium"
-            })
-        
-        return issues
\ No newline at end of file
+        return find_log_issues(logs, _LOG_ISSUES, _UNKNOWN_LOG_ISSUE)
\ No newline at end of file
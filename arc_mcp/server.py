@@ -23,8 +23,6 @@ except ImportError:
     sys.exit(1)
 
 from arc_mcp.credentials import CredentialsManager
-from arc_mcp.frameworks import get_framework_handler
-from arc_mcp.providers import get_provider_handler
 
 logger = logging.getLogger("arc-mcp")
 
@@ -312,6 +310,7 @@ class ArcMCPServer(MCPServer):
         """Validate credentials with the provider's API."""
         logger.info(f"Validating credentials for provider: {provider}")
         try:
+            from arc_mcp.providers import get_provider_handler
             provider_handler = get_provider_handler(provider)
             is_valid = await provider_handler.validate_credentials(credentials)
             return {"valid": is_valid, "provider": provider}
@@ -328,7 +327,9 @@ class ArcMCPServer(MCPServer):
             if not framework_type:
                 raise ToolExecutionError(f"Could not detect framework type for project at {path}")
             
-            # Get appropriate handlers
+            # Get appropriate handlers (imported here to keep server startup light)
+            from arc_mcp.frameworks import get_framework_handler
+            from arc_mcp.providers import get_provider_handler
             framework_handler = get_framework_handler(framework_type)
             provider_handler = get_provider_handler(provider)
             
@@ -362,7 +363,9 @@ class ArcMCPServer(MCPServer):
             if not framework_type:
                 raise ToolExecutionError(f"Could not detect framework type for project at {path}")
             
-            # Get appropriate handlers
+            # Get appropriate handlers (imported here to keep server startup light)
+            from arc_mcp.frameworks import get_framework_handler
+            from arc_mcp.providers import get_provider_handler
             framework_handler = get_framework_handler(framework_type)
             provider_handler = get_provider_handler(provider)
             
@@ -496,6 +499,24 @@ class ArcMCPServer(MCPServer):
             
         raise Exception(f"Unknown resource: {resource_id}")
 
+def _install_event_loop_policy():
+    """Switch to an io_uring event loop when requested and available.
+    
+    Opt-in through the ARC_MCP_IO_URING environment variable on Linux;
+    the default asyncio loop is kept if uringcore is not installed.
+    """
+    if sys.platform != "linux" or not os.environ.get("ARC_MCP_IO_URING"):
+        return
+    
+    try:
+        import uringcore
+    except ImportError:
+        logger.warning("ARC_MCP_IO_URING is set but uringcore is not installed")
+        return
+    
+    asyncio.set_event_loop_policy(uringcore.EventLoopPolicy())
+    logger.info("Using io_uring event loop")
+
 def main():
     """Main entry point for the server."""
     parser = argparse.ArgumentParser(description="Arc MCP Server")
@@ -508,6 +529,7 @@ def main():
         debug=args.debug
     )
     
+    _install_event_loop_policy()
     asyncio.run(server.run())
 
 if __name__ == "__main__":
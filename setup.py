@@ -32,6 +32,12 @@ setup(
             "pytest-asyncio>=0.18.0",
             "flake8>=4.0.0",
             "black>=22.0.0"
+        ],
+        "speedups": [
+            "rfernet>=0.3.0",
+            "orjson>=3.6.0",
+            "msgpack>=1.0.0",
+            "pyahocorasick>=2.0.0"
         ]
     },
     entry_points={
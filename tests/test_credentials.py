@@ -8,7 +8,7 @@ import shutil
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-from arc.credentials import CredentialManager
+from arc.credentials import CredentialManager, get_credential_manager
 
 
 class TestCredentialManager(unittest.TestCase):
@@ -27,8 +27,25 @@ class TestCredentialManager(unittest.TestCase):
     
     def tearDown(self):
         """Tear down test fixtures."""
+        get_credential_manager.cache_clear()
         shutil.rmtree(self.test_dir)
     
+    def test_files_created_private(self):
+        """Test that the key and credential files are only readable by the owner."""
+        self.manager.store_credentials("test_provider", {"token": "secret"})
+        
+        key_file = os.path.join(self.test_dir, ".arc", "credentials", ".key")
+        cred_file = os.path.join(self.test_dir, ".arc", "credentials", "test_provider.cred")
+        self.assertEqual(os.stat(key_file).st_mode & 0o777, 0o600)
+        self.assertEqual(os.stat(cred_file).st_mode & 0o777, 0o600)
+    
+    def test_get_credential_manager_shared(self):
+        """Test that get_credential_manager returns a single instance."""
+        with patch('pathlib.Path.home', return_value=Path(self.test_dir)):
+            manager = get_credential_manager()
+            self.assertIsInstance(manager, CredentialManager)
+            self.assertIs(get_credential_manager(), manager)
+    
     @patch('builtins.open', new_callable=unittest.mock.mock_open)
     @patch('cryptography.fernet.Fernet.encrypt')
     def test_store_credentials(self, mock_encrypt, mock_open):
@@ -90,6 +107,30 @@ class TestCredentialManager(unittest.TestCase):
         self.assertEqual(credentials["port"], "22")
         self.assertEqual(credentials["protocol"], "sftp")
     
+    def test_get_credentials_legacy_json(self):
+        """Test reading credentials stored as JSON before MessagePack was used."""
+        cred_file = os.path.join(self.test_dir, ".arc", "credentials", "legacy.cred")
+        with open(cred_file, "wb") as f:
+            f.write(self.manager.cipher.encrypt(b'{"token": "secret"}'))
+        
+        self.assertEqual(self.manager.get_credentials("legacy"), {"token": "secret"})
+    
+    def test_get_credentials_cached(self):
+        """Test that unchanged credential files are served from the cache."""
+        credentials = {"api_key": "secret"}
+        self.manager.store_credentials("test_provider", credentials)
+        
+        self.assertEqual(self.manager.get_credentials("test_provider"), credentials)
+        
+        # A second lookup must not decrypt the file again
+        with patch.object(self.manager, 'cipher') as mock_cipher:
+            self.assertEqual(self.manager.get_credentials("test_provider"), credentials)
+            mock_cipher.decrypt.assert_not_called()
+        
+        # Storing new credentials invalidates the cached entry
+        self.manager.store_credentials("test_provider", {"api_key": "rotated"})
+        self.assertEqual(self.manager.get_credentials("test_provider"), {"api_key": "rotated"})
+    
     @patch('os.path.exists')
     def test_get_credentials_not_found(self, mock_exists):
         """Test retrieving non-existent credentials."""
@@ -26,6 +26,17 @@ class TestFrameworkBase(unittest.TestCase):
         
         with self.assertRaises(NotImplementedError):
             handler.troubleshoot("path", "provider", None)
+    
+    def test_framework_registry(self):
+        """Test looking up and listing registered frameworks."""
+        handler = get_framework_handler("wasp")
+        self.assertIsInstance(handler, WaspFrameworkHandler)
+        self.assertIs(get_framework_handler("wasp"), handler)
+        self.assertIsNone(get_framework_handler("unknown"))
+        
+        frameworks = {f["name"]: f for f in list_frameworks()}
+        self.assertEqual(frameworks["wasp"]["display_name"], WaspFrameworkHandler.display_name)
+        self.assertEqual(frameworks["wasp"]["description"], WaspFrameworkHandler.description)
 
 
 class TestWaspFrameworkHandler(unittest.TestCase):
@@ -78,6 +89,11 @@ class TestWaspFrameworkHandler(unittest.TestCase):
         try:
             wasp_file = self.handler._find_wasp_file(empty_dir)
             self.assertIsNone(wasp_file)
+            
+            # The .wasp build directory is not a .wasp file
+            os.makedirs(os.path.join(empty_dir, ".wasp"))
+            wasp_file = self.handler._find_wasp_file(empty_dir)
+            self.assertIsNone(wasp_file)
         finally:
             shutil.rmtree(empty_dir)
     
@@ -94,6 +110,55 @@ class TestWaspFrameworkHandler(unittest.TestCase):
         app_name = self.handler._extract_app_name("// This is a comment")
         self.assertIsNone(app_name)
     
+    @patch('shutil.which', return_value=None)
+    def test_find_missing_react_imports(self, mock_which):
+        """Test the pure-Python scan for missing React imports."""
+        src_dir = os.path.join(self.test_dir, "client", "src")
+        os.makedirs(os.path.join(src_dir, "components"))
+        sources = {
+            "App.jsx": "import React from 'react'\nconst [a] = useState()",
+            "components/Counter.tsx": "const [count] = useState(0)",
+            "utils.js": "export const add = (a, b) => a + b",
+            "empty.ts": "",
+            "styles.css": "useState"
+        }
+        for name, content in sources.items():
+            with open(os.path.join(src_dir, name), 'w') as f:
+                f.write(content)
+        
+        missing = self.handler._find_missing_react_imports(src_dir)
+        
+        self.assertEqual(missing, [os.path.join(src_dir, "components", "Counter.tsx")])
+    
+    def test_analyze_error_log(self):
+        """Test the _analyze_error_log method."""
+        error_log = (
+            "Failed to compile.\n"
+            "Module not found: Error: Can't resolve 'axios' in '/app/src'\n"
+            "Node.js version must be >=14.0.0\n"
+        )
+        
+        result = self.handler._analyze_error_log(error_log)
+        
+        # Issues are reported in COMMON_ISSUES order, followed by specific errors
+        self.assertEqual(result["issues"], [
+            "Detected node_version issue",
+            "Detected build_failed issue",
+            "Missing dependency: axios"
+        ])
+        self.assertIn("Install the missing dependency with 'npm install axios'", result["recommendations"])
+        
+        # Database and CORS errors are picked up in the same pass
+        result = self.handler._analyze_error_log("Failed to connect to database\nBlocked by CORS policy")
+        self.assertEqual(result["issues"], [
+            "Database connection issue",
+            "CORS (Cross-Origin Resource Sharing) issue"
+        ])
+        
+        # A clean log yields nothing
+        result = self.handler._analyze_error_log("Build succeeded")
+        self.assertEqual(result["issues"], [])
+    
     @patch('os.path.isdir')
     @patch('arc.providers.get_provider_handler')
     def test_analyze_requirements(self, mock_get_provider, mock_isdir):
@@ -129,41 +194,98 @@ class TestWaspFrameworkHandler(unittest.TestCase):
         """Test the _build_project method."""
         # Setup mock
         process_mock = MagicMock()
-        process_mock.returncode = 0
-        process_mock.communicate.return_value = ("Build succeeded", "")
+        process_mock.stdout = iter(["Building...\n", "Build succeeded\n"])
+        process_mock.wait.return_value = 0
         mock_popen.return_value = process_mock
         
         # Setup temporary build output directory
         build_dir = os.path.join(self.test_dir, ".wasp/build/web-app")
         os.makedirs(build_dir)
+        with open(os.path.join(build_dir, "index.html"), "w") as f:
+            f.write("<html></html>")
         
         # Test the build process
-        with patch('os.path.exists', return_value=True), \
-             patch('shutil.copytree') as mock_copytree:
-            
-            result = self.handler._build_project(
-                self.test_dir, 
-                tempfile.mkdtemp(), 
-                {"env": {"DATABASE_URL": "test-url"}}
-            )
-            
-            # Verify results
-            self.assertTrue(result["success"])
-            self.assertIn("output_dir", result)
-            self.assertEqual(result["message"], "Build completed successfully")
-            
-            # Verify subprocess was called correctly
-            mock_popen.assert_called_once()
-            args, kwargs = mock_popen.call_args
-            self.assertEqual(kwargs["cwd"], self.test_dir)
-            
-            # Verify environment variables were passed
-            self.assertIn("DATABASE_URL", kwargs["env"])
-            self.assertEqual(kwargs["env"]["DATABASE_URL"], "test-url")
-            
-            # Verify build output was copied
-            mock_copytree.assert_called_once()
-
+        result = self.handler._build_project(
+            self.test_dir, 
+            tempfile.mkdtemp(dir=self.test_dir), 
+            {"env": {"DATABASE_URL": "test-url"}}
+        )
+        
+        # Verify results
+        self.assertTrue(result["success"])
+        self.assertIn("output_dir", result)
+        self.assertEqual(result["message"], "Build completed successfully")
+        
+        # Verify subprocess was called correctly
+        mock_popen.assert_called_once()
+        args, kwargs = mock_popen.call_args
+        self.assertEqual(args[0], ["wasp", "build"])
+        self.assertNotIn("shell", kwargs)
+        self.assertEqual(kwargs["cwd"], self.test_dir)
+        
+        # Verify environment variables were passed
+        self.assertIn("DATABASE_URL", kwargs["env"])
+        self.assertEqual(kwargs["env"]["DATABASE_URL"], "test-url")
+        
+        # Verify build output was copied and the project's copy kept
+        self.assertTrue(os.path.isfile(os.path.join(result["output_dir"], "index.html")))
+        self.assertTrue(os.path.isfile(os.path.join(build_dir, "index.html")))
+    
+    def test_copy_build_output_hardlinks(self):
+        """Test that build output is hardlinked and the source kept."""
+        build_dir = os.path.join(self.test_dir, "web-app")
+        os.makedirs(build_dir)
+        source_file = os.path.join(build_dir, "index.html")
+        with open(source_file, "w") as f:
+            f.write("<html></html>")
+        dest_dir = os.path.join(self.test_dir, "dest")
+        
+        self.handler._copy_build_output(build_dir, dest_dir)
+        
+        dest_file = os.path.join(dest_dir, "index.html")
+        self.assertEqual(os.stat(dest_file).st_ino, os.stat(source_file).st_ino)
+    
+    @patch('subprocess.Popen')
+    def test_build_project_failure(self, mock_popen):
+        """Test that a failed build reports the output tail and log file."""
+        process_mock = MagicMock()
+        process_mock.stdout = iter(["x" * 100 + "\n"] * 2000 + ["Error: build failed\n"])
+        process_mock.wait.return_value = 1
+        mock_popen.return_value = process_mock
+        
+        result = self.handler._build_project(self.test_dir, tempfile.mkdtemp(), {})
+        
+        self.assertIsNone(mock_popen.call_args[1]["env"])
+        self.assertFalse(result["success"])
+        self.assertTrue(result["details"].endswith("Error: build failed\n"))
+        self.assertLessEqual(len(result["details"]), self.handler.BUILD_LOG_TAIL_SIZE)
+        
+        # The full log is kept on disk
+        with open(result["log_file"]) as f:
+            self.assertEqual(len(f.readlines()), 2001)
+        os.remove(result["log_file"])
+    
+    @patch('subprocess.Popen')
+    def test_build_project_stream_error(self, mock_popen):
+        """Test that the build is killed and its log removed if reading output fails."""
+        def output():
+            yield "Building...\n"
+            raise UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid start byte")
+        
+        process_mock = MagicMock()
+        process_mock.stdout = output()
+        process_mock.returncode = None
+        mock_popen.return_value = process_mock
+        
+        with patch('os.remove', wraps=os.remove) as mock_remove:
+            result = self.handler._build_project(self.test_dir, tempfile.mkdtemp(), {})
+        
+        self.assertFalse(result["success"])
+        process_mock.kill.assert_called_once()
+        process_mock.wait.assert_called_once()
+        log_path = mock_remove.call_args[0][0]
+        self.assertTrue(os.path.basename(log_path).startswith("wasp-build-"))
+        self.assertFalse(os.path.exists(log_path))
 
 # Run tests if executed directly
 if __name__ == '__main__':
@@ -0,0 +1,62 @@
+"""
+Tests for the credentials manager in arc_mcp.
+"""
+import base64
+import json
+import unittest
+import shutil
+import tempfile
+from pathlib import Path
+
+from cryptography.fernet import Fernet
+
+from arc_mcp.credentials import _AESGCM_TAG, CredentialsManager
+
+
+class TestCredentialsMigration(unittest.TestCase):
+    """Test cases for migrating the older single-file credentials store."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_dir = tempfile.mkdtemp()
+        self.storage_path = Path(self.test_dir) / "credentials"
+        self.legacy_path = Path(self.test_dir) / "credentials.old"
+        
+        # Create the key, then replace the store directory with a single file
+        self.manager = CredentialsManager(str(self.storage_path))
+        self.storage_path.rmdir()
+    
+    def tearDown(self):
+        """Tear down test fixtures."""
+        shutil.rmtree(self.test_dir)
+    
+    def test_migrate_credentials_file(self):
+        """Test that a readable legacy store is split and then removed."""
+        credentials = {"netlify": {"api_key": "secret"}}
+        
+        # Older versions wrote the whole store as one Fernet token of JSON
+        fernet = Fernet(base64.urlsafe_b64encode(self.manager.key))
+        self.storage_path.write_bytes(fernet.encrypt(json.dumps(credentials).encode()))
+        
+        manager = CredentialsManager(str(self.storage_path))
+        
+        self.assertTrue(self.storage_path.is_dir())
+        self.assertFalse(self.legacy_path.exists())
+        migrated = list(self.storage_path.glob("*.bin"))
+        self.assertEqual(len(migrated), 1)
+        self.assertTrue(migrated[0].read_bytes().startswith(_AESGCM_TAG))
+        self.assertEqual(manager.get_credentials("netlify"), {"api_key": "secret"})
+    
+    def test_migrate_credentials_file_unreadable(self):
+        """Test that a legacy store that cannot be decrypted is kept."""
+        self.storage_path.write_bytes(b"corrupt")
+        
+        manager = CredentialsManager(str(self.storage_path))
+        
+        self.assertTrue(self.storage_path.is_dir())
+        self.assertEqual(self.legacy_path.read_bytes(), b"corrupt")
+        self.assertIsNone(manager.get_credentials("netlify"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,10 +5,18 @@ import unittest
 import os
 import tempfile
 import shutil
+import io
+import tarfile
+import socket
+import subprocess
+import threading
 from unittest.mock import patch, MagicMock, mock_open
 
 from arc.providers import ProviderHandler, get_provider_handler, list_providers
-from arc.providers.shared_hosting import SharedHostingProvider, FileInfo
+from arc.providers.shared_hosting import (
+    SharedHostingProvider, FileInfo, _SSHConnectionPool, _SFTPSession,
+    _compile_exclusions
+)
 
 
 class TestProviderBase(unittest.TestCase):
@@ -29,6 +37,13 @@ class TestProviderBase(unittest.TestCase):
         
         with self.assertRaises(NotImplementedError):
             handler.deploy({}, "", "", {})
+    
+    def test_get_provider_handler_cached(self):
+        """Test that provider handlers are shared between lookups."""
+        provider = get_provider_handler("shared_hosting")
+        self.assertIsInstance(provider, SharedHostingProvider)
+        self.assertIs(get_provider_handler("shared_hosting"), provider)
+        self.assertIsNone(get_provider_handler("unknown"))
 
 
 class TestFileInfo(unittest.TestCase):
@@ -63,6 +78,79 @@ class TestFileInfo(unittest.TestCase):
         self.assertNotEqual(file4, file6)
 
 
+class TestSSHConnectionPool(unittest.TestCase):
+    """Test cases for the _SSHConnectionPool class."""
+    
+    def test_connection_reused_while_active(self):
+        """Test that connections are reused until their transport drops."""
+        pool = _SSHConnectionPool(max_idle_channels=2)
+        connect = MagicMock(side_effect=lambda: MagicMock())
+        key = ("example.com", 22, "user", "pass")
+        
+        client = pool.client(key, connect)
+        self.assertIs(pool.client(key, connect), client)
+        self.assertEqual(connect.call_count, 1)
+        
+        client.get_transport.return_value.is_active.return_value = False
+        self.assertIsNot(pool.client(key, connect), client)
+        client.close.assert_called_once()
+    
+    def test_connect_outside_pool_lock(self):
+        """Test that a slow handshake does not block connections to other servers."""
+        pool = _SSHConnectionPool(max_idle_channels=2)
+        started = threading.Event()
+        release = threading.Event()
+        
+        def slow_connect():
+            started.set()
+            release.wait(5)
+            return MagicMock()
+        
+        thread = threading.Thread(target=pool.client, args=(("slow.example.com", 22, "u", "p"), slow_connect))
+        thread.start()
+        started.wait(5)
+        try:
+            fast = MagicMock()
+            self.assertIs(pool.client(("fast.example.com", 22, "u", "p"), lambda: fast), fast)
+        finally:
+            release.set()
+            thread.join(5)
+    
+    def test_close(self):
+        """Test that close shuts down idle channels and pooled connections."""
+        pool = _SSHConnectionPool(max_idle_channels=2)
+        key = ("example.com", 22, "user", "pass")
+        client = pool.client(key, MagicMock)
+        sftp = MagicMock(**{"get_channel.return_value.closed": False})
+        pool.release_sftp(key, sftp)
+        
+        pool.close()
+        
+        sftp.close.assert_called_once()
+        client.close.assert_called_once()
+        self.assertIsNot(pool.client(key, MagicMock), client)
+    
+    def test_sftp_channels_reused(self):
+        """Test that released SFTP channels are handed out again."""
+        pool = _SSHConnectionPool(max_idle_channels=1)
+        client = MagicMock()
+        client.open_sftp.side_effect = lambda: MagicMock(**{"get_channel.return_value.closed": False})
+        key = ("example.com", 22, "user", "pass")
+        
+        first = pool.acquire_sftp(key, client)
+        second = pool.acquire_sftp(key, client)
+        self.assertIsNot(first, second)
+        
+        pool.release_sftp(key, first)
+        pool.release_sftp(key, second)
+        first.chdir.assert_called_once_with(None)
+        # Only one idle channel is kept
+        second.close.assert_called_once()
+        
+        self.assertIs(pool.acquire_sftp(key, client), first)
+        self.assertEqual(client.open_sftp.call_count, 2)
+
+
 class TestSharedHostingProvider(unittest.TestCase):
     """Test cases for the SharedHostingProvider class."""
     
@@ -160,14 +248,23 @@ class TestSharedHostingProvider(unittest.TestCase):
             "protocol": "sftp"
         }
         
-        result = self.provider.validate_credentials(credentials)
-        
-        self.assertTrue(result["success"])
-        mock_ssh_instance.set_missing_host_key_policy.assert_called_once()
-        mock_ssh_instance.connect.assert_called_once_with(
-            hostname="example.com", port=22, username="user", password="pass"
-        )
-        mock_ssh_instance.close.assert_called_once()
+        with patch.object(self.provider, '_open_tuned_socket') as mock_socket:
+            result = self.provider.validate_credentials(credentials)
+            
+            self.assertTrue(result["success"])
+            mock_ssh_instance.set_missing_host_key_policy.assert_called_once()
+            mock_ssh_instance.connect.assert_called_once_with(
+                hostname="example.com", port=22, username="user", password="pass",
+                sock=mock_socket.return_value, compress=True
+            )
+            
+            mock_ssh_instance.open_sftp.assert_called_once()
+            mock_ssh_instance.close.assert_called_once()
+            
+            # Every validation logs in again, even with a pooled connection
+            self.assertTrue(self.provider.check_status(credentials, None)["success"])
+            self.assertTrue(self.provider.validate_credentials(credentials)["success"])
+            self.assertEqual(mock_ssh_instance.connect.call_count, 3)
     
     def test_scan_local_directory(self):
         """Test _scan_local_directory method."""
@@ -188,6 +285,74 @@ class TestSharedHostingProvider(unittest.TestCase):
             self.assertTrue(hasattr(file_info, 'modified_time'))
             self.assertTrue(hasattr(file_info, 'hash_value'))
     
+    def test_compile_exclusions(self):
+        """Test that exclusion globs are matched against whole names."""
+        excluded = _compile_exclusions(tuple(SharedHostingProvider.DEFAULT_EXCLUSIONS))
+        
+        for name in (".git", "node_modules", "module.pyc", ".env"):
+            self.assertTrue(excluded.match(name), name)
+        for name in ("index.html", ".gitkeep", "app.pyc.js", "env"):
+            self.assertFalse(excluded.match(name), name)
+        self.assertIsNone(_compile_exclusions(()))
+    
+    def test_scan_local_directory_exclusions(self):
+        """Test that excluded directories are skipped without reading files."""
+        os.makedirs(os.path.join(self.test_dir, "node_modules"))
+        with open(os.path.join(self.test_dir, "node_modules", "lib.js"), "w") as f:
+            f.write("module")
+        
+        with patch('builtins.open') as mock_file:
+            files = self.provider._scan_local_directory(self.test_dir, ["node_modules"])
+            mock_file.assert_not_called()
+        
+        self.assertEqual(list(files), ["css/style.css", "images/logo.png", "index.html", "js/script.js"])
+        self.assertEqual(files["index.html"].size, len("Content of index.html"))
+    
+    def test_fast_remote_manifest(self):
+        """Test listing a remote tree with one find command."""
+        def exec_command(command):
+            # Run the command locally in place of the server
+            result = subprocess.run(["sh", "-c", command], capture_output=True)
+            stdout, stderr = MagicMock(), MagicMock()
+            stdout.read.return_value = result.stdout
+            stdout.channel.recv_exit_status.return_value = result.returncode
+            stderr.read.return_value = result.stderr
+            return MagicMock(), stdout, stderr
+        
+        client = MagicMock()
+        client.exec_command.side_effect = exec_command
+        
+        files = self.provider._fast_remote_manifest(client, self.test_dir)
+        
+        self.assertEqual(sorted(files), ["css/style.css", "images/logo.png", "index.html", "js/script.js"])
+        file_stat = os.stat(os.path.join(self.test_dir, "index.html"))
+        self.assertEqual(files["index.html"].size, file_stat.st_size)
+        self.assertAlmostEqual(files["index.html"].modified_time, file_stat.st_mtime, places=3)
+        
+        with self.assertRaises(RuntimeError):
+            self.provider._fast_remote_manifest(client, os.path.join(self.test_dir, "missing"))
+    
+    def test_scan_ftp_directory(self):
+        """Test listing a remote FTP tree with MLSD."""
+        listings = {
+            "/public_html": [
+                (".", {"type": "cdir"}),
+                ("index.html", {"type": "file", "size": "42", "modify": "20200913122640"}),
+                ("css", {"type": "dir"})
+            ],
+            "/public_html/css": [
+                ("style.css", {"type": "file", "size": "7", "modify": "20200913122640.123"})
+            ]
+        }
+        ftp = MagicMock()
+        ftp.mlsd.side_effect = lambda path, facts: iter(listings[path])
+        
+        files = self.provider._scan_ftp_directory(ftp, "/public_html/")
+        
+        self.assertEqual(sorted(files), ["css/style.css", "index.html"])
+        self.assertEqual(files["index.html"].size, 42)
+        self.assertEqual(files["css/style.css"].modified_time, 1600000000)
+    
     def test_determine_files_to_upload_full_sync(self):
         """Test _determine_files_to_upload with 'full' sync mode."""
         # Create local files
@@ -269,6 +434,158 @@ class TestSharedHostingProvider(unittest.TestCase):
         self.assertIn("file2.txt", to_upload)     # New file
         self.assertIn("file3.txt", to_upload)     # Modified file
 
+    
+    def test_largest_first(self):
+        """Test that uploads are ordered by descending size."""
+        files = {
+            "small.css": FileInfo("small.css", 10, 0),
+            "large.js": FileInfo("large.js", 5000, 0),
+            "medium.html": FileInfo("medium.html", 300, 0)
+        }
+        
+        self.assertEqual(
+            self.provider._largest_first(files), ["large.js", "medium.html", "small.css"]
+        )
+    
+    def test_remote_directories(self):
+        """Test that all remote directories are listed once, parents first."""
+        directories = self.provider._remote_directories(
+            "/public_html", ["index.html", "a/b/c.js", "a/d.css", "e/f.png"]
+        )
+        
+        self.assertEqual(directories, [
+            "/public_html/a", "/public_html/e", "/public_html/a/b"
+        ])
+        
+        # Directories of files already on the server are not created again
+        directories = self.provider._remote_directories(
+            "/public_html", ["a/b/c.js", "a/d.css", "e/f.png"], ["a/b/old.js"]
+        )
+        self.assertEqual(directories, ["/public_html/e"])
+    
+    @patch('ftplib.FTP')
+    def test_upload_ftp_files(self, mock_ftp):
+        """Test uploading files over parallel FTP connections."""
+        rel_paths = ["index.html", "css/style.css", "js/script.js"]
+        credentials = {"host": "example.com", "username": "user", "password": "pass"}
+        
+        count = self.provider._upload_ftp_files(
+            credentials, 21, self.test_dir, "/public_html", rel_paths, 2
+        )
+        
+        self.assertEqual(count, 3)
+        ftp = mock_ftp.return_value
+        stored = sorted(c[0][0] for c in ftp.storbinary.call_args_list)
+        self.assertEqual(stored, [
+            "STOR /public_html/css/style.css",
+            "STOR /public_html/index.html",
+            "STOR /public_html/js/script.js"
+        ])
+        self.assertLessEqual(ftp.login.call_count, 2)
+        self.assertEqual(ftp.quit.call_count, ftp.login.call_count)
+    
+    def test_open_tuned_socket(self):
+        """Test that transfer sockets are connected with Nagle disabled."""
+        server = socket.socket()
+        server.bind(("127.0.0.1", 0))
+        server.listen(1)
+        try:
+            sock = self.provider._open_tuned_socket("127.0.0.1", server.getsockname()[1])
+            self.assertTrue(sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY))
+            sock.close()
+        finally:
+            server.close()
+    
+    def test_upload_sftp_files(self):
+        """Test uploading files over parallel SFTP channels."""
+        client = MagicMock()
+        channels = []
+        
+        def open_channel():
+            channel = MagicMock(**{"get_channel.return_value.closed": False})
+            channels.append(channel)
+            return channel
+        
+        client.open_sftp.side_effect = open_channel
+        rel_paths = ["index.html", "css/style.css", "js/script.js"]
+        
+        session = _SFTPSession(("example.com", 22, "user", "pass"), client, MagicMock())
+        self.provider._upload_sftp_files(session, self.test_dir, "/public_html", rel_paths, 2)
+        
+        self.assertLessEqual(len(channels), 2)
+        uploaded = sorted(c[0][0] for channel in channels for c in channel.file.call_args_list)
+        self.assertEqual(uploaded, [
+            "/public_html/css/style.css", "/public_html/index.html", "/public_html/js/script.js"
+        ])
+    
+    def test_sftp_put_fast(self):
+        """Test that SFTP uploads are written in pipelined 32 KB chunks."""
+        local_path = os.path.join(self.test_dir, "bundle.js")
+        with open(local_path, "wb") as f:
+            f.write(b"x" * 100000)
+        sftp = MagicMock()
+        remote_file = sftp.file.return_value.__enter__.return_value
+        
+        self.provider._sftp_put_fast(sftp, local_path, "/public_html/bundle.js")
+        
+        sftp.file.assert_called_once_with("/public_html/bundle.js", "wb")
+        remote_file.set_pipelined.assert_called_once_with(True)
+        sizes = [len(c[0][0]) for c in remote_file.write.call_args_list]
+        self.assertEqual(sum(sizes), 100000)
+        self.assertLessEqual(max(sizes), 32 * 1024)
+        
+        # No confirmation round trip after the upload
+        sftp.stat.assert_not_called()
+    
+    def test_bulk_upload_sftp(self):
+        """Test that files are streamed to the server as one tar archive."""
+        received = io.BytesIO()
+        client = MagicMock()
+        stdin, stdout, stderr = MagicMock(), MagicMock(), MagicMock()
+        stdin.write.side_effect = received.write
+        stdout.channel.recv_exit_status.return_value = 0
+        client.exec_command.return_value = (stdin, stdout, stderr)
+        client.get_transport.return_value.local_compression = "none"
+        
+        self.provider._bulk_upload_sftp(
+            client, self.test_dir, "/public html", ["index.html", "css/style.css"]
+        )
+        
+        client.exec_command.assert_called_once_with(
+            "mkdir -p '/public html' && tar -xzf - -C '/public html'"
+        )
+        stdin.channel.shutdown_write.assert_called_once()
+        received.seek(0)
+        with tarfile.open(fileobj=received, mode="r:gz") as archive:
+            self.assertEqual(sorted(archive.getnames()), ["css/style.css", "index.html"])
+            self.assertEqual(
+                archive.extractfile("index.html").read(), b"Content of index.html"
+            )
+        
+        # With a compressed transport the archive is sent without gzip
+        client.get_transport.return_value.local_compression = "zlib@openssh.com"
+        received.seek(0)
+        received.truncate()
+        self.provider._bulk_upload_sftp(client, self.test_dir, "/site", ["index.html"])
+        self.assertEqual(client.exec_command.call_args[0][0], "mkdir -p /site && tar -xf - -C /site")
+        received.seek(0)
+        with tarfile.open(fileobj=received, mode="r:") as archive:
+            self.assertEqual(archive.getnames(), ["index.html"])
+    
+    def test_bulk_upload_sftp_exec_error(self):
+        """Test that the local tar process is stopped if the remote command fails."""
+        client = MagicMock()
+        client.get_transport.return_value.local_compression = "none"
+        client.exec_command.side_effect = RuntimeError("no shell")
+        
+        with patch('subprocess.Popen') as mock_popen:
+            with self.assertRaises(RuntimeError):
+                self.provider._bulk_upload_sftp(client, self.test_dir, "/site", ["index.html"])
+        
+        tar = mock_popen.return_value
+        tar.kill.assert_called_once()
+        tar.stdout.close.assert_called_once()
+        tar.wait.assert_called_once()
 
 # Run tests if executed directly
 if __name__ == '__main__':